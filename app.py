@@ -1,8 +1,6 @@
 from flask import Flask
 from flask_cors import CORS
 
-from sqlalchemy          import create_engine
-from sqlalchemy.pool     import QueuePool
 from sqlalchemy.orm      import sessionmaker
 
 from model          import (
@@ -12,7 +10,8 @@ from model          import (
     ProductDao,
     QnADao,
     ReviewDao,
-    CouponDao
+    CouponDao,
+    reference_cache
 )
 from service        import (
     OrderService,
@@ -21,7 +20,9 @@ from service        import (
     ProductService,
     QnAService,
     ReviewService,
-    CouponService
+    CouponService,
+    ReferenceService,
+    DatabaseService
 )
 from controller     import (
     create_order_endpoints,
@@ -30,9 +31,22 @@ from controller     import (
     create_product_endpoints,
     create_qna_endpoints,
     create_review_endpoints,
-    create_coupon_endpoints
+    create_coupon_endpoints,
+    create_reference_endpoints,
+    create_database_endpoints
 )
 
+from database       import (
+    create_database,
+    create_replica_databases,
+    pool_status,
+    pool_metrics,
+    RequestSession,
+    DB_READ_YOUR_WRITES_SECONDS_DEFAULT
+)
+
+from serializer     import init_json
+
 import utils
 
 def create_app(test_config = None):
@@ -43,15 +57,28 @@ def create_app(test_config = None):
     else:
         app.config.update(test_config)
 
-    # pool size : 1000, max_overflow=100 인 QueuePool로 DB 연결 설정
-    database = create_engine(app.config['DB_URL'], encoding ='utf-8', pool_size = 1000, max_overflow = 100, poolclass = QueuePool)
+    # config 의 DB_POOL_* 설정으로 DB 연결 설정 (database.DB_POOL_DEFAULTS 참고)
+    database = create_database(app.config)
 
-    # database engin와 연동된 session maker 생성, connection 필요시마다 session instance 생성
-    Session = sessionmaker(bind = database)
+    # config 의 DB_REPLICA_URLS 로 읽기 전용 replica 연결 설정. 없으면 빈 리스트
+    replicas = create_replica_databases(app.config)
+
+    # database engin와 연동된 요청 단위 session 생성
+    # 요청 안에서는 Session() 이 같은 session 을 돌려주고, 요청이 끝나면 commit/rollback 후 반납
+    # GET 요청은 replica 로, 쓰기 요청과 쓰기 직후의 GET 요청은 primary 로 연결
+    Session = RequestSession(
+        sessionmaker(bind = database),
+        replicas,
+        app.config.get('DB_READ_YOUR_WRITES_SECONDS', DB_READ_YOUR_WRITES_SECONDS_DEFAULT)
+    )
+    Session.init_app(app)
 
     # CORS 설정
     CORS(app, resources={r'*': {'origins': '*'}})
 
+    # json_response encode 방식 설정 : config 의 JSON_BACKEND 로 orjson/json 선택
+    init_json(app)
+
     # Persistence layer
     order_dao = OrderDao()
     user_dao = UserDao()
@@ -69,6 +96,8 @@ def create_app(test_config = None):
     qna_service = QnAService(qna_dao)
     review_service = ReviewService(review_dao)
     coupon_service = CouponService(coupon_dao)
+    reference_service = ReferenceService(reference_cache)
+    database_service = DatabaseService(database, replicas, app.config, pool_status, pool_metrics)
 
     # Presentation layer
     app.register_blueprint(create_order_endpoints(order_service, Session))
@@ -78,5 +107,7 @@ def create_app(test_config = None):
     app.register_blueprint(create_qna_endpoints(qna_service, Session))
     app.register_blueprint(create_review_endpoints(review_service, Session))
     app.register_blueprint(create_coupon_endpoints(coupon_service, Session))
+    app.register_blueprint(create_reference_endpoints(reference_service, Session))
+    app.register_blueprint(create_database_endpoints(database_service, Session))
 
     return app
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+자동 구매확정 실행 스크립트
+    배송완료 후 3일이 지난 주문을 --batch-size 개씩 구매확정 처리하고 batch 마다 commit 합니다.
+    batch 가 끝날 때마다 처리 건수를 출력하여 cron 등 스케쥴러의 로그로 진행 상황을 확인할 수 있습니다.
+    MySQL 이벤트(database_scheduler/event_scheduler.sql) 대신 앱 서버에서 스케쥴링할 때 사용합니다.
+
+    python auto_order_confirm.py
+    python auto_order_confirm.py --batch-size 500 --days 7
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+"""
+import sys
+import time
+import argparse
+import traceback
+
+from sqlalchemy     import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import config
+
+from model                 import OrderDao
+from service               import OrderService
+from service.order_service import AUTO_CONFIRM_BATCH_SIZE, AUTO_CONFIRM_DAYS
+
+def run(batch_size, confirm_days):
+    database = create_engine(config.DB_URL, encoding = 'utf-8', pool_size = 1)
+    Session = sessionmaker(bind = database)
+
+    order_service = OrderService(OrderDao())
+
+    started_at = time.time()
+    batch_number = 0
+    total_count = 0
+
+    while True:
+        session = Session()
+        try:
+            # 한 batch 씩 commit 하여 lock 을 오래 잡지 않는다.
+            confirmed_count = order_service.auto_confirm_orders(session, batch_size, confirm_days)
+            session.commit()
+
+        except Exception:
+            session.rollback()
+            traceback.print_exc()
+            return 1
+
+        finally:
+            session.close()
+
+        if not confirmed_count:
+            break
+
+        batch_number += 1
+        total_count += confirmed_count
+        print(f'batch {batch_number} : {confirmed_count} 건 구매확정 (누적 {total_count} 건, {time.time() - started_at:.1f}초)', flush = True)
+
+    print(f'자동 구매확정 완료 : {total_count} 건, {time.time() - started_at:.1f}초', flush = True)
+    return 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = '자동 구매확정 실행')
+    parser.add_argument('--batch-size', type = int, default = AUTO_CONFIRM_BATCH_SIZE, help = '한번에 처리할 주문 수')
+    parser.add_argument('--days', type = int, default = AUTO_CONFIRM_DAYS, help = '배송완료 후 구매확정까지 걸리는 기간(일)')
+    args = parser.parse_args()
+
+    sys.exit(run(args.batch_size, args.days))
@@ -0,0 +1,84 @@
+"""
+동시 요청 처리량 benchmark
+    실행 중인 서버에 --concurrency 개의 client 가 --duration 초 동안 같은 GET 요청을 반복하여
+    초당 처리량(req/s)과 응답시간 분포를 출력합니다.
+    같은 부하로 gunicorn sync worker 와 gevent worker 를 각각 실행하여 비교합니다.
+
+    GUNICORN_WORKER_CLASS=sync   gunicorn -c gunicorn.conf.py "app:create_app()"
+    python benchmark/concurrency_benchmark.py --url http://localhost:5000/api/order/filter?orderStatus=1&filterOrder=NEW&filterLimit=50 --token <access_token>
+
+    GUNICORN_WORKER_CLASS=gevent gunicorn -c gunicorn.conf.py "app:create_app()"
+    python benchmark/concurrency_benchmark.py --url ... --token <access_token>
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+"""
+import time
+import argparse
+import threading
+
+import requests
+
+def run_client(url, headers, deadline, latencies, errors, lock):
+    session = requests.Session()
+
+    while time.monotonic() < deadline:
+        started_at = time.monotonic()
+        try:
+            response = session.get(url, headers = headers, timeout = 60)
+            ok = response.status_code < 500
+        except requests.RequestException:
+            ok = False
+        elapsed = time.monotonic() - started_at
+
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors.append(elapsed)
+
+def percentile(values, ratio):
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+def run(url, token, concurrency, duration):
+    headers = {'Authorization': token} if token else {}
+    latencies, errors = [], []
+    lock = threading.Lock()
+
+    started_at = time.monotonic()
+    deadline = started_at + duration
+
+    clients = [
+        threading.Thread(target = run_client, args = (url, headers, deadline, latencies, errors, lock))
+        for _ in range(concurrency)
+    ]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+
+    elapsed = time.monotonic() - started_at
+    latencies.sort()
+
+    print(f'url         : {url}')
+    print(f'concurrency : {concurrency}')
+    print(f'requests    : {len(latencies)} 성공, {len(errors)} 실패 ({elapsed:.1f}초)')
+    print(f'throughput  : {len(latencies) / elapsed:.1f} req/s')
+    print(f'latency     : p50 {percentile(latencies, 0.5) * 1000:.0f}ms, '
+          f'p95 {percentile(latencies, 0.95) * 1000:.0f}ms, '
+          f'p99 {percentile(latencies, 0.99) * 1000:.0f}ms')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = '동시 요청 처리량 benchmark')
+    parser.add_argument('--url', required = True, help = '요청할 GET url')
+    parser.add_argument('--token', default = None, help = 'Authorization 헤더에 담을 access token')
+    parser.add_argument('--concurrency', type = int, default = 200, help = '동시 client 수')
+    parser.add_argument('--duration', type = int, default = 30, help = '측정 시간(초)')
+    args = parser.parse_args()
+
+    run(args.url, args.token, args.concurrency, args.duration)
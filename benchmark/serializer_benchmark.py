@@ -0,0 +1,128 @@
+"""
+주문 목록 응답 직렬화 benchmark
+    주문 목록 조회와 같은 22개 컬럼의 row 를 sqlite 메모리 DB 에 넣고 --rows 개씩 조회한 SQLAlchemy row 로
+    기존 방식과 serializer 방식의 응답 body 생성 시간을 --iterations 번 반복하여 비교합니다.
+
+    - 기존 방식     : dict(row) 복사 -> 날짜 컬럼마다 strftime, option_info 추가 -> jsonify
+    - serializer 방식 : ORDER_LIST_SERIALIZER(row) -> json_response
+
+    python benchmark/serializer_benchmark.py --rows 100 --iterations 2000
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+"""
+import os
+import sys
+import time
+import datetime
+import argparse
+
+from flask      import Flask, jsonify
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, DateTime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from serializer            import json_response
+from service.order_service import ORDER_LIST_SERIALIZER
+
+ORDER_DATE_KEYS = (
+    'payment_date',
+    'shipping_start_date',
+    'shipping_complete_date',
+    'refund_request_date',
+    'refund_complete_date',
+    'complete_cancellation_date'
+)
+
+def create_order_rows(rows_count):
+    # 주문 목록 조회 결과와 같은 컬럼의 테이블을 만들고 row 를 조회한다.
+    engine = create_engine('sqlite://')
+    metadata = MetaData()
+    orders = Table(
+        'orders', metadata,
+        *[Column(key, DateTime) for key in ORDER_DATE_KEYS],
+        Column('order_id', Integer),
+        Column('order_detail_id', String(50)),
+        Column('order_item_id', Integer, primary_key = True),
+        Column('seller_name', String(50)),
+        Column('product_name', String(100)),
+        Column('option_color', String(20)),
+        Column('option_size', String(20)),
+        Column('option_additional_price', Integer),
+        Column('units', Integer),
+        Column('orderer_name', String(50)),
+        Column('orderer_phone', String(20)),
+        Column('total_payment', Integer),
+        Column('discount_price', Integer),
+        Column('refund_reason_id', Integer),
+        Column('cancel_reason_id', Integer),
+        Column('refund_amount', Integer)
+    )
+    metadata.create_all(engine)
+
+    payment_date = datetime.datetime(2020, 10, 1, 12, 30, 15)
+    engine.execute(orders.insert(), [{
+        'payment_date'            : payment_date + datetime.timedelta(minutes = index),
+        'shipping_start_date'     : payment_date + datetime.timedelta(days = 1),
+        'shipping_complete_date'  : payment_date + datetime.timedelta(days = 2),
+        'order_id'                : index,
+        'order_detail_id'         : f'20201001{index:08d}',
+        'order_item_id'           : index + 1,
+        'seller_name'             : '브랜디',
+        'product_name'            : f'오버핏 맨투맨 {index}',
+        'option_color'            : 'black',
+        'option_size'             : 'L',
+        'option_additional_price' : 0,
+        'units'                   : 1,
+        'orderer_name'            : '홍길동',
+        'orderer_phone'           : '01012345678',
+        'total_payment'           : 39000,
+        'discount_price'          : 1000,
+        'refund_amount'           : 0
+    } for index in range(rows_count)])
+
+    return engine.execute(orders.select()).fetchall()
+
+def legacy_body(rows):
+    # 변경 전 select_list_with_count + OrderService.get_order_list + jsonify
+    order_list = [dict(row) for row in rows]
+
+    for dict_order in order_list:
+        dict_order['option_info'] = f"{dict_order['option_color']} / {dict_order['option_size']}"
+        for key in ORDER_DATE_KEYS:
+            if dict_order.get(key, None):
+                dict_order[key] = dict_order[key].strftime('%Y-%m-%d %H:%M:%S')
+
+    return jsonify({'orders': order_list, 'total_order_number': len(rows)}).get_data()
+
+def serializer_body(rows):
+    order_list = [ORDER_LIST_SERIALIZER(row) for row in rows]
+
+    return json_response({'orders': order_list, 'total_order_number': len(rows)}).get_data()
+
+def measure(name, build_body, rows, iterations):
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        body = build_body(rows)
+    elapsed = time.perf_counter() - started_at
+
+    print(f'{name:<12} : {elapsed / iterations * 1000:7.3f}ms / page, body {len(body):>7} bytes')
+    return elapsed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = '주문 목록 응답 직렬화 benchmark')
+    parser.add_argument('--rows', type = int, default = 100, help = '한 페이지의 주문 수')
+    parser.add_argument('--iterations', type = int, default = 2000, help = '반복 횟수')
+    args = parser.parse_args()
+
+    rows = create_order_rows(args.rows)
+
+    # jsonify 는 app context 가 필요하다.
+    with Flask(__name__).app_context():
+        legacy = measure('legacy', legacy_body, rows, args.iterations)
+        serialized = measure('serializer', serializer_body, rows, args.iterations)
+
+    print(f'speedup      : {legacy / serialized:.2f}x')
@@ -5,6 +5,8 @@ from .product_controller import create_product_endpoints
 from .qna_controller import create_qna_endpoints
 from .review_controller import create_review_endpoints
 from .coupon_controller import create_coupon_endpoints
+from .reference_controller import create_reference_endpoints
+from .database_controller import create_database_endpoints
 
 __all__ = [
     'create_order_endpoints',
@@ -13,5 +15,7 @@ __all__ = [
     'create_product_endpoints',
     'create_qna_endpoints',
     'create_review_endpoints',
-    'create_coupon_endpoints'
+    'create_coupon_endpoints',
+    'create_reference_endpoints',
+    'create_database_endpoints'
 ]
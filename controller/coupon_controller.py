@@ -11,6 +11,8 @@ from flask_request_validator import (
     validate_params
 )
 
+from serializer import json_response
+
 def create_coupon_endpoints(coupon_service, Session):
     coupon_app = Blueprint('coupon_app', __name__, url_prefix='/api/coupon')
 
@@ -43,6 +45,7 @@ def create_coupon_endpoints(coupon_service, Session):
 
         History:
             2020-10-06 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 응답 body 를 json_response 로 생성, Accept-Encoding 에 따라 압축
         """
         # 세션 인스턴스 생성 : connection open, transaction begin
         session = Session()
@@ -75,17 +78,13 @@ def create_coupon_endpoints(coupon_service, Session):
                 'coupons': coupon_list
             }
 
-            return jsonify(response), 200
+            return json_response(response, compress = True), 200
 
         except Exception as e:
             # global error handling
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     # 쿠폰상세정보
     @coupon_app.route('/detail/<int:coupon_id>', methods=['GET'], endpoint='get_coupon_detail')
     @validate_params(
@@ -126,10 +125,6 @@ def create_coupon_endpoints(coupon_service, Session):
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     # 쿠폰등록
 
     @coupon_app.route('', methods=['POST'], endpoint='insert_coupon')
@@ -209,10 +204,6 @@ def create_coupon_endpoints(coupon_service, Session):
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     # 쿠폰정보수정
     @coupon_app.route('', methods=['PUT'], endpoint='update_coupon')
     @validate_params(
@@ -264,8 +255,4 @@ def create_coupon_endpoints(coupon_service, Session):
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     return coupon_app
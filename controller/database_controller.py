@@ -0,0 +1,47 @@
+import os
+
+from flask import (
+    Blueprint,
+    jsonify,
+    g
+)
+
+from utils import login_required
+
+# database API
+
+
+def create_database_endpoints(database_service, Session):
+    database_app = Blueprint('database_app', __name__, url_prefix='/api/database')
+
+    @database_app.route('/pool', methods=['GET'], endpoint='get_pool_status')
+    @login_required(Session)
+    def get_pool_status():
+        """
+        connection pool 상태 조회 엔드포인트
+            관리자만 호출할 수 있으며, 요청을 받은 worker process 의 pool 상태를 전달합니다.
+
+        returns :
+            200: worker pid 와 pool 상태
+            403: 관리자가 아닌 경우
+            500: Exception
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        if not g.seller_info['is_admin']:
+            return jsonify({'message': 'NO_PERMISSION'}), 403
+
+        try:
+            pool_status = database_service.get_pool_status()
+
+            return jsonify({'pid': os.getpid(), 'pool': pool_status}), 200
+
+        except Exception as e:
+            return jsonify({'ERROR_MSG': f'{e}'}), 500
+
+    return database_app
@@ -3,16 +3,22 @@ import math
 from flask import (
     Blueprint,
     request,
-    jsonify
+    jsonify,
+    Response,
+    stream_with_context
 )
 from flask_request_validator import (
     GET,
     PATH,
     Param,
     JSON,
+    Enum,
     validate_params
 )
 
+from serializer import json_response
+from utils      import decode_cursor, login_required, make_etag, not_modified_response
+
 # order API
 
 
@@ -33,6 +39,8 @@ def create_order_endpoints(order_service, Session):
         Param('filterCancelReason',     GET, int, required=False),  # 주문취소사유
         Param('page',                   GET, int, required=False),  # 페이지네이션
         Param('mdSeNo',                 GET, list,required=False),  # 셀러속성
+        Param('cursor',                 GET, str, required=False),  # 커서 기반 페이지네이션
+        Param('skipCount',              GET, int, required=False),  # 1 : 전체 주문 갯수 조회 생략
     )
     def get_order_list(*args, **kwargs):
         
@@ -56,13 +64,21 @@ def create_order_endpoints(order_service, Session):
             2020-09-24 (이용민) : 결제완료/상품준비중/배송중/배송완료상태 엔드포인트 통합
             2020-09-28 (이용민) : 결제완료/상품준비중/배송중/배송완료환불요청/환불완료/주문취소완료 엔드포인트 통합
             2020-10-07 (이용민) : 페이지네이션 로직 변경
+            2026-10-18 (이용민) : 커서 기반 페이지네이션 추가, 커서가 전달되면 page 대신 커서 다음부터 조회
+            2026-10-18 (이용민) : skipCount 추가, 갯수를 구하지 않은 경우 total_order_number, page_number 는 null
+            2026-10-18 (이용민) : 응답 body 를 json_response 로 생성, Accept-Encoding 에 따라 압축
         """
 
         # 세션 인스턴스 생성 : connection open, transaction begin
         
         session = Session()
         try:
-            
+            # 커서 복원 : [정렬값, 주문상세 id]
+            try:
+                cursor = decode_cursor(args[12]) if args[12] else None
+            except ValueError as e:
+                return jsonify({'ERROR_MSG': f'{e}'}), 400
+
             select_condition = {
                 'orderStatus'           : args[0],  # 주문상태
                 'selectFilter'          : None if args[1] == '' else args[1], # 검색 키워드 주제
@@ -75,28 +91,93 @@ def create_order_endpoints(order_service, Session):
                 'filterRefndReason'     : args[8],  # 주문환불이유
                 'filterCancelReason'    : args[9],  # 주문취소이유
                 'page'                  : args[10], # 페이지네이션
-                'mdSeNo'                : args[11]  # 셀러속성
+                'mdSeNo'                : args[11], # 셀러속성
+                'cursor'                : cursor,   # 커서 기반 페이지네이션
+                'skipCount'             : args[13]  # 전체 주문 갯수 조회 생략
             }
 
             # 비즈니스 로직 호출
-            total_order_number, result_order_list = order_service.get_order_list(select_condition, session)
+            total_order_number, result_order_list, next_cursor = order_service.get_order_list(select_condition, session)
       
+            # 갯수를 구하지 않은 경우 전체 페이지 수도 알 수 없음
+            page_number = None
+            if total_order_number is not None and select_condition['filterLimit']:
+                page_number = math.ceil(total_order_number/select_condition['filterLimit'])
+
             response = {
                 # 페이지네이션 구현
                 'orders': result_order_list,
                 'total_order_number' : total_order_number,
-                'page_number' : math.ceil(total_order_number/select_condition['filterLimit'])
+                'page_number' : page_number,
+                'next_cursor' : next_cursor
             }
 
-            return jsonify(response), 200
+            return json_response(response, compress = True), 200
 
         except Exception as e:
             # global error handling
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
+    @order_app.route('/export', methods=['GET'], endpoint='export_order_list')
+    @login_required(Session)
+    @validate_params(
+        Param('orderStatus',            GET, int, required=True),   # 주문상태
+        Param('selectFilter',           GET, str, required=False),  # 검색 키워드 주제
+        Param('filterKeyword',          GET, str, required=False),  # 검색 키워드
+        Param('filterOrder',            GET, str, required=True),   # 정렬기준 : 주문일순 or 주문일역순
+        Param('filterDateFrom',         GET, str, required=False),  # 주문시간 구간조건
+        Param('filterDateTo',           GET, str, required=False),  # 주문시간 구간조건
+        Param('filterDeliveryNumber',   GET, int, required=False),  # 운송장번호
+        Param('filterRefndReason',      GET, int, required=False),  # 환불사유
+        Param('filterCancelReason',     GET, int, required=False),  # 주문취소사유
+        Param('mdSeNo',                 GET, list,required=False),  # 셀러속성
+        Param('format',                 GET, str, rules=[Enum('csv', 'ndjson')], required=False),  # 파일 형식
+    )
+    def export_order_list(*args, **kwargs):
+        """
+        주문 목록 다운로드 엔드포인트
+            주문관리 엔드포인트와 같은 검색 조건에 해당하는 모든 주문을 CSV 또는 NDJSON 파일로 내려주는 엔드포인트 입니다.
+            주문자 이름과 연락처가 포함되므로 로그인한 셀러만 다운로드할 수 있습니다.
+            페이지 단위로 나누어 조회한 주문을 한 줄씩 응답으로 흘려보냅니다.
+
+        args :
+            validate_params() 유효성 검사를 통과한 쿼리파라미터
+
+        returns :
+            200: 주문 목록 파일 (csv : text/csv, ndjson : application/x-ndjson)
+            401: 로그인 하지 않은 요청
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        select_condition = {
+            'orderStatus'           : args[0],  # 주문상태
+            'selectFilter'          : None if args[1] == '' else args[1], # 검색 키워드 주제
+            'filterKeyword'         : None if args[2] == '' else args[2], # 검색 키워드
+            'filterOrder'           : None if args[3] == '' else args[3], # 정렬기준 : 주문일순 or 주문일역순
+            'filterDateFrom'        : None if args[4] == '' else args[4], # 주문시간 구간조건
+            'filterDateTo'          : None if args[5] == '' else args[5], # 주문시간 구간조건
+            'filterDeliveryNumber'  : args[6],  # 운송장번호
+            'filterRefndReason'     : args[7],  # 주문환불이유
+            'filterCancelReason'    : args[8],  # 주문취소이유
+            'mdSeNo'                : args[9]   # 셀러속성
+        }
+        export_format = args[10] if args[10] else 'csv'
+
+        # 요청 단위 세션 : stream_with_context 로 파일 전송이 끝날 때까지 유지되고 teardown 에서 반납
+        session = Session()
+
+        # 주문 목록 다운로드 비즈니스 로직 호출
+        export_rows = order_service.export_order_list(select_condition, export_format, session)
+
+        mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+        headers = {'Content-Disposition': f'attachment; filename=orders.{export_format}'}
+
+        return Response(stream_with_context(export_rows), mimetype=mimetype, headers=headers)
 
     @order_app.route('/detail/<string:order_item_id>', methods=['GET'], endpoint='get_order_detail_info')
     @validate_params(
@@ -114,18 +195,29 @@ def create_order_endpoints(order_service, Session):
 
         returns :
             200: 주문상세정보
+            304: If-None-Match 의 ETag 와 현재 주문상세정보 version 이 같은 경우
 
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-09-28 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문상세정보 version 으로 ETag 생성, 변경되지 않았으면 상세 조회 없이 304 반환
         """
         # 세션 인스턴스 생성 : connection open, transaction begin
         session = Session()
         try:
             # validation check된 주문상세번호
             order_item_id = args[0]
+
+            # 주문상세정보 version 으로 ETag 생성
+            version = order_service.get_order_detail_version(order_item_id, session)
+            etag = make_etag('order_detail', order_item_id, version) if version else None
+
+            if etag:
+                not_modified = not_modified_response(etag)
+                if not_modified:
+                    return not_modified
             
             # 주문상세정보 조회 비즈니스로직 호출
             order_detail_info, order_history = order_service.get_order_detail_info(order_item_id, session)
@@ -136,17 +228,17 @@ def create_order_endpoints(order_service, Session):
                 'history': order_history
             }
 
-            return jsonify(response), 200
+            response = jsonify(response)
+            if etag:
+                response.set_etag(etag)
+
+            return response, 200
                 
         except Exception as e:
             # global error handling
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
 
     @order_app.route('/updateOrderDetail', methods=['PUT'], endpoint='update_order_detail_info')
     @validate_params(
@@ -209,9 +301,6 @@ def create_order_endpoints(order_service, Session):
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
     
     # 주문상태변경
     @order_app.route('/changeOrderStatus', methods=['POST'], endpoint='change_order_status')
@@ -230,7 +319,7 @@ def create_order_endpoints(order_service, Session):
             validate_params() 유효성 검사를 통과한 주문취소정보
 
         returns :
-            200: 주문상태변경 성공메세지
+            200: 주문상태변경 성공메세지, 주문별 처리결과
 
         Authors:
             eymin1259@gmail.com 이용민
@@ -256,21 +345,17 @@ def create_order_endpoints(order_service, Session):
             
 
             # 주문상태변경 비즈니스 로직 호출
-            order_service.change_order_status(next_status_order_list, session)
+            results = order_service.change_order_status(next_status_order_list, session)
 
             session.commit()
 
-            return jsonify({'MESSAGE': 'CHANGE_ORDER_STATUS_SUCCESS' }), 200
+            return jsonify({'MESSAGE': 'CHANGE_ORDER_STATUS_SUCCESS', 'results': results }), 200
 
         except Exception as e:
             # global error handling
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     # 주문취소처리
     @order_app.route('/cancelOrder', methods=['POST'], endpoint='cancel_order')
     @validate_params(
@@ -287,7 +372,7 @@ def create_order_endpoints(order_service, Session):
             validate_params() 유효성 검사를 통과한 주문취소정보
 
         returns :
-            200: 주문취소처리 성공메세지
+            200: 주문취소처리 성공메세지, 주문별 처리결과
 
         Authors:
             eymin1259@gmail.com 이용민
@@ -317,21 +402,17 @@ def create_order_endpoints(order_service, Session):
                 })
 
             # 주문취소처리 비즈니스 로직 호출
-            order_service.cancel_order(cancel_order_list, session)
+            results = order_service.cancel_order(cancel_order_list, session)
 
             session.commit()
 
-            return jsonify({'MESSAGE': 'CANCEL_ORDER_SUCCESS' }), 200
+            return jsonify({'MESSAGE': 'CANCEL_ORDER_SUCCESS', 'results': results }), 200
 
         except Exception as e:
             # global error handling
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     # 배송중, 배송완료 -> 환불요청
     @order_app.route('/refundRequest', methods=['POST'], endpoint='refund_request')
     @validate_params(
@@ -351,7 +432,7 @@ def create_order_endpoints(order_service, Session):
             validate_params() 유효성 검사를 통과한 주문취소정보
 
         returns :
-            200: 환불요청 성공메세지
+            200: 환불요청 성공메세지, 주문별 처리결과
 
         Authors:
             eymin1259@gmail.com 이용민
@@ -382,21 +463,17 @@ def create_order_endpoints(order_service, Session):
                 })
 
             # 환불요청처리 비즈니스 로직 호출
-            order_service.refund_request_order(refund_request_list, session)
+            results = order_service.refund_request_order(refund_request_list, session)
 
             session.commit()
 
-            return jsonify({'MESSAGE': 'REFUND_REQUEST_SUCCESS' }), 200
+            return jsonify({'MESSAGE': 'REFUND_REQUEST_SUCCESS', 'results': results }), 200
 
         except Exception as e:
             # global error handling
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     # 환불요청 -> 환불완료 : 최종환불
     @order_app.route('/refundComplete', methods=['POST'], endpoint='refund_complete')
     @validate_params(
@@ -413,7 +490,7 @@ def create_order_endpoints(order_service, Session):
             validate_params() 유효성 검사를 통과한 주문취소정보
 
         returns :
-            200: 환불완료 성공메세지
+            200: 환불완료 성공메세지, 주문별 처리결과
 
         Authors:
             eymin1259@gmail.com 이용민
@@ -441,21 +518,17 @@ def create_order_endpoints(order_service, Session):
                 })
 
             # 환불요청처리 비즈니스 로직 호출
-            order_service.refund_complete_order(refund_complete_list, session)
+            results = order_service.refund_complete_order(refund_complete_list, session)
 
             session.commit()
 
-            return jsonify({'MESSAGE': 'REFUND_REQUEST_COMPLETE_SUCCESS' }), 200
+            return jsonify({'MESSAGE': 'REFUND_REQUEST_COMPLETE_SUCCESS', 'results': results }), 200
 
         except Exception as e:
             # global error handling
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     # 환불요청취소
     @order_app.route('/cancelRefundRequest', methods=['POST'], endpoint='cancel_refund_request')
     @validate_params(
@@ -473,7 +546,7 @@ def create_order_endpoints(order_service, Session):
             validate_params() 유효성 검사를 통과한 환불요청취소정보
 
         returns :
-            200: 환불요청취소 성공메세지
+            200: 환불요청취소 성공메세지, 주문별 처리결과
 
         Authors:
             eymin1259@gmail.com 이용민
@@ -499,20 +572,16 @@ def create_order_endpoints(order_service, Session):
             
 
             # 환불요청취소 비즈니스 로직 호출
-            order_service.cancel_refund_request(restore_order_list, session)
+            results = order_service.cancel_refund_request(restore_order_list, session)
 
             session.commit()
 
-            return jsonify({'MESSAGE': 'CANCEL_REFUND_REQUEST_SUCCESS' }), 200
+            return jsonify({'MESSAGE': 'CANCEL_REFUND_REQUEST_SUCCESS', 'results': results }), 200
             
         except Exception as e:
             # global error handling
             session.rollback()
             return jsonify({'ERROR_MSG': f'{e}'}), 500
 
-        finally:
-            # session close, transaction 종료
-            session.close()
-
     
     return order_app
@@ -1,9 +1,9 @@
-import re
+import math
 import uuid
 import traceback
 
 from sqlalchemy import exc
-from flask import jsonify, Blueprint, request, g
+from flask import jsonify, Blueprint, request, g, Response, stream_with_context
 from flask_request_validator import (
     GET,
     Param,
@@ -12,7 +12,14 @@ from flask_request_validator import (
     validate_params
 )
 
-from utils import login_required, delete_image_in_s3
+from utils import (
+    login_required,
+    delete_image_in_s3,
+    make_etag,
+    not_modified_response,
+    validate_product_info,
+    read_import_rows
+)
 
 def create_product_endpoints(product_service, Session):
 
@@ -31,7 +38,8 @@ def create_product_endpoints(product_service, Session):
         Param('filterKeyword', GET, required=False),
         Param('mdName', GET, required=False),
         Param('filterDateFrom', GET, str, rules=[Pattern(r"^\d\d\d\d-\d{1,2}-\d{1,2}$")], required=False),
-        Param('filterDateTo', GET, str, rules=[Pattern(r"^\d\d\d\d-\d{1,2}-\d{1,2}$")], required=False)
+        Param('filterDateTo', GET, str, rules=[Pattern(r"^\d\d\d\d-\d{1,2}-\d{1,2}$")], required=False),
+        Param('skipCount', GET, int, rules=[Enum(0, 1)], required=False)
     )
     def products(*args):
         """ 상품 정보 리스트 전달 API
@@ -51,6 +59,7 @@ def create_product_endpoints(product_service, Session):
                 mdName: 셀러 이름 검색을 위한 파라미터
                 filterDateFrom: 조회 기간 시작
                 filterDateTo: 조회 기간 끝
+                skipCount: 1 이면 조회 결과 개수를 구하지 않음
 
         returns :
             200: 상품 리스트
@@ -61,6 +70,7 @@ def create_product_endpoints(product_service, Session):
 
         History:
             2020-10-01 (고지원): 초기 생성
+            2026-10-18 (고지원): 상품 리스트와 개수를 한 번에 조회, skipCount 추가
         """
         try:
             session = Session()
@@ -99,16 +109,21 @@ def create_product_endpoints(product_service, Session):
             # 조회 기간 끝
             filter_dict['filterDateTo'] = args[10]
 
-            # 상품 정보
-            products = product_service.get_products(filter_dict, session)
+            # 조회 결과 개수 생략 여부
+            filter_dict['skipCount'] = args[11]
+
+            # 상품 정보, 상품 쿼리 결과 count
+            products, count = product_service.get_products(filter_dict, session)
 
-            # 상품 쿼리 결과 count
-            count_info = product_service.get_product_count(filter_dict, session)
+            # 마지막 페이지 번호. 개수를 구하지 않은 경우 None
+            page_number = None
+            if count is not None:
+                page_number = math.ceil(count / filter_dict['filterLimit'])
 
             body = {
-                'orders'             : [dict(product) for product in products],
-                'page_number'        : count_info.p_count,
-                'total_order_number' : round(count_info.p_count / filter_dict['filterLimit'])
+                'orders'             : products,
+                'page_number'        : page_number,
+                'total_order_number' : count
             }
 
             return jsonify(body), 200
@@ -120,9 +135,6 @@ def create_product_endpoints(product_service, Session):
             traceback.print_exc()
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @product_app.route('/<int:product_id>', methods=['GET'], endpoint='product')
     @login_required(Session)
     def product(product_id):
@@ -135,6 +147,7 @@ def create_product_endpoints(product_service, Session):
 
         returns :
             200: 상품 정보
+            304: If-None-Match 의 ETag 와 현재 상품 정보 version 이 같은 경우
             500: Exception
 
         Authors:
@@ -142,13 +155,32 @@ def create_product_endpoints(product_service, Session):
 
         History:
             2020-10-01 (고지원): 초기 생성
+            2026-10-18 (고지원): 현재 상품 정보 version 으로 ETag 생성, 변경되지 않았으면 상세 조회 없이 304 반환
+            2026-10-18 (고지원): 상품 정보 id 단위 상세 데이터 캐시 사용
         """
         session = Session()
         try:
-            # 상품 데이터
-            body = dict(product_service.get_product(product_id, session))
+            # 상품 정보 version 으로 ETag 생성
+            version = product_service.get_product_version(product_id, session)
+            etag = make_etag('product', product_id, version) if version else None
 
-            return jsonify(body), 200
+            if etag:
+                not_modified = not_modified_response(etag)
+                if not_modified:
+                    return not_modified
+
+            # 상품 데이터 : 현재 상품 정보 id 로 캐시에서 먼저 찾는다.
+            product = product_service.get_product(product_id, session, version[0] if version else None)
+            if product is None:
+                return jsonify({'message': 'THERE_IS_NO_PRODUCT_DATA'}), 400
+
+            body = dict(product)
+
+            response = jsonify(body)
+            if etag:
+                response.set_etag(etag)
+
+            return response, 200
 
         except exc.ProgrammingError:
             return jsonify({'message': 'ERROR_IN_SQL_SYNTAX'}), 500
@@ -159,9 +191,6 @@ def create_product_endpoints(product_service, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @product_app.route('/history', methods=['GET'], endpoint='product_history')
     @login_required(Session)
     def product_history():
@@ -195,9 +224,6 @@ def create_product_endpoints(product_service, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @product_app.route('/excel', methods=['GET'], endpoint='make_excel')
     @login_required(Session)
     @validate_params(
@@ -206,13 +232,14 @@ def create_product_endpoints(product_service, Session):
     def make_excel(*args):
         """ 상품 정보 엑셀 다운로드 API
 
-        전체 상품 또는 선택 상품의 정보를 excel 파일로 다운로드 합니다.
+        전체 상품 또는 선택 상품의 정보를 엑셀에서 열 수 있는 CSV 파일로 다운로드 합니다.
+        조회 결과를 한 줄씩 응답으로 흘려보내므로 상품 수와 관계없이 메모리 사용량이 일정합니다.
 
         args:
             product_id : 상품의 id 리스트
 
         returns :
-            200: Excel 파일 다운
+            200: CSV 파일 다운
             500: Exception
 
         Authors:
@@ -220,27 +247,24 @@ def create_product_endpoints(product_service, Session):
 
         History:
             2020-10-02 (고지원): 초기 생성
+            2026-10-18 (고지원): 서버에 파일을 저장하지 않고 CSV 를 streaming 응답으로 전달
         """
         session = Session()
         try:
             # 선택한 상품들의 id를 list 로 받는다.
             id_list = args[0]
 
-            # service 의 make_excel 함수를 호출한다.
-            product_service.make_excel(id_list, session)
-
-            return jsonify({'message': 'SUCCESS'}), 200
-
-        except exc.ProgrammingError:
-            traceback.print_exc()
-            return jsonify({'message': 'ERROR_IN_SQL_SYNTAX'}), 500
+            # service 의 export_products 함수를 호출한다.
+            csv_rows = product_service.export_products(id_list, session)
 
         except Exception as e:
             traceback.print_exc()
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
+        # 요청 단위 session 은 응답을 모두 보낸 뒤 teardown 에서 닫힌다.
+        headers = {'Content-Disposition': 'attachment; filename=products.csv'}
+
+        return Response(stream_with_context(csv_rows), mimetype='text/csv', headers=headers)
 
     @product_app.route('/seller', methods=['GET'], endpoint='sellers')
     @login_required(Session)
@@ -282,9 +306,6 @@ def create_product_endpoints(product_service, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @product_app.route('/category', methods=['GET'], endpoint='product_categories')
     @login_required(Session)
     def product_categories():
@@ -329,9 +350,6 @@ def create_product_endpoints(product_service, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @product_app.route('', methods=['POST'], endpoint='insert_product')
     @login_required(Session)
     def insert_product():
@@ -359,31 +377,16 @@ def create_product_endpoints(product_service, Session):
             2020-10-04 (고지원): 상품 정보 입력 시 제한 사항 에러 추가
             2020-10-10 (고지원): 여러 개의 이미지를 업로드 할 수 있도록 수정
             2020-10-12 (고지원): 에러 발생 시 세션 rollback 과 함께 s3 에 업로드 된 이미지도 삭제되도록 수정
+            2026-10-18 (고지원): 제한 사항 확인을 상품 일괄 등록과 같은 validate_product_info 로 변경
         """
         session = Session()
         image_urls = ''
         is_success = False
         try:
-            # 상품명에 ' 또는 " 포함 되었는지 체크
-            pattern = re.compile('[\"\']')
-            if pattern.search(request.form['name']):
-                return jsonify({'message': 'NAME_CANNOT_CONTAIN_QUOTATION_MARK'}), 400
-
-            # 할인 시작일이 할인 종료일보다 빠를 경우
-            if request.form['discount_start_date'] > request.form['discount_end_date']:
-                return jsonify({'message': 'START_DATE_CANNOT_BE_EARLIER_THAN_END_DATE'}), 400
-
-            # 최소 수량 또는 최대 수량이 20을 초과할 경우
-            if int(request.form['min_unit']) > 20 or int(request.form['max_unit']) > 20:
-                return jsonify({'message': 'CANNOT_SET_MORE_THAN_20'}), 400
-
-            # 판매가가 10원 미만일 경우
-            if int(request.form['price']) < 10:
-                return jsonify({'message': 'CANNOT_SET_LESS_THAN_10'}), 400
-
-            # 할인률이 0 ~ 99% 가 아닐 경우
-            if int(request.form['discount_rate']) not in range(0, 99):
-                return jsonify({'message': 'DISCOUNT_RANGE_CAN_BE_SET_FROM_0_TO_99'}), 400
+            # 상품명, 할인 기간, 최소/최대 수량, 판매가, 할인률 제한 사항 확인
+            message = validate_product_info(request.form)
+            if message:
+                return jsonify({'message': message}), 400
 
             # 상품 코드
             product_code = str(uuid.uuid4())
@@ -456,7 +459,65 @@ def create_product_endpoints(product_service, Session):
             if is_success is False:
                 session.rollback()
                 delete_image_in_s3(image_urls, None)
-            session.close()
+
+    @product_app.route('/import', methods=['POST'], endpoint='import_products')
+    @login_required(Session)
+    @validate_params(
+        Param('format', GET, str, rules=[Enum('csv', 'xlsx')], required=False)
+    )
+    def import_products(*args):
+        """ 상품 일괄 등록 API
+
+        multipart 로 전달된 file 을 한 줄씩 읽어 상품 등록 API 와 같은 제한 사항을 확인하고 batch 단위 transaction 으로 등록합니다.
+        제한 사항에 맞지 않는 줄은 건너뛰고 줄 번호와 에러 메세지를 응답합니다.
+        batch 마다 commit 하므로 중간에 DB 에러가 발생하면 이전 batch 까지 등록된 상품은 유지됩니다.
+        관리자가 아닌 셀러가 등록하면 파일의 seller_id 대신 로그인한 셀러의 상품으로 등록합니다.
+
+        args:
+            file: 상품 정보 파일 (컬럼은 product_service.PRODUCT_IMPORT_COLUMNS)
+            format: csv, xlsx (기본값은 파일 확장자)
+
+        returns :
+            200: 등록한 상품 수, 실패한 줄 수, 줄 별 에러
+            400: FILE_REQUIRED, INVALID_FILE_FORMAT, XLSX_NOT_SUPPORTED
+            500: Exception
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        upload = request.files.get('file', None)
+        if upload is None:
+            return jsonify({'message': 'FILE_REQUIRED'}), 400
+
+        file_format = args[0] or upload.filename.rsplit('.', 1)[-1].lower()
+        seller_id = None if g.seller_info['is_admin'] else g.seller_info['seller_no']
+
+        session = Session()
+        inserted_count = 0
+        errors = list()
+        try:
+            rows = read_import_rows(upload.stream, file_format)
+
+            # batch 가 등록될 때마다 commit 한다.
+            for batch_count, batch_errors in product_service.import_products(
+                    rows, g.seller_info['seller_no'], session, seller_id):
+                session.commit()
+                inserted_count += batch_count
+                errors.extend(batch_errors)
+
+            return jsonify({'inserted': inserted_count, 'failed': len(errors), 'errors': errors}), 200
+
+        except ValueError as e:
+            session.rollback()
+            return jsonify({'message': f'{e}'}), 400
+
+        except Exception as e:
+            session.rollback()
+            traceback.print_exc()
+            return jsonify({'message': f'{e}', 'inserted': inserted_count, 'failed': len(errors), 'errors': errors}), 500
 
     @product_app.route('/update', methods=['POST'], endpoint='update_product')
     @login_required(Session)
@@ -482,9 +543,11 @@ def create_product_endpoints(product_service, Session):
 
         History:
             2020-10-10 (고지원): 초기 생성
+            2026-10-18 (고지원): 수정 실패 시 새로 업로드한 이미지가 없으면 s3 이미지를 삭제하지 않도록 수정
         """
         session = Session()
         is_success = False
+        new_images = list()
         try:
             # 상품 입력을 위한 데이터를 받는다.
             old_images = request.form['images'].split(',')
@@ -557,7 +620,8 @@ def create_product_endpoints(product_service, Session):
         finally:
             if is_success is False:
                 session.rollback()
-                delete_image_in_s3(old_images, new_images)
-            session.close()
+                # 새로 업로드한 이미지만 삭제한다. 업로드한 이미지가 없으면 기존 이미지는 그대로 둔다.
+                if new_images and 400 not in new_images:
+                    delete_image_in_s3(old_images, new_images)
 
     return product_app
\ No newline at end of file
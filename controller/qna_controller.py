@@ -29,7 +29,8 @@ def create_qna_endpoints(services, Session):
         Param('filterDateFrom', GET, str, required = False),
         Param('filterDateTo', GET, str, required = False),
         Param('filterLimit', GET, int, required = False),
-        Param('page', GET, int, required = False)
+        Param('page', GET, int, required = False),
+        Param('skipCount', GET, int, required = False)
     )
     def get_qna_list(*args, **kwargs):
         """
@@ -56,6 +57,7 @@ def create_qna_endpoints(services, Session):
             2020-10-05 (hj885353@gmail.com) : 초기 생성
             2020-10-12 (hj885353@gmail.com) : QueryString 변경
             2020-10-13 (hj885353@gmail.com) : pagination 관련 QueryString이 입력되지 않았을 경우를 위한 default값 설정
+            2026-10-18 (hj885353@gmail.com) : skipCount 추가. 1 이면 전체 갯수, page_number를 null로 응답
         """
         valid_param = {}
 
@@ -68,6 +70,7 @@ def create_qna_endpoints(services, Session):
         valid_param['filterDateTo']    = args[6] # 등록일 ~까지
         valid_param['filterLimit']     = args[7] if args[7] else 20 # pagination limit
         valid_param['page']            = args[8] if args[8] else 1 # page number
+        valid_param['skipCount']       = args[9] # 1 : 전체 Q&A 갯수 조회 생략
 
         # decorator로부터 받아온 seller info를 가진 g 객체
         seller_info = g.seller_info
@@ -88,10 +91,6 @@ def create_qna_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            # db close
-            session.close()
-
     @qna_bp.route('/<int:parameter_question_no>', methods = ['GET'], endpoint = 'qna_answer_info')
     @login_required(Session)
     @validate_params(
@@ -132,9 +131,6 @@ def create_qna_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @qna_bp.route('/<int:parameter_question_no>', methods = ['POST'], endpoint = 'insert_answer')
     @login_required(Session)
     @validate_params(
@@ -184,9 +180,6 @@ def create_qna_endpoints(services, Session):
             session.rollback()
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @qna_bp.route('/<int:parameter_question_no>', methods = ['PUT'], endpoint = 'delete_answer')
     @login_required(Session)
     @validate_params(
@@ -234,7 +227,4 @@ def create_qna_endpoints(services, Session):
             session.rollback()
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     return qna_bp
\ No newline at end of file
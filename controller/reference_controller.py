@@ -0,0 +1,74 @@
+from flask import (
+    Blueprint,
+    jsonify,
+    g
+)
+
+from utils import login_required
+
+# reference API
+
+
+def create_reference_endpoints(reference_service, Session):
+    reference_app = Blueprint('reference_app', __name__, url_prefix='/api/reference')
+
+    @reference_app.route('', methods=['GET'], endpoint='get_reference_data')
+    @login_required(Session)
+    def get_reference_data():
+        """
+        기준 정보 조회 엔드포인트
+            카테고리, 셀러 속성, 주문상태, 환불/취소 사유, 쿠폰 발급유형, 문의유형 등 기준 정보를 한번에 전달합니다.
+
+        returns :
+            200: 캐시 version 과 기준 정보
+            500: Exception
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        session = Session()
+        try:
+            version, tables = reference_service.get_reference_data(session)
+
+            return jsonify({'version': version, 'reference_data': tables}), 200
+
+        except Exception as e:
+            return jsonify({'ERROR_MSG': f'{e}'}), 500
+
+    @reference_app.route('/reload', methods=['POST'], endpoint='reload_reference_data')
+    @login_required(Session)
+    def reload_reference_data():
+        """
+        기준 정보 캐시 갱신 엔드포인트
+            관리자만 호출할 수 있으며, 요청을 받은 프로세스의 기준 정보 캐시를 즉시 다시 읽습니다.
+            다른 프로세스의 캐시는 ttl 이 지나면 갱신됩니다.
+
+        returns :
+            200: 갱신된 캐시 version
+            403: 관리자가 아닌 경우
+            500: Exception
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        if not g.seller_info['is_admin']:
+            return jsonify({'message': 'NO_PERMISSION'}), 403
+
+        session = Session()
+        try:
+            version = reference_service.reload_reference_data(session)
+
+            return jsonify({'version': version}), 200
+
+        except Exception as e:
+            return jsonify({'ERROR_MSG': f'{e}'}), 500
+
+    return reference_app
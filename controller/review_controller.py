@@ -31,7 +31,8 @@ def create_review_endpoints(services, Session):
         Param('NEW_REGIST', GET, str, required = False),
         Param('NEW_EDIT', GET, str, required = False),
         Param('filterLimit', GET, int, required = False),
-        Param('page', GET, int, required = False)
+        Param('page', GET, int, required = False),
+        Param('skipCount', GET, int, required = False)
     )
     def get_review_list(*args, **kwargs):
         """
@@ -53,6 +54,7 @@ def create_review_endpoints(services, Session):
              - 마지막 페이지 number return 하도록 수정
              - 검색 카테고리가 선택되지 않은 상태에서의 검색 입력값만은 불필요하기 때문에 삭제
             2020-10-13 (hj885353@gmail.com) : pagination querystring 입력되지 않았을 경우를 위한 default값 설정
+            2026-10-18 (hj885353@gmail.com) : skipCount 추가. 1 이면 전체 갯수, page_number를 null로 응답
         """
         valid_param = {}
 
@@ -67,6 +69,7 @@ def create_review_endpoints(services, Session):
         valid_param['NEW_EDIT']         = args[8] # 수정일시 최신순
         valid_param['filterLimit']      = args[9] if args[9] else 10 # 10개씩 보기
         valid_param['page']             = args[10] if args[10] else 1 # page number
+        valid_param['skipCount']        = args[11] # 1 : 전체 리뷰 갯수 조회 생략
 
         try:
             # db connection
@@ -84,10 +87,6 @@ def create_review_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            # db close
-            session.close()
-
     @review_bp.route('/<int:parameter_review_no>', methods = ['GET'], endpoint = 'review_info')
     @login_required(Session)
     @validate_params(
@@ -128,9 +127,6 @@ def create_review_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message' : f'{e}'})
 
-        finally:
-            session.close()
-
     @review_bp.route('/<int:parameter_review_no>', methods = ['POST'], endpoint = 'delete_review')
     @login_required(Session)
     @validate_params(
@@ -174,7 +170,4 @@ def create_review_endpoints(services, Session):
             session.rollback()
             return jsonify({'message' : f'{e}'})
 
-        finally:
-            session.close()
-
     return review_bp
\ No newline at end of file
@@ -81,10 +81,6 @@ def create_seller_endpoints(services, Session):
             session.rollback()
             return jsonify({'MESSAGE' : f'{e}'})
 
-        finally:
-            # transaction close
-            session.close()
-
     @seller_bp.route('/login', methods = ['POST'])
     @validate_params(
         Param('loginID', JSON, str),
@@ -133,10 +129,6 @@ def create_seller_endpoints(services, Session):
 
             return jsonify({'error_message' : f'{e}'})
 
-        finally:
-            # transaction close
-            session.close()
-
     @seller_bp.route('/sellers', methods=['GET'], endpoint='get_seller_list')
     @login_required(Session)
     @validate_params(
@@ -156,7 +148,8 @@ def create_seller_endpoints(services, Session):
         Param('start_at', GET, str, required = False),
         Param('end_date', GET, str, required = False),
         Param('filterLimit', GET, int, required = False),
-        Param('page', GET, int, required = False)
+        Param('page', GET, int, required = False),
+        Param('skipCount', GET, int, required = False)
     )
     def get_seller_list(*args, **kwargs):
         """ 가입된 모든 셀러 정보 리스트 표출
@@ -174,6 +167,8 @@ def create_seller_endpoints(services, Session):
                 기존 : offset, limit을 querystring으로 받아서 해당 조건만 걸어줌
                 변경 : SQL의 LIMIT과 OFFSET 기능을 사용하여 10개씩보기, 20개씩 보기 기능 추가
                       pagenation 관련 QueryString이 입력되지 않았을때를 위한 default값 설정
+            2026-10-18 (hj885353@gmail.com): skipCount 추가
+                skipCount=1 이면 셀러 수를 구하지 않고 total_seller_number, page_number를 null로 응답
         """
         start_at = args[13]
         end_date = args[14]
@@ -203,6 +198,7 @@ def create_seller_endpoints(services, Session):
         valid_param['end_date']         = end_date
         valid_param['filterLimit']      = args[15] if args[15] else 10
         valid_param['page']             = args[16] if args[16] else 1
+        valid_param['skipCount']        = args[17]
 
         # 유저 정보를 g에서 읽어와서 service 에 전달
         seller_info = g.seller_info
@@ -222,9 +218,6 @@ def create_seller_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message': f'{e}'}), 500
 
-        finally:
-            session.close()
-
     @seller_bp.route('/<int:parameter_seller_no>', methods=['GET'], endpoint='get_seller_info')
     @login_required(Session)
     @validate_params(
@@ -262,9 +255,6 @@ def create_seller_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message' : f'{e}'})
 
-        finally:
-            session.close()
-
     @seller_bp.route('/<int:parameter_seller_no>', methods=['PUT'], endpoint='change_seller_info')
     @login_required(Session)
     @validate_params(
@@ -306,9 +296,6 @@ def create_seller_endpoints(services, Session):
             session.rollback()
             return jsonify({'message' : f'{e}'})
 
-        finally:
-            session.close()
-
     @seller_bp.route('check_kor', methods=['GET'], endpoint='check_duplication_kor')
     @login_required(Session)
     def check_duplication_kor():
@@ -349,9 +336,6 @@ def create_seller_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message' : f'{e}'})
 
-        finally:
-            session.close()
-
     @seller_bp.route('check_eng', methods=['GET'], endpoint='check_duplication_eng')
     @login_required(Session)
     def check_duplication_eng():
@@ -392,9 +376,6 @@ def create_seller_endpoints(services, Session):
         except Exception as e:
             return jsonify({'message' : f'{e}'})
 
-        finally:
-            session.close()
-
     @seller_bp.route('/<int:parameter_seller_no>/password', methods=['PUT'], endpoint='change_password')
     @login_required(Session)
     @validate_params(
@@ -452,7 +433,4 @@ def create_seller_endpoints(services, Session):
             session.rollback()
             return jsonify({'message' : f'{e}'})
 
-        finally:
-            session.close()
-
     return seller_bp
\ No newline at end of file
@@ -23,7 +23,8 @@ def create_user_endpoints(services, Session):
         Param('mber_date_from', GET, str, required = False),
         Param('mber_date_to', GET, str, required = False),
         Param('filterLimit', GET, int, required = False),
-        Param('page', GET, int, required = False)
+        Param('page', GET, int, required = False),
+        Param('skipCount', GET, int, required = False)
     )
     def user_info(*args, **kwargs):
         """
@@ -44,6 +45,8 @@ def create_user_endpoints(services, Session):
                 controller에서 dict casting 후 return
             변경 : QueryString을 사용한 filtering 기능 추가
                 dao에서 dict casting 한 후 그 값을 controller에서 받아서 return
+            2026-10-18 (hj885353@gmail.com)
+            skipCount 추가 : skipCount=1 이면 total_user_number, page_number를 null로 응답
         """
         valid_param = {}
 
@@ -55,6 +58,7 @@ def create_user_endpoints(services, Session):
         valid_param['mber_date_to']   = args[5] # 등록일시 ~까지
         valid_param['filterLimit']    = args[6] if args[6] else 10 # 페이지네이션 limit
         valid_param['page']           = args[7] if args[7] else 1 # 페이지네이션 offset
+        valid_param['skipCount']      = args[8] # 전체 회원 수 조회 생략
 
         session = Session()
 
@@ -72,8 +76,4 @@ def create_user_endpoints(services, Session):
         except Exception as e:
             return jsonify({'ERROR_MSG' : f'{e}' }), 500
 
-        finally:
-            # db close
-            session.close()
-
     return user_bp
\ No newline at end of file
@@ -0,0 +1,279 @@
+"""
+DB engine 및 connection pool 설정
+    pool 크기, overflow, 대기시간, recycle, pre-ping 을 app config 로 설정합니다.
+    gunicorn 은 worker process 마다 engine 을 따로 만들기 때문에 최대 connection 수는
+    workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) 이며, 이 값이 MySQL max_connections 보다 작아야 합니다.
+
+    InstrumentedQueuePool 은 connection 을 꺼낼 때마다 대기시간과 timeout 을 pool_metrics 에 기록하고,
+    pool_status 로 현재 사용중/대기/overflow connection 수와 함께 조회합니다.
+
+    RequestSession 은 요청마다 session 하나를 만들어 인증과 endpoint 가 함께 사용하고, 요청이 끝나면 반납합니다.
+    DB_REPLICA_URLS 가 설정되어 있으면 GET 요청의 session 은 replica engine 에 연결합니다.
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+"""
+import time
+import itertools
+import threading
+
+from flask           import g, request
+from sqlalchemy      import create_engine, exc
+from sqlalchemy.pool import QueuePool
+
+from model.query_util import CachedTextCompiledCache
+
+# pool 기본 설정. app config 에 같은 이름의 값이 있으면 그 값을 사용
+DB_POOL_DEFAULTS = {
+    # 항상 유지하는 connection 수
+    'DB_POOL_SIZE'     : 10,
+    # pool_size 를 넘어 추가로 만들 수 있는 connection 수
+    'DB_MAX_OVERFLOW'  : 10,
+    # connection 을 기다리는 최대 시간(초). 넘으면 TimeoutError
+    'DB_POOL_TIMEOUT'  : 10,
+    # MySQL wait_timeout 으로 끊기기 전에 connection 을 다시 만드는 주기(초)
+    'DB_POOL_RECYCLE'  : 3600,
+    # connection 을 꺼낼 때 끊긴 connection 인지 확인
+    'DB_POOL_PRE_PING' : True
+}
+
+# engine 마다 cached_text 쿼리의 컴파일 결과를 보관하는 compiled_cache 크기
+DB_COMPILED_CACHE_SIZE_DEFAULT = 500
+
+# 읽기 전용 replica DB url 목록. 비어있으면 모든 요청이 primary 를 사용
+DB_REPLICA_URLS_DEFAULT = []
+
+# 쓰기 요청 이후 같은 client 의 GET 요청을 primary 로 보내는 시간(초). replica 복제 지연보다 길게 설정
+DB_READ_YOUR_WRITES_SECONDS_DEFAULT = 5
+
+# 쓰기 요청 응답에 설정하는 cookie, client 가 직접 primary 조회를 요청할 때 보내는 header
+READ_PRIMARY_COOKIE = 'read_primary'
+READ_PRIMARY_HEADER = 'X-Read-Primary'
+
+# replica 로 보낼 수 있는 읽기 전용 method
+READ_ONLY_METHODS = ('GET', 'HEAD')
+
+class PoolMetrics:
+    """
+    connection pool 누적 지표
+        checkout 횟수, timeout 횟수, connection 을 기다린 총/최대 시간을 기록합니다.
+        여러 요청 스레드에서 동시에 기록하므로 lock 으로 보호합니다.
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def record(self, wait_time, timeout = False):
+        with self._lock:
+            if timeout:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += wait_time
+            self.wait_max = max(self.wait_max, wait_time)
+
+    def snapshot(self):
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                'checkouts'    : self.checkouts,
+                'timeouts'     : self.timeouts,
+                'wait_avg_ms'  : round(self.wait_total / attempts * 1000, 3) if attempts else 0,
+                'wait_max_ms'  : round(self.wait_max * 1000, 3)
+            }
+
+# 프로세스 전체에서 공유하는 pool 지표 (primary, replica pool 합산)
+# QueuePool.recreate 는 생성자 인자만 넘겨 pool 을 다시 만들기 때문에 pool 객체가 아닌 모듈에 보관한다.
+pool_metrics = PoolMetrics()
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    connection 대기시간과 timeout 을 pool_metrics 에 기록하는 QueuePool
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    def _do_get(self):
+        started_at = time.monotonic()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record(time.monotonic() - started_at, timeout = True)
+            raise
+
+        pool_metrics.record(time.monotonic() - started_at)
+        return connection
+
+def pool_settings(config):
+    # app config 의 DB_POOL_* 값. 없는 값은 DB_POOL_DEFAULTS 사용
+    return {key: config.get(key, default) for key, default in DB_POOL_DEFAULTS.items()}
+
+def create_database(config, url = None):
+    """
+    app config 의 pool 설정으로 engine 생성
+
+    args :
+        config : DB_URL 과 DB_POOL_* 값을 가진 dict (app.config)
+        url    : 연결할 DB url. 없으면 config 의 DB_URL (replica engine 생성 시 사용)
+
+    returns :
+        InstrumentedQueuePool 과 compiled_cache 를 사용하는 engine
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    settings = pool_settings(config)
+
+    return create_engine(
+        url or config['DB_URL'],
+        encoding      = 'utf-8',
+        poolclass     = InstrumentedQueuePool,
+        pool_size     = settings['DB_POOL_SIZE'],
+        max_overflow  = settings['DB_MAX_OVERFLOW'],
+        pool_timeout  = settings['DB_POOL_TIMEOUT'],
+        pool_recycle  = settings['DB_POOL_RECYCLE'],
+        pool_pre_ping = settings['DB_POOL_PRE_PING'],
+        # 같은 text() 객체(model.query_util.cached_text)를 실행하면 컴파일 결과를 재사용
+        # 문자열로 실행한 쿼리는 보관하지 않는다.
+        execution_options = {
+            'compiled_cache': CachedTextCompiledCache(config.get('DB_COMPILED_CACHE_SIZE', DB_COMPILED_CACHE_SIZE_DEFAULT))
+        }
+    )
+
+def create_replica_databases(config):
+    """
+    config 의 DB_REPLICA_URLS 마다 primary 와 같은 pool 설정으로 engine 생성
+
+    args :
+        config : DB_REPLICA_URLS 와 DB_POOL_* 값을 가진 dict (app.config)
+
+    returns :
+        replica engine 리스트
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    return [create_database(config, url) for url in config.get('DB_REPLICA_URLS', DB_REPLICA_URLS_DEFAULT)]
+
+def pool_status(database, config):
+    """
+    현재 pool 상태 조회
+        max_overflow 는 pool 을 만들 때 사용한 app config 값을 그대로 보여줍니다.
+
+    args :
+        database : create_database 로 만든 engine
+        config   : engine 을 만들 때 사용한 app config
+
+    returns :
+        pool 설정, 사용중/대기/overflow connection 수 dict
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    pool = database.pool
+
+    return {
+        'pool_size'     : pool.size(),
+        'max_overflow'  : pool_settings(config)['DB_MAX_OVERFLOW'],
+        'timeout'       : pool.timeout(),
+        'checked_out'   : pool.checkedout(),
+        'checked_in'    : pool.checkedin(),
+        # QueuePool.overflow() 는 pool_size 를 채우기 전까지 음수이므로 0 부터 센다.
+        'overflow'      : max(pool.overflow(), 0)
+    }
+
+class RequestSession:
+    """
+    요청 단위 session
+        요청 하나에서 Session() 을 몇 번 호출해도 같은 session 을 돌려주므로
+        login_required 의 셀러 조회와 endpoint 가 connection 하나를 함께 사용합니다.
+        session 은 처음 쿼리를 실행할 때 pool 에서 connection 을 꺼냅니다.
+
+        - after_request : 응답 status 가 400 미만이면 commit
+        - teardown_request : 아직 끝나지 않은 transaction 은 rollback 하고 session close
+        endpoint 가 중간에 return 하거나 예외가 발생해도 connection 은 teardown 에서 반납됩니다.
+        stream_with_context 로 보내는 응답은 전송이 끝난 뒤 teardown 이 실행됩니다.
+
+        replica engine 이 있으면 GET/HEAD 요청의 session 은 replica 를 돌아가며 연결합니다.
+        쓰기 요청이 commit 되면 응답에 read_primary cookie 를 read_your_writes_seconds 동안 설정하고,
+        이 cookie 나 X-Read-Primary header 가 있는 GET 요청은 방금 쓴 데이터를 읽을 수 있도록 primary 를 사용합니다.
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    def __init__(self, session_factory, replicas = (), read_your_writes_seconds = DB_READ_YOUR_WRITES_SECONDS_DEFAULT):
+        self.session_factory = session_factory
+        self.replicas = list(replicas)
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._replica_cycle = itertools.cycle(self.replicas)
+
+    def __call__(self):
+        if 'db_session' not in g:
+            if self.use_replica():
+                g.db_session = self.session_factory(bind = next(self._replica_cycle))
+            else:
+                g.db_session = self.session_factory()
+        return g.db_session
+
+    def use_replica(self):
+        return (
+            bool(self.replicas)
+            and request.method in READ_ONLY_METHODS
+            and READ_PRIMARY_COOKIE not in request.cookies
+            and READ_PRIMARY_HEADER not in request.headers
+        )
+
+    def init_app(self, app):
+        app.after_request(self.commit_session)
+        app.teardown_request(self.remove_session)
+
+    def commit_session(self, response):
+        session = g.get('db_session')
+        if session is not None and response.status_code < 400:
+            session.commit()
+
+            # 쓰기 요청 이후 replica 복제 전까지 같은 client 의 조회는 primary 로 보낸다.
+            if self.replicas and request.method not in READ_ONLY_METHODS:
+                response.set_cookie(READ_PRIMARY_COOKIE, '1', max_age = self.read_your_writes_seconds, httponly = True)
+        return response
+
+    def remove_session(self, exception = None):
+        session = g.pop('db_session', None)
+        if session is not None:
+            if exception is not None:
+                session.rollback()
+            session.close()
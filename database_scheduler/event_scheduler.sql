@@ -1,16 +1,17 @@
 /*
 EVENT_AUTO_ORDER_CONFIRM 이벤트
 	 매일 1회 AUTO_ORDER_CONFIRM 프로시저를 실행하는 이벤트 생성하고 스케쥴을 걸어 프로시저 자동 실행
+	 앱에서 실행 상황을 확인하려면 이벤트 대신 auto_order_confirm.py 를 스케쥴러(cron 등)로 실행한다.
 
 Authors:
     eymin1259@gmail.com 이용민
 
 History:
     2020-10-05 (이용민) : 초기 생성
+    2026-10-18 (이용민) : 1000 건 단위 batch 로 프로시저 실행
 */
 
 CREATE EVENT IF NOT EXISTS EVENT_AUTO_ORDER_CONFIRM
     ON SCHEDULE
     EVERY 1 DAY
-    DO CALL AUTO_ORDER_CONFIRM()
-END
\ No newline at end of file
+    DO CALL AUTO_ORDER_CONFIRM(1000, @auto_order_confirm_result);
@@ -1,96 +1,103 @@
 DELIMITER $$
-DROP PROCEDURE IF EXISTS AUTO_ORDER_CONFIRM
-CREATE PROCEDURE AUTO_ORDER_CONFIRM( OUT RESULT INT)
+DROP PROCEDURE IF EXISTS AUTO_ORDER_CONFIRM$$
+CREATE PROCEDURE AUTO_ORDER_CONFIRM( IN BATCH_SIZE INT, OUT RESULT INT)
 /*
 AUTO_ORDER_CONFIRM 프로시저
 	order_item_info 테이블에 배송완료상태 주문을 이력 종료시키고, 구매확정상태 주문을 새로 생성한다.
+	BATCH_SIZE 개씩 나누어 batch 마다 INSERT ... SELECT 한번, UPDATE 한번으로 처리하고 commit 하여
+	lock 을 오래 잡지 않도록 한다. batch 가 끝날 때마다 진행 상황을 출력한다.
 
 Authors:
     eymin1259@gmail.com 이용민
 
 History:
     2020-10-05 (이용민) : 초기 생성
+    2026-10-18 (이용민) : 커서로 한 row 씩 처리하던 로직을 batch 단위 set-based 처리로 변경
+                          선분이력이 종료되지 않은 현재 상태 row 만 처리하도록 조건 추가
+                          현재 상태 스냅샷(order_item_info_current) 갱신 추가
 */
 BEGIN
-
-    /* 오토커밋 ON, 트랜잭션 설정 */
-    SET AUTOCOMMIT = 1;
-    START TRANSACTION;
-
-	/* 커서 종료 구분 변수 */
-	DECLARE _done INT DEFAULT FALSE;
-	/* 처리된 건수 */
-	DECLARE _row_count INT DEFAULT 0;
+	/* 이번 batch 에서 처리된 건수 */
+	DECLARE _batch_count INT DEFAULT 0;
+	/* 처리된 batch 수 */
+	DECLARE _batch_number INT DEFAULT 0;
     /*구매확정 프로시저 실행 시간*/
     DECLARE auto_comfirm_time DATETIME DEFAULT now();
 
-    /* order_item_info 테이블(oii)의 컬럼값을 담을 변수 */
-    DECLARE _oii_id INT;
-    DECLARE _oii_order_detail_id VARCHAR(45);
-    DECLARE _oii_order_id INT;
-    DECLARE _oii_order_status_id INT;
-    DECLARE _oii_product_id INT;
-    DECLARE _oii_price DECIMAL(18,0);
-    DECLARE _oii_option_color VARCHAR(45);
-    DECLARE _oii_option_size VARCHAR(45);
-    DECLARE _oii_option_additional_price DECIMAL(18,0);
-    DECLARE _oii_units INT;
-    DECLARE _oii_discount_price INT;
-    DECLARE _oii_shipping_start_date DATETIME;
-    DECLARE _oii_shipping_complete_date DATETIME;
-    DECLARE _oii_shipping_company VARCHAR(45);
-    DECLARE _oii_shipping_number INT:
-    DECLARE _oii_is_confirm_order TINYINT;
-    DECLARE _oii_refund_request_date DATETIME;
-    DECLARE _oii_refund_complete_date DATETIME;
-    DECLARE _oii_refund_reason_id INT;
-    DECLARE _oii_refund_amount INT;
-    DECLARE _oii_refund_shipping_fee INT;
-    DECLARE _oii_detail_reason VARCHAR(1024);
-    DECLARE _oii_bank VARCHAR(45);
-    DECLARE _oii_account_holder VARCHAR(45);
-    DECLARE _oii_account_number VARCHAR(45);
-    DECLARE _oii_cancel_reason_id INT;
-    DECLARE _oii_complete_cancellation_date DATETIME;
-    DECLARE _oii_start_date DATETIME;
-    DECLARE _oii_end_date DATETIME;
-    DECLARE _oii_modifier_id INT;
-    DECLARE _oii_is_deleted TINYINT;
-
-	/* order_item_info 테이블에서 배송완료일(order_status_id = 4)이 3일이상 지난 row들을 읽어오는 커서를 생성. */
-	DECLARE CURSOR_ORDER_ITEM_INFO CURSOR FOR 
-    SELECT * 
-    FROM order_item_info 
-    WHERE order_status_id = 4 
-    AND shipping_complete_date <= DATE_SUB(now(), interval 3 day);
-
-	/* 커서 종료조건 : 더이상 없다면 종료 */
-	DECLARE CONTINUE HANDLER FOR NOT FOUND SET _done = TRUE;
-
-	OPEN CURSOR_ORDER_ITEM_INFO;
-	REPEAT
-        /* 배송완료상태의 주문 data를 fetch*/
-        FETCH CURSOR_ORDER_ITEM_INFO INTO _oii_id, _oii_order_detail_id, _oii_order_id, _oii_order_status_id, _oii_product_id, _oii_price, _oii_option_color, _oii_option_size, _oii_option_additional_price, _oii_units, _oii_discount_price, _oii_shipping_start_date, _oii_shipping_complete_date, _oii_shipping_company, _oii_shipping_number, _oii_is_confirm_order, _oii_refund_request_date, _oii_refund_complete_date, _oii_refund_reason_id, _oii_refund_amount, _oii_refund_shipping_fee, _oii_detail_reason, _oii_bank, _oii_account_holder, _oii_account_number, _oii_cancel_reason_id, _oii_complete_cancellation_date, _oii_start_date, _oii_end_date, _oii_modifier_id, _oii_is_deleted;
-        IF NOT _done THEN
-
-            /* 배송완료상태 종료*/
-            UPDATE order_item_info 
-            SET end_date = auto_comfirm_time, is_deleted = 1 
-            WHERE id = _oii_id;
-            
-            /* fetch한 배송완료상태 주문 정보를 가지고 구매확정상태 주문 생성*/
-            INSERT INTO order_item_info 
-            VALUES( DEFAULT, _oii_order_detail_id, _oii_order_id, 5, _oii_product_id, _oii_price, _oii_option_color, _oii_option_size, _oii_option_additional_price, _oii_units, _oii_discount_price, _oii_shipping_start_date, _oii_shipping_complete_date, _oii_shipping_company, _oii_shipping_number, 1, _oii_refund_request_date, _oii_refund_complete_date, _oii_refund_reason_id, _oii_refund_amount, _oii_refund_shipping_fee, _oii_detail_reason, _oii_bank, _oii_account_holder, _oii_account_number, _oii_cancel_reason_id, _oii_complete_cancellation_date, auto_comfirm_time, '9999-12-31 23:59:59', _oii_modifier_id, 0 ); 
-
-            SET _row_count = _row_count + 1;
-			SET _done = FALSE;
+	SET RESULT = 0;
+
+	/* batch 마다 처리할 order_item_info id 를 담는 임시 테이블 */
+	DROP TEMPORARY TABLE IF EXISTS AUTO_ORDER_CONFIRM_BATCH;
+	CREATE TEMPORARY TABLE AUTO_ORDER_CONFIRM_BATCH ( id INT NOT NULL PRIMARY KEY );
+
+	BATCH_LOOP: LOOP
+		START TRANSACTION;
+
+		DELETE FROM AUTO_ORDER_CONFIRM_BATCH;
+
+		/* 배송완료일(order_status_id = 4)이 3일이상 지난 현재 상태 row 를 BATCH_SIZE 개 가져와 lock */
+		INSERT INTO AUTO_ORDER_CONFIRM_BATCH ( id )
+		SELECT id
+		FROM order_item_info
+		WHERE order_status_id = 4
+		AND end_date = '9999-12-31 23:59:59'
+		AND shipping_complete_date <= DATE_SUB(auto_comfirm_time, interval 3 day)
+		ORDER BY id
+		LIMIT BATCH_SIZE
+		FOR UPDATE;
+
+		SET _batch_count = ROW_COUNT();
 
+		/* 더이상 처리할 주문이 없다면 종료 */
+		IF _batch_count = 0 THEN
+			COMMIT;
+			LEAVE BATCH_LOOP;
 		END IF;
-	UNTIL _done END REPEAT;
 
-	/* 커서를 닫기 */
-	CLOSE CURSOR_ORDER_ITEM_INFO;
-	SET RESULT = _row_count;
-    	 
+		/* 배송완료상태 주문 정보를 가지고 구매확정상태 주문 생성 */
+		INSERT INTO order_item_info
+			(
+				order_detail_id, order_id, order_status_id, product_id, price, option_color, option_size,
+				option_additional_price, units, discount_price, shipping_start_date, shipping_complete_date,
+				shipping_company, shipping_number, is_confirm_order, refund_request_date, refund_complete_date,
+				refund_reason_id, refund_amount, refund_shipping_fee, detail_reason, bank, account_holder,
+				account_number, cancel_reason_id, complete_cancellation_date, start_date, end_date, modifier_id, is_deleted
+			)
+		SELECT
+			oii.order_detail_id, oii.order_id, 5, oii.product_id, oii.price, oii.option_color, oii.option_size,
+			oii.option_additional_price, oii.units, oii.discount_price, oii.shipping_start_date, oii.shipping_complete_date,
+			oii.shipping_company, oii.shipping_number, 1, oii.refund_request_date, oii.refund_complete_date,
+			oii.refund_reason_id, oii.refund_amount, oii.refund_shipping_fee, oii.detail_reason, oii.bank, oii.account_holder,
+			oii.account_number, oii.cancel_reason_id, oii.complete_cancellation_date, auto_comfirm_time, '9999-12-31 23:59:59', oii.modifier_id, 0
+		FROM order_item_info AS oii
+		INNER JOIN AUTO_ORDER_CONFIRM_BATCH AS batch ON batch.id = oii.id;
+
+		/* 배송완료상태 종료 */
+		UPDATE order_item_info AS oii
+		INNER JOIN AUTO_ORDER_CONFIRM_BATCH AS batch ON batch.id = oii.id
+		SET oii.end_date = auto_comfirm_time, oii.is_deleted = 1;
+
+		/* 현재 상태 스냅샷(order_item_info_current)을 구매확정상태 row 로 교체 */
+		DELETE oiic
+		FROM order_item_info_current AS oiic
+		INNER JOIN AUTO_ORDER_CONFIRM_BATCH AS batch ON batch.id = oiic.id;
+
+		INSERT INTO order_item_info_current
+		SELECT confirmed.*
+		FROM order_item_info AS confirmed
+		INNER JOIN order_item_info AS delivered ON delivered.order_detail_id = confirmed.order_detail_id
+		INNER JOIN AUTO_ORDER_CONFIRM_BATCH AS batch ON batch.id = delivered.id
+		WHERE confirmed.end_date = '9999-12-31 23:59:59';
+
+		COMMIT;
+
+		SET _batch_number = _batch_number + 1;
+		SET RESULT = RESULT + _batch_count;
+
+		/* 진행 상황 출력 */
+		SELECT _batch_number AS batch_number, _batch_count AS batch_count, RESULT AS total_count;
+	END LOOP;
+
+	DROP TEMPORARY TABLE IF EXISTS AUTO_ORDER_CONFIRM_BATCH;
 END$$
-DELIMITER ;
\ No newline at end of file
+DELIMITER ;
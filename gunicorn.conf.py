@@ -0,0 +1,38 @@
+"""
+gunicorn 설정
+    기본값은 gevent worker 로, 요청마다 thread 대신 greenlet 을 사용합니다.
+    DB(PyMySQL), s3(boto3) 호출이 socket I/O 를 기다리는 동안 같은 worker 의 다른 요청을 처리하므로
+    thread 하나가 요청 하나를 끝까지 잡고 있던 sync worker 보다 core 당 훨씬 많은 동시 요청을 처리합니다.
+    controller / service / DAO 코드는 그대로 사용하고, gevent 가 socket 을 monkey patch 합니다.
+
+    - gevent 에서 DB 대기가 양보되려면 config.DB_URL 이 순수 python driver 인 mysql+pymysql:// 이어야 합니다.
+      (mysqlclient 는 C 라이브러리에서 socket 을 직접 기다리므로 worker 전체가 멈춥니다)
+    - worker 의 동시 요청 수(GUNICORN_WORKER_CONNECTIONS)가 DB connection pool 크기보다 크면 pool 에서 대기합니다.
+
+    gunicorn -c gunicorn.conf.py "app:create_app()"
+    GUNICORN_WORKER_CLASS=sync gunicorn -c gunicorn.conf.py "app:create_app()"   : 기존 sync worker 로 실행
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+"""
+import os
+import multiprocessing
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# gevent : greenlet 기반 비동기 worker, sync : 요청마다 worker 하나를 점유
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+
+# CPU 작업(JSON 직렬화, bcrypt 등)은 worker process 로 나누어 처리
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# gevent worker 하나가 동시에 처리하는 최대 요청 수
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# 파일 다운로드 등 오래 걸리는 응답을 위해 기본값(30초)보다 길게 설정
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+
+keepalive = 5
@@ -0,0 +1,62 @@
+"""
+교체된 상품 이미지 s3 삭제 worker
+    product_image_deletions 삭제 대기열에 commit 된 이미지를 1000 개씩 s3 에서 삭제합니다.
+    대기열이 비어 있으면 --interval 초 동안 기다린 뒤 다시 확인합니다.
+
+    python image_deletion_worker.py          : 계속 실행
+    python image_deletion_worker.py --once   : 대기열을 모두 비운 뒤 종료 (cron 등에서 실행)
+
+Authors:
+    고지원
+
+History:
+    2026-10-18 (고지원) : 초기 생성
+"""
+import time
+import argparse
+import traceback
+
+from sqlalchemy     import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import config
+
+from model   import ProductDao
+from service import ProductService
+
+def run(once, interval):
+    database = create_engine(config.DB_URL, encoding = 'utf-8', pool_size = 1)
+    Session = sessionmaker(bind = database)
+
+    product_service = ProductService(ProductDao())
+
+    while True:
+        session = Session()
+        try:
+            # 한 batch 씩 commit 하여 삭제된 이미지를 대기열에서 제거한다.
+            purged_count = product_service.purge_deleted_images(session)
+            session.commit()
+
+        except Exception:
+            session.rollback()
+            traceback.print_exc()
+            purged_count = 0
+
+        finally:
+            session.close()
+
+        if purged_count:
+            continue
+
+        if once:
+            break
+
+        time.sleep(interval)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = '교체된 상품 이미지 s3 삭제 worker')
+    parser.add_argument('--once', action = 'store_true', help = '대기열을 모두 비운 뒤 종료')
+    parser.add_argument('--interval', type = int, default = 10, help = '대기열이 비어 있을 때 기다리는 시간(초)')
+    args = parser.parse_args()
+
+    run(args.once, args.interval)
@@ -5,6 +5,7 @@ from .product_dao import ProductDao
 from .qna_dao import QnADao
 from .review_dao import ReviewDao
 from .coupon_dao import CouponDao
+from .reference_dao import ReferenceDao, reference_cache
 
 __all__ = [
     'OrderDao',
@@ -13,5 +14,7 @@ __all__ = [
     'ProductDao',
     'QnADao',
     'ReviewDao',
-    'CouponDao'
+    'CouponDao',
+    'ReferenceDao',
+    'reference_cache'
 ]
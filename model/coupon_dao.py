@@ -1,69 +1,83 @@
-class CouponDao:
-
-    def select_coupon_count(self, select_condition, session):
+from model.query_util import ConditionBuilder, cached_text
+from model.reference_dao import reference_cache
+
+# 쿠폰 기간 검색조건 : (쿼리파라미터, 비교 컬럼, 비교 연산자)
+COUPON_DATE_CONDITIONS = (
+    ('validationStartFrom', 'coupons.validation_start_date', '>='),
+    ('validationStartTo',   'coupons.validation_start_date', '<='),
+    ('validationEndFrom',   'coupons.validation_end_date',   '>='),
+    ('validationEndTo',     'coupons.validation_end_date',   '<='),
+    ('downloadStartFrom',   'coupons.download_start_date',   '>='),
+    ('downloadStartTo',     'coupons.download_start_date',   '<='),
+    ('downloadEndFrom',     'coupons.download_end_date',     '>='),
+    ('downloadEndTo',       'coupons.download_end_date',     '<=')
+)
+
+# 쿠폰 목록 페이지 크기
+COUPON_PAGE_SIZE = 10
 
-        query = """ SELECT 
-                        count(id)
-                    FROM 
-                        coupons
-                    WHERE
-                        is_deleted = 0
+class CouponDao:
 
-                """
+    def _coupon_conditions(self, select_condition):
+        """
+        쿠폰 검색 조건 생성
+            쿠폰 갯수 조회와 쿠폰리스트 조회가 같은 검색 조건을 사용하도록 조건문과 바인딩 값을 만듭니다.
 
-        condition_statement = ''
+        args :
+            select_condition : 쿠폰 검색에 필요한 조건들
 
-        if select_condition.get('couponId', None):
-            condition_statement += f" AND coupons.id = {int(select_condition['couponId'])}"
-            
-        if select_condition.get('couponName', None):
-            condition_statement += f" AND coupons.coupon_name LIKE '%{select_condition['couponName']}%'"
+        returns :
+            검색 조건이 추가된 ConditionBuilder
 
-        if select_condition.get('validationStartFrom', None):
-            condition_statement += f" AND coupons.validation_start_date >= '{select_condition['validationStartFrom']}' "
+        Authors:
+            eymin1259@gmail.com 이용민
 
-        if select_condition.get('validationStartTo', None):
-            condition_statement += f" AND coupons.validation_start_date <= '{select_condition['validationStartTo']}' "
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
 
-        if select_condition.get('validationEndFrom', None):
-            condition_statement += f" AND coupons.validation_end_date >= '{select_condition['validationEndFrom']}' "
+        conditions = ConditionBuilder()
+        conditions.add('coupons.is_deleted = 0')
 
-        if select_condition.get('validationEndTo', None):
-            condition_statement += f" AND coupons.validation_end_date <= '{select_condition['validationEndTo']}' "
+        if select_condition.get('couponId', None):
+            conditions.add('coupons.id = :couponId', couponId=int(select_condition['couponId']))
 
-        if select_condition.get('downloadStartFrom', None):
-            condition_statement += f" AND coupons.download_start_date >= '{select_condition['downloadStartFrom']}' "
+        if select_condition.get('couponName', None):
+            conditions.add_like('coupons.coupon_name', 'couponName', select_condition['couponName'])
 
-        if select_condition.get('downloadStartTo', None):
-            condition_statement += f" AND coupons.download_start_date <= '{select_condition['downloadStartTo']}' "
+        for param_name, column, operator in COUPON_DATE_CONDITIONS:
+            if select_condition.get(param_name, None):
+                conditions.add(f'{column} {operator} :{param_name}', **{param_name: select_condition[param_name]})
 
-        if select_condition.get('downloadEndFrom', None):
-            condition_statement += f" AND coupons.download_end_date >= '{select_condition['downloadEndFrom']}' "
+        if select_condition.get('issueTypeId', None):
+            conditions.add('coupons.issue_type_id = :issueTypeId', issueTypeId=select_condition['issueTypeId'])
 
-        if select_condition.get('downloadEndTo', None):
-            condition_statement += f" AND coupons.download_end_date <= '{select_condition['downloadEndTo']}' "
+        if select_condition.get('isLimited', None) in (0, 1):
+            conditions.add('coupons.is_limited = :isLimited', isLimited=select_condition['isLimited'])
 
-        if select_condition.get('issueTypeId', None):
-            condition_statement += f" AND coupons.issue_type_id = {select_condition['issueTypeId']}"
+        return conditions
 
+    def select_coupon_count(self, select_condition, session):
 
-        if select_condition['isLimited'] == 0:
-            condition_statement += f" AND coupons.is_limited = {select_condition['isLimited']}"
-        if select_condition['isLimited'] == 1:
-            condition_statement += f" AND coupons.is_limited = {select_condition['isLimited']}"
+        conditions = self._coupon_conditions(select_condition)
 
-        query += condition_statement
+        query = """ SELECT 
+                        count(id)
+                    FROM 
+                        coupons
+                """ + conditions.where()
 
-        result = session.execute(query).fetchone()
+        result = session.execute(cached_text(query), conditions.params).fetchone()
         return result[0]
 
-    def select_coupons(self, select_condition, session):
+    def select_coupons(self, select_condition, session, serializer=None):
         """
         쿠폰리스트 조회 
             데이터베이스에서 쿠폰정보들을 조회합니다.
 
         args :
-            session : connection 형성된 session 객체
+            session    : connection 형성된 session 객체
+            serializer : 쿠폰 row 를 응답 dict 로 변환하는 serializer.RowSerializer (없으면 dict(row))
 
         returns :
             쿠폰정보리스트
@@ -73,8 +87,13 @@ class CouponDao:
 
         History:
             2020-10-06 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 발급유형명을 coupon_issue_types JOIN 대신 기준 정보 캐시에서 조회
+            2026-10-18 (이용민) : 검색 조건 값을 쿼리문에 넣지 않고 ConditionBuilder 로 바인딩
+            2026-10-18 (이용민) : serializer 로 row 를 응답 dict 로 바로 변환
         """
 
+        conditions = self._coupon_conditions(select_condition)
+
         query = """ SELECT
                         coupons.id AS coupon_id,
                         coupons.coupon_name,
@@ -83,76 +102,33 @@ class CouponDao:
                         coupons.validation_end_date, 
                         coupons.download_start_date,
                         coupons.download_end_date,
-                        cit.issue_type_name,
+                        coupons.issue_type_id,
                         coupons.is_limited, 
                         coupons.maximum_number,
                         coupons.issue_number,
                         coupons.used_number
 
                     FROM coupons
+                """ + conditions.where()
 
-                    INNER JOIN coupon_issue_types AS cit
-                    ON coupons.issue_type_id = cit.id
-
-                    INNER JOIN coupon_issue_method AS cim
-                    on coupons.issue_method_id = cim.id
-
-                    WHERE
-                        coupons.is_deleted = 0
-                """
-
-
-        condition_statement = ''
-
-        if select_condition.get('couponId', None):
-            condition_statement += f" AND coupons.id = {int(select_condition['couponId'])}"
-            
-        if select_condition.get('couponName', None):
-            condition_statement += f" AND coupons.coupon_name LIKE '%{select_condition['couponName']}%'"
-
-        if select_condition.get('validationStartFrom', None):
-            condition_statement += f" AND coupons.validation_start_date >= '{select_condition['validationStartFrom']}' "
+        query += ' ORDER BY coupons.id DESC LIMIT :limit OFFSET :offset'
 
-        if select_condition.get('validationStartTo', None):
-            condition_statement += f" AND coupons.validation_start_date <= '{select_condition['validationStartTo']}' "
+        params = conditions.params
+        params['limit'] = COUPON_PAGE_SIZE
+        params['offset'] = (select_condition['page']-1) * COUPON_PAGE_SIZE
 
-        if select_condition.get('validationEndFrom', None):
-            condition_statement += f" AND coupons.validation_end_date >= '{select_condition['validationEndFrom']}' "
-
-        if select_condition.get('validationEndTo', None):
-            condition_statement += f" AND coupons.validation_end_date <= '{select_condition['validationEndTo']}' "
-
-        if select_condition.get('downloadStartFrom', None):
-            condition_statement += f" AND coupons.download_start_date >= '{select_condition['downloadStartFrom']}' "
-
-        if select_condition.get('downloadStartTo', None):
-            condition_statement += f" AND coupons.download_start_date <= '{select_condition['downloadStartTo']}' "
-
-        if select_condition.get('downloadEndFrom', None):
-            condition_statement += f" AND coupons.download_end_date >= '{select_condition['downloadEndFrom']}' "
-
-        if select_condition.get('downloadEndTo', None):
-            condition_statement += f" AND coupons.download_end_date <= '{select_condition['downloadEndTo']}' "
-
-        if select_condition.get('issueTypeId', None):
-            condition_statement += f" AND coupons.issue_type_id = {select_condition['issueTypeId']}"
-
-        if select_condition['isLimited'] == 0:
-            condition_statement += f" AND coupons.is_limited = {select_condition['isLimited']}"
-        if select_condition['isLimited'] == 1:
-            condition_statement += f" AND coupons.is_limited = {select_condition['isLimited']}"
-
-        condition_statement += ' ORDER BY coupons.id DESC '
-
-        condition_statement += f" LIMIT 10 OFFSET {(select_condition['page']-1) * 10} "
-
-        query += condition_statement
-
-        
         # query 실행
-        rows = session.execute(query).fetchall()
+        rows = session.execute(cached_text(query), params).fetchall()
+
+        # 발급유형명은 기준 정보 캐시에서 찾는다.
+        coupon_list = []
+        for row in rows:
+            coupon_info = serializer(row) if serializer else dict(row)
+            coupon_info['issue_type_name'] = reference_cache.name(
+                'coupon_issue_types', coupon_info.pop('issue_type_id'), 'issue_type_name', session)
+            coupon_list.append(coupon_info)
 
-        return rows
+        return coupon_list
 
     def select_coupon_detail(self, coupon_id, session):
         """
@@ -1,116 +1,48 @@
-class OrderDao:
-
-    def select_orders_count(self, select_condition, session):
-        """
-        주문 갯수 조회
-            인자로 받은 검색조건들을 만족하는 주문들의 갯수를 구합니다.
-
-        args :
-            select_condition : 주문 검색에 필요한 조건들
-            session          : connection 형성된 session 객체
-
-        returns :
-            검색조건에 해당하는 주문 갯수
-
-        Authors:
-            eymin1259@gmail.com 이용민
-
-        History:
-            2020-10-08 (이용민) : 초기 생성
-        """
-
-        # 검색 필터 조건 적용 전 쿼리문
-        query = """ SELECT 
-                        count(orders.id)
-
-                    FROM orders
-
-                    INNER JOIN order_item_info AS oi_info
-                    ON oi_info.order_id = orders.id
-                    AND oi_info.end_date = '9999-12-31 23:59:59'   
-
-                    INNER JOIN product_info AS p_info 
-                    ON p_info.product_id = oi_info.product_id
-                    AND p_info.is_deleted = 0 
-
-                    INNER JOIN seller_info AS s_info 
-                    ON s_info.seller_id = p_info.seller_id   
-                    AND s_info.end_date = '9999-12-31 23:59:59'
-                """
+from sqlalchemy import text, bindparam
+
+from model.query_util import select_list_with_count, refresh_current_snapshot, ConditionBuilder
+from model.reference_dao import reference_cache
+
+# 정렬기준별 (정렬 컬럼, 조회결과의 정렬값 키, 정렬 방향)
+ORDER_SORT_KEYS = {
+    'NEW'                   : ('orders.payment_date', 'payment_date', 'DESC'),                         # 결제일 최신일순
+    'OLD'                   : ('orders.payment_date', 'payment_date', 'ASC'),                          # 결제일 오래된순
+    'NEW_DELIVERY'          : ('oi_info.shipping_start_date', 'shipping_start_date', 'DESC'),          # 배송시작 최신일순
+    'OLD_DELIVERY'          : ('oi_info.shipping_start_date', 'shipping_start_date', 'ASC'),           # 배송시작 역순
+    'NEW_DELIVERY_COMPLETE' : ('oi_info.shipping_complete_date', 'shipping_complete_date', 'DESC'),    # 배송완료 최신일순
+    'OLD_DELIVERY_COMPLETE' : ('oi_info.shipping_complete_date', 'shipping_complete_date', 'ASC'),     # 배송완료 역순
+    'NEW_REQUEST_REFUND'    : ('oi_info.refund_request_date', 'refund_request_date', 'DESC'),          # 최신환불요청일순
+    'OLD_REQUEST_REFUND'    : ('oi_info.refund_request_date', 'refund_request_date', 'ASC'),           # 환불요청일의 역순
+    'NEW_REFUND_COMPLETE'   : ('oi_info.refund_complete_date', 'refund_complete_date', 'DESC'),        # 최신환불완료일순
+    'OLD_REFUND_COMPLETE'   : ('oi_info.refund_complete_date', 'refund_complete_date', 'ASC'),         # 환불완료일의 역순
+    'NEW_CANCEL_COMPLETE'   : ('oi_info.complete_cancellation_date', 'complete_cancellation_date', 'DESC'),  # 최신 주문취소완료일순
+    'OLD_CANCEL_COMPLETE'   : ('oi_info.complete_cancellation_date', 'complete_cancellation_date', 'ASC')    # 주문취소완료일의 역순
+}
+
+# 주문 검색조건별 ngram FULLTEXT 인덱스가 있는 검색 컬럼
+ORDER_KEYWORD_COLUMNS = {
+    'C_ORDER_DETAIL_CD' : 'oi_info.order_detail_id',    # 주문상세번호
+    'C_ORDER_NAME'      : 'orders.orderer_name',        # 주문자명
+    'C_ORDER_TELNO'     : 'orders.orderer_phone',       # 핸드폰번호
+    'C_MD_KO_NAME'      : 's_info.korean_name',         # 셀러명
+    'C_PRODUCT_NAME'    : 'p_info.name'                 # 상품명
+}
 
-        # 검색 조건 검사
-        condition_statement = ''
 
-        # 주문 상태 조건
-        # 1 : 결제완료, 2 : 상품준비중, 3 : 배송중, 4 : 배송완료, 5 : 환불요청, 6 : 환불완료, 7 : 주문취소완료
-        condition_statement += f"WHERE oi_info.order_status_id = {select_condition['orderStatus']}"
-
-        # 검색조건
-        if select_condition.get('selectFilter', None):
-            # 주문번호
-            if select_condition['selectFilter'] == 'C_ORDER_CD':
-                condition_statement += f" AND oi_info.order_id LIKE '%{select_condition['filterKeyword']}%'"
-            # 주문상세번호
-            elif select_condition['selectFilter'] == 'C_ORDER_DETAIL_CD':
-                condition_statement += f" AND oi_info.order_detail_id LIKE '%{select_condition['filterKeyword']}%'"
-            # 주문자명
-            elif select_condition['selectFilter'] == 'C_ORDER_NAME':
-                condition_statement += f" AND orders.orderer_name LIKE '%{select_condition['filterKeyword']}%'"
-            # 핸드폰번호
-            elif select_condition['selectFilter'] == 'C_ORDER_TELNO':
-                condition_statement += f" AND orders.orderer_phone LIKE '%{select_condition['filterKeyword']}%'"
-            # 셀러명
-            elif select_condition['selectFilter'] == 'C_MD_KO_NAME':
-                condition_statement += f" AND s_info.korean_name LIKE '%{select_condition['filterKeyword']}%'"
-            # 상품명
-            elif select_condition['selectFilter'] == 'C_PRODUCT_NAME':
-                condition_statement += f" AND p_info.name LIKE '%{select_condition['filterKeyword']}%'"
-
-        # 운송장번호 검색
-        if select_condition.get('filterDeliveryNumber', None):
-            condition_statement += f" oi_info.shipping_number LIKE '%{select_condition['filterDeliveryNumber']}%'"
-
-        # 환불사유
-        if select_condition.get('filterRefndReason', None):
-            condition_statement += f" AND oi_info.refund_reason_id = {select_condition['filterRefndReason']}"
-
-        # 주문취소사유
-        if select_condition.get('filterCancelReason', None):
-            condition_statement += f" AND oi_info.cancel_reason_id = {select_condition['filterCancelReason']}"
-
-        # 주문완료일 조건 : 시작구간
-        if select_condition.get('filterDateFrom', None):
-            condition_statement += f" AND orders.payment_date >= '{select_condition['filterDateFrom']}'"
-
-        # 주문완료일 조건 : 종료구간
-        if select_condition.get('filterDateTo', None):
-            condition_statement += f" AND orders.payment_date <= '{select_condition['filterDateTo']}'"
-
-        # 셀러속성 필터조건
-        if select_condition.get('mdSeNo', None):
-            if len(select_condition['mdSeNo']) == 1:
-                condition_statement += f" AND s_info.seller_attribute_id = {select_condition['mdSeNo']}"
-            else:
-                tupled_mdSeNo = tuple(select_condition['mdSeNo'])
-                condition_statement += f" AND s_info.seller_attribute_id IN {tupled_mdSeNo}"
-
-        query += condition_statement
-
-        # query 실행
-        res = session.execute(query).fetchone()[0]
-        return res
+class OrderDao:
 
-    def select_orders(self, select_condition, session):
+    def select_orders(self, select_condition, session, serializer=None):
         """
         주문 조회
-            인자로 받은 주문 검색 조건들을 만족하는 주문들을 데이터베이스에소 조회합니다
+            인자로 받은 주문 검색 조건들을 만족하는 주문들과 전체 주문 갯수를 데이터베이스에소 조회합니다
 
         args :
             select_condition : 주문 검색에 필요한 조건들
             session          : connection 형성된 session 객체
+            serializer       : 주문 row 를 응답 dict 로 변환하는 serializer.RowSerializer (없으면 dict(row))
 
         returns :
-            검색조건에 해당하는 주문정보 리스트
+            검색조건에 해당하는 주문정보 리스트, 주문 갯수 (skipCount 이거나 커서로 조회한 경우 None)
 
         Authors:
             eymin1259@gmail.com 이용민
@@ -119,6 +51,12 @@ class OrderDao:
             2020-09-23 (이용민) : 초기 생성
             2020-09-26 (이용민) : mysql optimizer가 key를 이용하여 JOIN 하도록 JOIN문 수정
             2020-09-26 (이용민) : 값이 None인지 아닌지 판별하는 if문에서 함수를 사용하여 판별
+            2026-10-18 (이용민) : 커서 기반 페이지네이션 추가, 정렬기준을 ORDER_SORT_KEYS로 통합
+            2026-10-18 (이용민) : select_orders_count를 통합하여 목록과 갯수를 한 번에 조회
+            2026-10-18 (이용민) : 이력 테이블 대신 현재 상태 스냅샷 테이블 조회
+            2026-10-18 (이용민) : 키워드 검색을 LIKE 대신 ngram FULLTEXT 인덱스로 조회
+            2026-10-18 (이용민) : 검색 조건 값을 쿼리문에 넣지 않고 ConditionBuilder 로 바인딩, 운송장번호 조건 AND 누락 수정
+            2026-10-18 (이용민) : serializer 로 row 를 응답 dict 로 바로 변환
         """
 
         # 검색 필터 조건 적용 전 쿼리문
@@ -148,127 +86,124 @@ class OrderDao:
 
                     FROM orders
 
-                    INNER JOIN order_item_info AS oi_info
+                    INNER JOIN order_item_info_current AS oi_info
                     ON oi_info.order_id = orders.id
-                    AND oi_info.end_date = '9999-12-31 23:59:59'   
 
-                    INNER JOIN product_info AS p_info 
+                    INNER JOIN product_info_current AS p_info 
                     ON p_info.product_id = oi_info.product_id
-                    AND p_info.is_deleted = 0 
 
-                    INNER JOIN seller_info AS s_info 
+                    INNER JOIN seller_info_current AS s_info 
                     ON s_info.seller_id = p_info.seller_id   
-                    AND s_info.end_date = '9999-12-31 23:59:59'
                 """
 
-        # 검색 조건 검사
-        condition_statement = ''
+        # 검색 조건 : 값은 모두 바인딩하여 같은 검색 조건 조합은 같은 쿼리문이 되도록 한다.
+        conditions = ConditionBuilder()
 
         # 주문 상태 조건
         # 1 : 결제완료, 2 : 상품준비중, 3 : 배송중, 4 : 배송완료, 5 : 환불요청, 6 : 환불완료, 7 : 주문취소완료
-        condition_statement += f"WHERE oi_info.order_status_id = {select_condition['orderStatus']}"
+        conditions.add("oi_info.order_status_id = :orderStatus", orderStatus=select_condition['orderStatus'])
 
         # 검색조건
         if select_condition.get('selectFilter', None):
             # 주문번호
             if select_condition['selectFilter'] == 'C_ORDER_CD':
-                condition_statement += f" AND oi_info.order_id LIKE '%{select_condition['filterKeyword']}%'"
-            # 주문상세번호
-            elif select_condition['selectFilter'] == 'C_ORDER_DETAIL_CD':
-                condition_statement += f" AND oi_info.order_detail_id LIKE '%{select_condition['filterKeyword']}%'"
-            # 주문자명
-            elif select_condition['selectFilter'] == 'C_ORDER_NAME':
-                condition_statement += f" AND orders.orderer_name LIKE '%{select_condition['filterKeyword']}%'"
-            # 핸드폰번호
-            elif select_condition['selectFilter'] == 'C_ORDER_TELNO':
-                condition_statement += f" AND orders.orderer_phone LIKE '%{select_condition['filterKeyword']}%'"
-            # 셀러명
-            elif select_condition['selectFilter'] == 'C_MD_KO_NAME':
-                condition_statement += f" AND s_info.korean_name LIKE '%{select_condition['filterKeyword']}%'"
-            # 상품명
-            elif select_condition['selectFilter'] == 'C_PRODUCT_NAME':
-                condition_statement += f" AND p_info.name LIKE '%{select_condition['filterKeyword']}%'"
+                conditions.add_like('oi_info.order_id', 'filterKeyword', select_condition['filterKeyword'])
+            # 주문상세번호, 주문자명, 핸드폰번호, 셀러명, 상품명 : ngram FULLTEXT 인덱스로 검색
+            elif select_condition['selectFilter'] in ORDER_KEYWORD_COLUMNS:
+                conditions.add_keyword(
+                    ORDER_KEYWORD_COLUMNS[select_condition['selectFilter']],
+                    'filterKeyword', select_condition['filterKeyword'])
 
         # 운송장번호 검색
         if select_condition.get('filterDeliveryNumber', None):
-            condition_statement += f" oi_info.shipping_number LIKE '%{select_condition['filterDeliveryNumber']}%'"
+            conditions.add_like('oi_info.shipping_number', 'filterDeliveryNumber', select_condition['filterDeliveryNumber'])
 
         # 환불사유
         if select_condition.get('filterRefndReason', None):
-            condition_statement += f" AND oi_info.refund_reason_id = {select_condition['filterRefndReason']}"
+            conditions.add("oi_info.refund_reason_id = :filterRefndReason", filterRefndReason=select_condition['filterRefndReason'])
 
         # 주문취소사유
         if select_condition.get('filterCancelReason', None):
-            condition_statement += f" AND oi_info.cancel_reason_id = {select_condition['filterCancelReason']}"
+            conditions.add("oi_info.cancel_reason_id = :filterCancelReason", filterCancelReason=select_condition['filterCancelReason'])
 
         # 주문완료일 조건 : 시작구간
         if select_condition.get('filterDateFrom', None):
-            condition_statement += f" AND orders.payment_date >= '{select_condition['filterDateFrom']}'"
+            conditions.add("orders.payment_date >= :filterDateFrom", filterDateFrom=select_condition['filterDateFrom'])
 
         # 주문완료일 조건 : 종료구간
         if select_condition.get('filterDateTo', None):
-            condition_statement += f" AND orders.payment_date <= '{select_condition['filterDateTo']}'"
+            conditions.add("orders.payment_date <= :filterDateTo", filterDateTo=select_condition['filterDateTo'])
 
         # 셀러속성 필터조건
         if select_condition.get('mdSeNo', None):
-            if len(select_condition['mdSeNo']) == 1:
-                condition_statement += f" AND s_info.seller_attribute_id = {select_condition['mdSeNo']}"
-            else:
-                tupled_mdSeNo = tuple(select_condition['mdSeNo'])
-                condition_statement += f" AND s_info.seller_attribute_id IN {tupled_mdSeNo}"
-
-        # 정렬기준
-        # 결제일 최신일순
-        if select_condition['filterOrder'] == 'NEW':
-            condition_statement += " ORDER BY orders.payment_date DESC"
-        # 결제일 오래된순
-        elif select_condition['filterOrder'] == 'OLD':
-            condition_statement += " ORDER BY orders.payment_date ASC"
-        # 배송시작 최신일순
-        elif select_condition['filterOrder'] == 'NEW_DELIVERY':
-            condition_statement += " ORDER BY oi_info.shipping_start_date DESC"
-        # 배송시작 역순
-        elif select_condition['filterOrder'] == 'OLD_DELIVERY':
-            condition_statement += " ORDER BY oi_info.shipping_start_date ASC"
-        # 배송완료 최신일순
-        elif select_condition['filterOrder'] == 'NEW_DELIVERY_COMPLETE':
-            condition_statement += " ORDER BY oi_info.shipping_complete_date DESC"
-        # 배송완료 역순
-        elif select_condition['filterOrder'] == 'OLD_DELIVERY_COMPLETE':
-            condition_statement += " ORDER BY oi_info.shipping_complete_date ASC"
-        # 최신환불요청일순
-        elif select_condition['filterOrder'] == 'NEW_REQUEST_REFUND':
-            condition_statement += " ORDER BY oi_info.refund_request_date DESC"
-        # 환불요청일의 역순
-        elif select_condition['filterOrder'] == 'OLD_REQUEST_REFUND':
-            condition_statement += " ORDER BY oi_info.refund_request_date ASC"
-        # 최신환불완료일순
-        elif select_condition['filterOrder'] == 'NEW_REFUND_COMPLETE':
-            condition_statement += " ORDER BY oi_info.refund_complete_date DESC"
-        # 환불완료일의 역순
-        elif select_condition['filterOrder'] == 'OLD_REFUND_COMPLETE':
-            condition_statement += " ORDER BY oi_info.refund_complete_date ASC"
-        # 최신 주문취소완료일순
-        elif select_condition['filterOrder'] == 'NEW_CANCEL_COMPLETE':
-            condition_statement += " ORDER BY oi_info.complete_cancellation_date DESC"
-        # 주문취소완료일의 역순
-        elif select_condition['filterOrder'] == 'OLD_CANCEL_COMPLETE':
-            condition_statement += " ORDER BY oi_info.complete_cancellation_date ASC"
-
-        # 페이지네이션
+            conditions.add_in('s_info.seller_attribute_id', 'mdSeNo', select_condition['mdSeNo'])
+
+        # 정렬기준 : 정렬 컬럼과 방향, 동일한 정렬값을 가진 주문은 주문상세 id로 순서를 고정
+        sort_column, _, sort_direction = ORDER_SORT_KEYS.get(select_condition['filterOrder'], ORDER_SORT_KEYS['NEW'])
+
+        # 커서 기반 페이지네이션 : 이전 페이지 마지막 주문의 (정렬값, 주문상세 id) 다음부터 바로 조회
+        if select_condition.get('cursor', None):
+            cursor_value, cursor_id = select_condition['cursor']
+            conditions.add(self._seek_condition(sort_column, sort_direction, cursor_value),
+                           cursor_value=cursor_value, cursor_id=cursor_id)
+
+        query += conditions.where()
+        params = conditions.params
+
+        # 정렬, 페이지네이션
+        tail = f" ORDER BY {sort_column} {sort_direction}, oi_info.id {sort_direction}"
+
         if select_condition.get('filterLimit', None):
-            if select_condition.get('page', None):
-                offset = (select_condition['page']-1) * select_condition['filterLimit']
-                condition_statement += f" LIMIT {select_condition['filterLimit']} OFFSET {offset}"
+            params['filterLimit'] = select_condition['filterLimit']
+
+            # 커서가 전달된 경우 OFFSET 없이 LIMIT 만 적용
+            if select_condition.get('page', None) and not select_condition.get('cursor', None):
+                params['offset'] = (select_condition['page']-1) * select_condition['filterLimit']
+                tail += " LIMIT :filterLimit OFFSET :offset"
             else:
-                condition_statement += f" LIMIT {select_condition['filterLimit']}"
+                tail += " LIMIT :filterLimit"
 
-        query += condition_statement
+        # 커서로 조회한 경우 남은 주문만 세어지므로 갯수를 구하지 않음 (첫 페이지 조회 시 받은 갯수 사용)
+        skip_count = bool(select_condition.get('skipCount', None) or select_condition.get('cursor', None))
 
         # query 실행
-        rows = session.execute(query).fetchall()
+        return select_list_with_count(query, tail, params, session, skip_count, conditions.expanding, serializer)
+
+    def _seek_condition(self, sort_column, sort_direction, cursor_value):
+        """
+        커서 기반 페이지네이션 조건문 생성
+            (정렬값, 주문상세 id) 기준으로 커서 이후의 주문만 조회하는 조건문을 반환합니다.
+            mysql은 NULL을 가장 작은 값으로 정렬하므로 정렬값이 NULL인 주문은
+            오름차순에서는 맨 앞, 내림차순에서는 맨 뒤에 위치합니다.
+
+        args :
+            sort_column    : 정렬 컬럼
+            sort_direction : 정렬 방향 (ASC / DESC)
+            cursor_value   : 이전 페이지 마지막 주문의 정렬값
+
+        returns :
+            :cursor_value, :cursor_id 를 바인딩하는 조건문
+
+        Authors:
+            eymin1259@gmail.com 이용민
 
-        return rows
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        comparator = '<' if sort_direction == 'DESC' else '>'
+        same_value_condition = f"({sort_column} = :cursor_value AND oi_info.id {comparator} :cursor_id)"
+
+        # 내림차순 : 정렬값이 NULL인 주문은 마지막에 위치
+        if sort_direction == 'DESC':
+            if cursor_value is None:
+                return f"({sort_column} IS NULL AND oi_info.id < :cursor_id)"
+            return f"({sort_column} < :cursor_value OR {same_value_condition} OR {sort_column} IS NULL)"
+
+        # 오름차순 : 정렬값이 NULL인 주문은 처음에 위치
+        if cursor_value is None:
+            return f"(({sort_column} IS NULL AND oi_info.id > :cursor_id) OR {sort_column} IS NOT NULL)"
+        return f"({sort_column} > :cursor_value OR {same_value_condition})"
 
     def select_order_detatil_info(self, order_item_id, session):
         """
@@ -287,6 +222,8 @@ class OrderDao:
 
         History:
             2020-09-28 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 이력 테이블 대신 현재 상태 스냅샷 테이블 조회
+            2026-10-18 (이용민) : 주문상태명을 order_status JOIN 대신 기준 정보 캐시에서 조회
         """
 
         # 검색 필터 조건 적용 전 쿼리문
@@ -320,24 +257,18 @@ class OrderDao:
                         oi_info.refund_reason_id,
                         oi_info.cancel_reason_id,
                         oi_info.refund_amount,
-                        order_status.status_name AS order_status_name
+                        oi_info.order_status_id
 
                     FROM orders
 
-                    INNER JOIN order_item_info AS oi_info
+                    INNER JOIN order_item_info_current AS oi_info
                     ON oi_info.order_id = orders.id
-                    AND oi_info.end_date = '9999-12-31 23:59:59'   
 
-                    INNER JOIN product_info AS p_info 
+                    INNER JOIN product_info_current AS p_info 
                     ON p_info.product_id = oi_info.product_id
-                    AND p_info.is_deleted = 0 
                     
-                    INNER JOIN seller_info AS s_info 
+                    INNER JOIN seller_info_current AS s_info 
                     ON s_info.seller_id = p_info.seller_id   
-                    AND s_info.end_date = '9999-12-31 23:59:59'
-
-                    INNER JOIN order_status
-                    ON order_status.id = oi_info.order_status_id
 
                     WHERE oi_info.order_detail_id = :order_item_id                    
             """
@@ -345,7 +276,58 @@ class OrderDao:
         # query 실행
         row = session.execute(
             query, {'order_item_id': order_item_id}).fetchone()
-        return row
+
+        if row is None:
+            return None
+
+        # 주문상태명은 기준 정보 캐시에서 찾는다.
+        order_detail_info = dict(row)
+        order_detail_info['order_status_name'] = reference_cache.name(
+            'order_status', order_detail_info.pop('order_status_id'), 'status_name', session)
+
+        return order_detail_info
+
+    def select_order_detail_version(self, order_item_id, session):
+        """
+        주문상세정보 version 조회 로직
+            주문상태가 바뀌면 현재 이력 row 가 새로 생성되므로 row 의 id 와 시작시간을 version 으로 사용합니다.
+            주문정보/주문상세정보 수정은 이력을 만들지 않고 row 를 직접 수정하므로 수정 가능한 컬럼도 version 에 포함합니다.
+            상세정보 조회의 상품, 셀러 JOIN 없이 주문상세번호와 주문번호로만 조회합니다.
+
+        args :
+            order_item_id : 주문상세번호
+            session       : connection 형성된 session 객체
+
+        returns :
+            주문상세정보 version 튜플, 주문이 없으면 None
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        query = """ SELECT 
+                        oi_info.id,
+                        oi_info.start_date,
+                        oi_info.shipping_company,
+                        oi_info.shipping_number,
+                        oi_info.bank,
+                        oi_info.account_number,
+                        oi_info.account_holder,
+                        orders.orderer_phone,
+                        orders.receiver_phone,
+                        orders.receiver_address
+                    FROM order_item_info_current AS oi_info
+                    INNER JOIN orders
+                    ON orders.id = oi_info.order_id
+                    WHERE oi_info.order_detail_id = :order_item_id
+                """
+
+        row = session.execute(query, {'order_item_id': order_item_id}).fetchone()
+
+        return tuple(row) if row else None
 
     def select_order_histories(self, order_id, session):
         """
@@ -364,20 +346,23 @@ class OrderDao:
 
         History:
             2020-09-24 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문상태명을 order_status JOIN 대신 기준 정보 캐시에서 조회
         """
 
         query = """ SELECT 
-                        order_status.status_name AS order_status,
+                        order_item_info.order_status_id,
                         order_item_info.start_date AS update_date
                     FROM order_item_info
-                    INNER JOIN order_status
-                    ON order_item_info.order_status_id = order_status.id
                     WHERE order_item_info.order_id = :order_id
                 """
         # query 실행
         rows = session.execute(query, {'order_id': order_id}).fetchall()
 
-        return rows
+        # 주문상태명은 기준 정보 캐시에서 찾는다.
+        return [{
+            'order_status': reference_cache.name('order_status', row['order_status_id'], 'status_name', session),
+            'update_date': row['update_date']
+        } for row in rows]
 
     def update_order_info(self, changement, session):
         """
@@ -434,6 +419,7 @@ class OrderDao:
 
         History:
             2020-09-28 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 현재 상태 스냅샷(order_item_info_current) 갱신 추가
         """
 
         query = """ UPDATE
@@ -470,146 +456,228 @@ class OrderDao:
             'shipping_number': changement['shippingNumber'],
             'order_item_info_id': changement['orderItemId']})
 
-    def end_record(self, cancel_order, updated_at, session):
+        # 현재 상태 스냅샷 갱신
+        refresh_current_snapshot('order_item_info', [changement['orderItemId']], session, key_column='id')
+
+    def select_current_order_items(self, order_item_ids, session):
         """
-        주문 선분이력 종료 처리 로직
-            주어진 주문상세번호에 해당하는 최신상태 주문의 선분이력을 종료처리하는 엔드포인트 입니다.
+        현재 이력 주문 조회 로직
+            주어진 주문상세번호들 중 현재 이력(선분이력이 종료되지 않은 row)이 존재하는 주문상세번호를 조회합니다.
+            이력 종료 전 다른 트랜잭션이 같은 주문을 변경하지 못하도록 row에 lock을 겁니다.
 
         args :
-            cancel_order : 취소할 주문의 주문상세번호 및 취소내용이 담긴 딕셔너리
-            updated_at   : 로직이 실행되는 시간
+            order_item_ids : 주문상세번호 리스트
+            session        : connection 형성된 session 객체
+
+        returns :
+            현재 이력이 존재하는 주문상세번호 set
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        query = text(""" SELECT
+                            order_detail_id
+                        FROM
+                            order_item_info
+                        WHERE
+                            order_detail_id IN :order_item_ids
+                            AND end_date = '9999-12-31 23:59:59'
+                        FOR UPDATE
+                    """).bindparams(bindparam('order_item_ids', expanding=True))
+
+        rows = session.execute(query, {'order_item_ids': order_item_ids}).fetchall()
+
+        return {row['order_detail_id'] for row in rows}
+
+    def end_records(self, order_item_ids, updated_at, session):
+        """
+        주문 선분이력 일괄 종료 처리 로직
+            주어진 주문상세번호들에 해당하는 최신상태 주문의 선분이력을 하나의 UPDATE 문으로 종료처리합니다.
+
+        args :
+            order_item_ids : 이력을 종료할 주문상세번호 리스트
+            updated_at     : 로직이 실행되는 시간
 
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-09-29 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문 여러개를 한번에 종료처리하도록 변경, is_deleted 컬럼명 오타 수정
         """
 
-        query = """ UPDATE 
-                        order_item_info 
-                    SET 
-                        end_date = :updated_at, 
-                        is_deletd = 1
-                    WHERE 
-                        order_item_info.order_detail_id = :order_item_id
-                        AND is_delete = 0
-                """
+        query = text(""" UPDATE 
+                            order_item_info 
+                        SET 
+                            end_date = :updated_at, 
+                            is_deleted = 1
+                        WHERE 
+                            order_item_info.order_detail_id IN :order_item_ids
+                            AND end_date = '9999-12-31 23:59:59'
+                    """).bindparams(bindparam('order_item_ids', expanding=True))
+
         session.execute(query, {
             'updated_at': updated_at,
-            'order_item_id': cancel_order['order_item_id']})
+            'order_item_ids': order_item_ids})
 
-    def insert_new_status_order_item(self, next_status_order, updated_at, session):
+    def _order_item_values(self, order_list, columns):
         """
-        주문상태변경 선분이력 생성 로직
-            해당 주문상세번호에 전달받은 주문상태로 새로운 row를 생성합니다.        
+        주문별 변경내용 derived table 생성 로직
+            주문마다 다른 값(주문취소이유, 환불금액 등)을 INSERT ... SELECT 에서 JOIN 할 수 있도록
+            SELECT ... UNION ALL SELECT ... 형태의 derived table 쿼리문과 바인딩할 값을 생성합니다.
 
         args :
-            next_status_order : 변경할 주문의 주문상세번호 및 변경내용이 담긴 딕셔너리
-            updated_at        : 이력 수정시간
+            order_list : 주문상세번호 및 변경내용이 담긴 딕셔너리 리스트
+            columns    : derived table 의 컬럼으로 사용할 딕셔너리 key 리스트
+
+        returns :
+            derived table 쿼리문, 쿼리에 바인딩할 값
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        select_statements = []
+        params = {}
+
+        for idx, order in enumerate(order_list):
+            select_columns = []
+            for column in columns:
+                params[f'{column}_{idx}'] = order[column]
+                select_columns.append(f':{column}_{idx} AS {column}')
+            select_statements.append('SELECT ' + ', '.join(select_columns))
+
+        return ' UNION ALL '.join(select_statements), params
+
+    def insert_new_status_order_items(self, order_item_ids, next_order_status_id, updated_at, session):
+        """
+        주문상태변경 선분이력 일괄 생성 로직
+            주어진 주문상세번호들에 전달받은 주문상태로 새로운 row를 하나의 INSERT ... SELECT 문으로 생성합니다.
+
+        args :
+            order_item_ids       : 변경할 주문의 주문상세번호 리스트
+            next_order_status_id : 변경할 주문상태
+            updated_at           : 이력 수정시간
 
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-10-02 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문 여러개의 이력을 한번에 생성하도록 변경
+            2026-10-18 (이용민) : 현재 상태 스냅샷(order_item_info_current) 갱신 추가
         """
 
-        query = """ INSERT INTO 
-                        order_item_info 
-                            (
-                                order_detail_id,
-                                order_id,
-                                order_status_id,
-                                product_id,
-                                price,
-                                option_color,
-                                option_size,
-                                option_additional_price,
-                                units,
-                                discount_price,
-                                shipping_start_date,
-                                shipping_complete_date,
-                                shipping_company,
-                                shipping_number,
-                                is_confirm_order,
-                                refund_request_date,
-                                refund_complete_date,
-                                refund_reason_id,
-                                refund_amount,
-                                refund_shipping_fee,
-                                detail_reason,
-                                bank,
-                                account_holder,
-                                account_number,
-                                cancel_reason_id,
-                                complete_cancellation_date,
-                                start_date,
-                                end_date,
-                                modifier_id
-                            )
-                    SELECT 
-                        order_detail_id,
-                        order_id,
-                        :order_status_id,
-                        product_id,
-                        price,
-                        option_color,
-                        option_size,
-                        option_additional_price,
-                        units,
-                        discount_price,
-                        shipping_start_date,
-                        shipping_complete_date,
-                        shipping_company,
-                        shipping_number,
-                        is_confirm_order,
-                        refund_request_date,
-                        refund_complete_date,
-                        refund_reason_id,
-                        refund_amount,
-                        refund_shipping_fee,
-                        detail_reason,
-                        bank,
-                        account_holder,
-                        account_number,
-                        cancel_reason_id,
-                        complete_cancellation_date,
-                        :updated_at,
-                        '9999-12-31 23:59:59',
-                        modifier_id
-                    FROM
-                        order_item_info
-                    WHERE
-                        order_item_info.order_detail_id = :order_item_id
-                        AND end_date = :updated_at
-                        AND is_deletd = 1
-                """
+        query = text(""" INSERT INTO 
+                            order_item_info 
+                                (
+                                    order_detail_id,
+                                    order_id,
+                                    order_status_id,
+                                    product_id,
+                                    price,
+                                    option_color,
+                                    option_size,
+                                    option_additional_price,
+                                    units,
+                                    discount_price,
+                                    shipping_start_date,
+                                    shipping_complete_date,
+                                    shipping_company,
+                                    shipping_number,
+                                    is_confirm_order,
+                                    refund_request_date,
+                                    refund_complete_date,
+                                    refund_reason_id,
+                                    refund_amount,
+                                    refund_shipping_fee,
+                                    detail_reason,
+                                    bank,
+                                    account_holder,
+                                    account_number,
+                                    cancel_reason_id,
+                                    complete_cancellation_date,
+                                    start_date,
+                                    end_date,
+                                    modifier_id
+                                )
+                        SELECT 
+                            order_detail_id,
+                            order_id,
+                            :order_status_id,
+                            product_id,
+                            price,
+                            option_color,
+                            option_size,
+                            option_additional_price,
+                            units,
+                            discount_price,
+                            shipping_start_date,
+                            shipping_complete_date,
+                            shipping_company,
+                            shipping_number,
+                            is_confirm_order,
+                            refund_request_date,
+                            refund_complete_date,
+                            refund_reason_id,
+                            refund_amount,
+                            refund_shipping_fee,
+                            detail_reason,
+                            bank,
+                            account_holder,
+                            account_number,
+                            cancel_reason_id,
+                            complete_cancellation_date,
+                            :updated_at,
+                            '9999-12-31 23:59:59',
+                            modifier_id
+                        FROM
+                            order_item_info
+                        WHERE
+                            order_item_info.order_detail_id IN :order_item_ids
+                            AND end_date = :updated_at
+                            AND is_deleted = 1
+                    """).bindparams(bindparam('order_item_ids', expanding=True))
 
         session.execute(query, {
             'updated_at': updated_at,
-            'order_status_id': next_status_order['next_order_status_id'],
-            'order_item_id': next_status_order['order_item_id']
+            'order_status_id': next_order_status_id,
+            'order_item_ids': order_item_ids
         })
 
-    def insert_cancel_order_item(self, cancel_order, updated_at, session):
+        # 현재 상태 스냅샷 갱신
+        refresh_current_snapshot('order_item_info', order_item_ids, session)
+
+    def insert_cancel_order_items(self, cancel_order_list, updated_at, session):
         """
-        주문취소완료처리 선분이력 생성 로직
-            주어진 주문상세번호에 주문에 주문상태가 주문취소완료인 새로운 row를 생성합니다.        
+        주문취소완료처리 선분이력 일괄 생성 로직
+            주어진 주문들에 주문상태가 주문취소완료인 새로운 row를 하나의 INSERT ... SELECT 문으로 생성합니다.
+            주문별 취소이유는 derived table 과 JOIN 하여 적용합니다.
 
         args :
-            cancel_order : 취소할 주문의 주문상세번호 및 취소내용이 담긴 딕셔너리
-            updated_at   : 로직이 실행되는 시간
+            cancel_order_list : 취소할 주문의 주문상세번호 및 취소내용이 담긴 딕셔너리 리스트
+            updated_at        : 로직이 실행되는 시간
 
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-09-29 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문 여러개의 이력을 한번에 생성하도록 변경
+            2026-10-18 (이용민) : 현재 상태 스냅샷(order_item_info_current) 갱신 추가
         """
 
+        values_table, params = self._order_item_values(cancel_order_list, ['order_item_id', 'order_status_id', 'cancel_reason_id'])
+
         # 이전 상태를 복사하여 새로운 주문취소완료상태 주문 생성
-        query = """ INSERT INTO 
+        query = f""" INSERT INTO 
                         order_item_info 
                             (
                                 order_detail_id,
@@ -643,67 +711,76 @@ class OrderDao:
                                 modifier_id
                             )
                     SELECT 
-                        order_detail_id,
-                        order_id,
-                        :order_status_id,
-                        product_id,
-                        price,
-                        option_color,
-                        option_size,
-                        option_additional_price,
-                        units,
-                        discount_price,
-                        shipping_start_date,
-                        shipping_complete_date,
-                        shipping_company,
-                        shipping_number,
-                        is_confirm_order,
-                        refund_request_date,
-                        refund_complete_date,
-                        refund_reason_id,
-                        refund_amount,
-                        refund_shipping_fee,
-                        detail_reason,
-                        bank,
-                        account_holder,
-                        account_number,
-                        :cancel_reason_id,
+                        oi_info.order_detail_id,
+                        oi_info.order_id,
+                        changement.order_status_id,
+                        oi_info.product_id,
+                        oi_info.price,
+                        oi_info.option_color,
+                        oi_info.option_size,
+                        oi_info.option_additional_price,
+                        oi_info.units,
+                        oi_info.discount_price,
+                        oi_info.shipping_start_date,
+                        oi_info.shipping_complete_date,
+                        oi_info.shipping_company,
+                        oi_info.shipping_number,
+                        oi_info.is_confirm_order,
+                        oi_info.refund_request_date,
+                        oi_info.refund_complete_date,
+                        oi_info.refund_reason_id,
+                        oi_info.refund_amount,
+                        oi_info.refund_shipping_fee,
+                        oi_info.detail_reason,
+                        oi_info.bank,
+                        oi_info.account_holder,
+                        oi_info.account_number,
+                        changement.cancel_reason_id,
                         :updated_at,
                         :updated_at,
                         '9999-12-31 23:59:59',
-                        modifier_id
+                        oi_info.modifier_id
                     FROM
-                        order_item_info
+                        order_item_info AS oi_info
+                    INNER JOIN ({values_table}) AS changement
+                    ON changement.order_item_id = oi_info.order_detail_id
                     WHERE
-                        order_item_info.order_detail_id = :order_item_id
-                        AND end_date = :updated_at
-                        AND is_deletd = 1
+                        oi_info.end_date = :updated_at
+                        AND oi_info.is_deleted = 1
                 """
-        session.execute(query, {
-            'updated_at': updated_at,
-            'order_item_id': cancel_order['order_item_id'],
-            'order_status_id': cancel_order['order_status_id'],
-            'cancel_reason_id': cancel_order['cancel_reason_id']
-        })
 
-    def insert_refund_request_order_item(self, refund_request, updated_at, session):
+        params['updated_at'] = updated_at
+        session.execute(query, params)
+
+        # 현재 상태 스냅샷 갱신
+        refresh_current_snapshot('order_item_info', [order['order_item_id'] for order in cancel_order_list], session)
+
+    def insert_refund_request_order_items(self, refund_request_list, updated_at, session):
         """
-        환불요청 선분이력 생성 로직
-            해당 주문상세번호의 주문에 환불요청상태로 새로운 row를 생성합니다.        
+        환불요청 선분이력 일괄 생성 로직
+            주어진 주문들에 환불요청상태로 새로운 row를 하나의 INSERT ... SELECT 문으로 생성합니다.
+            주문별 환불이유, 환불금액, 상세 환불이유는 derived table 과 JOIN 하여 적용합니다.
 
         args :
-            refund_request : 환불요청할 주문의 주문상세번호 및 환불요청 내용이 담긴 딕셔너리
-            updated_at     : 이력 수정시간
+            refund_request_list : 환불요청할 주문의 주문상세번호 및 환불요청 내용이 담긴 딕셔너리 리스트
+            updated_at          : 이력 수정시간
 
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-10-02 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문 여러개의 이력을 한번에 생성하도록 변경
+            2026-10-18 (이용민) : 현재 상태 스냅샷(order_item_info_current) 갱신 추가
         """
 
+        values_table, params = self._order_item_values(
+            refund_request_list,
+            ['order_item_id', 'order_status_id', 'refund_reason_id', 'refund_amount', 'refund_detail_reason']
+        )
+
         # 이전 상태를 복사하여 새로운 주문환불요청상태 주문 생성
-        query = """ INSERT INTO 
+        query = f""" INSERT INTO 
                         order_item_info 
                             (
                                 order_detail_id,
@@ -737,58 +814,58 @@ class OrderDao:
                                 modifier_id
                             )
                     SELECT 
-                        order_detail_id,
-                        order_id,
-                        :order_status_id,
-                        product_id,
-                        price,
-                        option_color,
-                        option_size,
-                        option_additional_price,
-                        units,
-                        discount_price,
-                        shipping_start_date,
-                        shipping_complete_date,
-                        shipping_company,
-                        shipping_number,
-                        is_confirm_order,
+                        oi_info.order_detail_id,
+                        oi_info.order_id,
+                        changement.order_status_id,
+                        oi_info.product_id,
+                        oi_info.price,
+                        oi_info.option_color,
+                        oi_info.option_size,
+                        oi_info.option_additional_price,
+                        oi_info.units,
+                        oi_info.discount_price,
+                        oi_info.shipping_start_date,
+                        oi_info.shipping_complete_date,
+                        oi_info.shipping_company,
+                        oi_info.shipping_number,
+                        oi_info.is_confirm_order,
                         :updated_at,
-                        refund_complete_date,
-                        :refund_reason_id,
-                        :refund_amount,
-                        refund_shipping_fee,
-                        :refund_detail_reason,
-                        bank,
-                        account_holder,
-                        account_number,
-                        cancel_reason_id,
-                        complete_cancellation_date,
+                        oi_info.refund_complete_date,
+                        changement.refund_reason_id,
+                        changement.refund_amount,
+                        oi_info.refund_shipping_fee,
+                        changement.refund_detail_reason,
+                        oi_info.bank,
+                        oi_info.account_holder,
+                        oi_info.account_number,
+                        oi_info.cancel_reason_id,
+                        oi_info.complete_cancellation_date,
                         :updated_at,
                         '9999-12-31 23:59:59',
-                        modifier_id
+                        oi_info.modifier_id
                     FROM
-                        order_item_info
+                        order_item_info AS oi_info
+                    INNER JOIN ({values_table}) AS changement
+                    ON changement.order_item_id = oi_info.order_detail_id
                     WHERE
-                        order_item_info.order_detail_id = :order_item_id
-                        AND end_date = :updated_at
-                        AND is_deletd = 1
+                        oi_info.end_date = :updated_at
+                        AND oi_info.is_deleted = 1
                 """
-        session.execute(query, {
-            'updated_at': updated_at,
-            'order_item_id': refund_request['order_item_id'],
-            'order_status_id': refund_request['order_status_id'],
-            'refund_reason_id': refund_request['refund_reason_id'],
-            'refund_amount': refund_request['refund_amount'],
-            'refund_detail_reason': refund_request['refund_detail_reason']
-        })
 
-    def insert_refund_complete_order_item(self, refund_complete, updated_at, session):
+        params['updated_at'] = updated_at
+        session.execute(query, params)
+
+        # 현재 상태 스냅샷 갱신
+        refresh_current_snapshot('order_item_info', [order['order_item_id'] for order in refund_request_list], session)
+
+    def insert_refund_complete_order_items(self, order_item_ids, order_status_id, updated_at, session):
         """
-        환불완료 선분이력 생성 로직
-            해당 주문상세번호의 주문에 환불완료 상태로 새로운 row를 생성합니다.        
+        환불완료 선분이력 일괄 생성 로직
+            주어진 주문상세번호들에 환불완료 상태로 새로운 row를 하나의 INSERT ... SELECT 문으로 생성합니다.
 
         args :
-            refund_complete : 환불완료할 주문의 주문상세번호 및 환불완료 내용이 담긴 딕셔너리
+            order_item_ids  : 환불완료할 주문의 주문상세번호 리스트
+            order_status_id : 환불완료 주문상태
             updated_at      : 이력 수정시간
 
         Authors:
@@ -796,172 +873,322 @@ class OrderDao:
 
         History:
             2020-10-02 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문 여러개의 이력을 한번에 생성하도록 변경
+            2026-10-18 (이용민) : 현재 상태 스냅샷(order_item_info_current) 갱신 추가
         """
 
-        query = """ INSERT INTO 
-                        order_item_info 
-                            (
-                                order_detail_id,
-                                order_id,
-                                order_status_id,
-                                product_id,
-                                price,
-                                option_color,
-                                option_size,
-                                option_additional_price,
-                                units,
-                                discount_price,
-                                shipping_start_date,
-                                shipping_complete_date,
-                                shipping_company,
-                                shipping_number,
-                                is_confirm_order,
-                                refund_request_date,
-                                refund_complete_date,
-                                refund_reason_id,
-                                refund_amount,
-                                refund_shipping_fee,
-                                detail_reason,
-                                bank,
-                                account_holder,
-                                account_number,
-                                cancel_reason_id,
-                                complete_cancellation_date,
-                                start_date,
-                                end_date,
-                                modifier_id
-                            )
-                    SELECT 
-                        order_detail_id,
-                        order_id,
-                        :order_status_id,
-                        product_id,
-                        price,
-                        option_color,
-                        option_size,
-                        option_additional_price,
-                        units,
-                        discount_price,
-                        shipping_start_date,
-                        shipping_complete_date,
-                        shipping_company,
-                        shipping_number,
-                        is_confirm_order,
-                        refund_request_date,
-                        :updated_at,
-                        refund_reason_id,
-                        refund_amount,
-                        refund_shipping_fee,
-                        detail_reason,
-                        bank,
-                        account_holder,
-                        account_number,
-                        cancel_reason_id,
-                        complete_cancellation_date,
-                        :updated_at,
-                        '9999-12-31 23:59:59',
-                        modifier_id
-                    FROM
-                        order_item_info
-                    WHERE
-                        order_item_info.order_detail_id = :order_item_id
-                        AND end_date = :updated_at
-                        AND is_deletd = 1
-                """
+        query = text(""" INSERT INTO 
+                            order_item_info 
+                                (
+                                    order_detail_id,
+                                    order_id,
+                                    order_status_id,
+                                    product_id,
+                                    price,
+                                    option_color,
+                                    option_size,
+                                    option_additional_price,
+                                    units,
+                                    discount_price,
+                                    shipping_start_date,
+                                    shipping_complete_date,
+                                    shipping_company,
+                                    shipping_number,
+                                    is_confirm_order,
+                                    refund_request_date,
+                                    refund_complete_date,
+                                    refund_reason_id,
+                                    refund_amount,
+                                    refund_shipping_fee,
+                                    detail_reason,
+                                    bank,
+                                    account_holder,
+                                    account_number,
+                                    cancel_reason_id,
+                                    complete_cancellation_date,
+                                    start_date,
+                                    end_date,
+                                    modifier_id
+                                )
+                        SELECT 
+                            order_detail_id,
+                            order_id,
+                            :order_status_id,
+                            product_id,
+                            price,
+                            option_color,
+                            option_size,
+                            option_additional_price,
+                            units,
+                            discount_price,
+                            shipping_start_date,
+                            shipping_complete_date,
+                            shipping_company,
+                            shipping_number,
+                            is_confirm_order,
+                            refund_request_date,
+                            :updated_at,
+                            refund_reason_id,
+                            refund_amount,
+                            refund_shipping_fee,
+                            detail_reason,
+                            bank,
+                            account_holder,
+                            account_number,
+                            cancel_reason_id,
+                            complete_cancellation_date,
+                            :updated_at,
+                            '9999-12-31 23:59:59',
+                            modifier_id
+                        FROM
+                            order_item_info
+                        WHERE
+                            order_item_info.order_detail_id IN :order_item_ids
+                            AND end_date = :updated_at
+                            AND is_deleted = 1
+                    """).bindparams(bindparam('order_item_ids', expanding=True))
+
         session.execute(query, {
             'updated_at': updated_at,
-            'order_item_id': refund_complete['order_item_id'],
-            'order_status_id': refund_complete['order_status_id']
+            'order_item_ids': order_item_ids,
+            'order_status_id': order_status_id
         })
 
-    def restore_record(self, restore_order, updated_at, session):
+        # 현재 상태 스냅샷 갱신
+        refresh_current_snapshot('order_item_info', order_item_ids, session)
+
+    def restore_records(self, order_item_ids, restore_order_status_id, updated_at, session):
         """
-        이전 주문상태로 되돌리는 로직
-            updated_at 시간에 종료된 상태를 그 이전 상태로 되돌려 새로운 row를 생성합니다.
+        이전 주문상태로 일괄 되돌리는 로직
+            updated_at 시간에 종료된 상태들을 그 이전 상태로 되돌려 새로운 row를 하나의 INSERT ... SELECT 문으로 생성합니다.
 
         args :
-            restore_order   : 이전상태로 되돌릴 주문의 주문상세번호 및 주문상태정보가 담긴 딕셔너리
-            updated_at      : 이력 수정시간
+            order_item_ids          : 이전상태로 되돌릴 주문의 주문상세번호 리스트
+            restore_order_status_id : 되돌릴 주문상태
+            updated_at              : 이력 수정시간
 
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-10-06 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문 여러개의 이력을 한번에 생성하도록 변경
+            2026-10-18 (이용민) : 현재 상태 스냅샷(order_item_info_current) 갱신 추가
         """
 
-        query = """ INSERT INTO 
-                        order_item_info 
-                            (
-                                order_detail_id,
-                                order_id,
-                                order_status_id,
-                                product_id,
-                                price,
-                                option_color,
-                                option_size,
-                                option_additional_price,
-                                units,
-                                discount_price,
-                                shipping_start_date,
-                                shipping_complete_date,
-                                shipping_company,
-                                shipping_number,
-                                is_confirm_order,
-                                refund_request_date,
-                                refund_complete_date,
-                                refund_reason_id,
-                                refund_amount,
-                                refund_shipping_fee,
-                                detail_reason,
-                                bank,
-                                account_holder,
-                                account_number,
-                                cancel_reason_id,
-                                complete_cancellation_date,
-                                start_date,
-                                end_date,
-                                modifier_id
-                            )
-                    SELECT 
-                        order_detail_id,
-                        order_id,
-                        :order_status_id,
-                        product_id,
-                        price,
-                        option_color,
-                        option_size,
-                        option_additional_price,
-                        units,
-                        discount_price,
-                        shipping_start_date,
-                        shipping_complete_date,
-                        shipping_company,
-                        shipping_number,
-                        is_confirm_order,
-                        null,
-                        null,
-                        null,
-                        null,
-                        null,
-                        null,
-                        null,
-                        null,
-                        null,
-                        cancel_reason_id,
-                        complete_cancellation_date,
-                        :updated_at,
-                        '9999-12-31 23:59:59',
-                        modifier_id
+        query = text(""" INSERT INTO 
+                            order_item_info 
+                                (
+                                    order_detail_id,
+                                    order_id,
+                                    order_status_id,
+                                    product_id,
+                                    price,
+                                    option_color,
+                                    option_size,
+                                    option_additional_price,
+                                    units,
+                                    discount_price,
+                                    shipping_start_date,
+                                    shipping_complete_date,
+                                    shipping_company,
+                                    shipping_number,
+                                    is_confirm_order,
+                                    refund_request_date,
+                                    refund_complete_date,
+                                    refund_reason_id,
+                                    refund_amount,
+                                    refund_shipping_fee,
+                                    detail_reason,
+                                    bank,
+                                    account_holder,
+                                    account_number,
+                                    cancel_reason_id,
+                                    complete_cancellation_date,
+                                    start_date,
+                                    end_date,
+                                    modifier_id
+                                )
+                        SELECT 
+                            order_detail_id,
+                            order_id,
+                            :order_status_id,
+                            product_id,
+                            price,
+                            option_color,
+                            option_size,
+                            option_additional_price,
+                            units,
+                            discount_price,
+                            shipping_start_date,
+                            shipping_complete_date,
+                            shipping_company,
+                            shipping_number,
+                            is_confirm_order,
+                            null,
+                            null,
+                            null,
+                            null,
+                            null,
+                            null,
+                            null,
+                            null,
+                            null,
+                            cancel_reason_id,
+                            complete_cancellation_date,
+                            :updated_at,
+                            '9999-12-31 23:59:59',
+                            modifier_id
+                        FROM
+                            order_item_info
+                        WHERE
+                            order_item_info.order_detail_id IN :order_item_ids
+                            AND end_date = :updated_at
+                            AND is_deleted = 1
+                    """).bindparams(bindparam('order_item_ids', expanding=True))
+
+        session.execute(query, {
+            'updated_at': updated_at,
+            'order_item_ids': order_item_ids,
+            'order_status_id': restore_order_status_id
+        })
+
+        # 현재 상태 스냅샷 갱신
+        refresh_current_snapshot('order_item_info', order_item_ids, session)
+
+    def select_auto_confirm_targets(self, confirm_before, batch_size, session):
+        """
+        자동 구매확정 대상 주문 조회 로직
+            배송완료일이 confirm_before 이전인 현재 배송완료상태 주문을 batch_size 개 조회하고 lock 을 잡습니다.
+
+        args :
+            confirm_before : 이 시간 이전에 배송완료된 주문만 조회
+            batch_size     : 한번에 조회할 최대 주문 수
+            session        : connection 형성된 session 객체
+
+        returns :
+            구매확정할 주문상세번호 리스트
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        query = """ SELECT
+                        order_detail_id
                     FROM
                         order_item_info
                     WHERE
-                        order_item_info.order_detail_id = :order_item_id
-                        AND end_date = :updated_at
-                        AND is_deletd = 1
+                        order_status_id = 4
+                        AND end_date = '9999-12-31 23:59:59'
+                        AND shipping_complete_date <= :confirm_before
+                    ORDER BY
+                        id
+                    LIMIT :batch_size
+                    FOR UPDATE
                 """
+
+        rows = session.execute(query, {
+            'confirm_before': confirm_before,
+            'batch_size': batch_size
+        }).fetchall()
+
+        return [row['order_detail_id'] for row in rows]
+
+    def insert_confirm_order_items(self, order_item_ids, updated_at, session):
+        """
+        구매확정 선분이력 일괄 생성 로직
+            updated_at 시간에 종료된 배송완료상태를 구매확정상태(is_confirm_order = 1)로 하나의 INSERT ... SELECT 문으로 생성합니다.
+
+        args :
+            order_item_ids : 구매확정할 주문의 주문상세번호 리스트
+            updated_at     : 이력 수정시간
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        query = text(""" INSERT INTO 
+                            order_item_info 
+                                (
+                                    order_detail_id,
+                                    order_id,
+                                    order_status_id,
+                                    product_id,
+                                    price,
+                                    option_color,
+                                    option_size,
+                                    option_additional_price,
+                                    units,
+                                    discount_price,
+                                    shipping_start_date,
+                                    shipping_complete_date,
+                                    shipping_company,
+                                    shipping_number,
+                                    is_confirm_order,
+                                    refund_request_date,
+                                    refund_complete_date,
+                                    refund_reason_id,
+                                    refund_amount,
+                                    refund_shipping_fee,
+                                    detail_reason,
+                                    bank,
+                                    account_holder,
+                                    account_number,
+                                    cancel_reason_id,
+                                    complete_cancellation_date,
+                                    start_date,
+                                    end_date,
+                                    modifier_id
+                                )
+                        SELECT 
+                            order_detail_id,
+                            order_id,
+                            5,
+                            product_id,
+                            price,
+                            option_color,
+                            option_size,
+                            option_additional_price,
+                            units,
+                            discount_price,
+                            shipping_start_date,
+                            shipping_complete_date,
+                            shipping_company,
+                            shipping_number,
+                            1,
+                            refund_request_date,
+                            refund_complete_date,
+                            refund_reason_id,
+                            refund_amount,
+                            refund_shipping_fee,
+                            detail_reason,
+                            bank,
+                            account_holder,
+                            account_number,
+                            cancel_reason_id,
+                            complete_cancellation_date,
+                            :updated_at,
+                            '9999-12-31 23:59:59',
+                            modifier_id
+                        FROM
+                            order_item_info
+                        WHERE
+                            order_item_info.order_detail_id IN :order_item_ids
+                            AND order_status_id = 4
+                            AND end_date = :updated_at
+                            AND is_deleted = 1
+                    """).bindparams(bindparam('order_item_ids', expanding=True))
+
         session.execute(query, {
             'updated_at': updated_at,
-            'order_item_id': restore_order['order_item_id'],
-            'order_status_id': restore_order['restore_order_status_id']
+            'order_item_ids': order_item_ids
         })
+
+        # 현재 상태 스냅샷 갱신
+        refresh_current_snapshot('order_item_info', order_item_ids, session)
@@ -1,3 +1,101 @@
+import json
+
+from sqlalchemy import text, bindparam
+
+from model.query_util import select_list_with_count, refresh_current_snapshot, keyword_condition, cached_text
+from model.reference_dao import reference_cache
+
+# 파일 다운로드 시 한번에 DB 에서 읽어오는 상품 수
+EXPORT_FETCH_SIZE = 1000
+
+# s3 이미지 삭제 최대 시도 횟수
+IMAGE_DELETION_MAX_ATTEMPTS = 5
+
+# 상품 입력 쿼리 : 상품 등록, 일괄 등록에서 사용
+PRODUCT_INSERT_QUERY = """
+    INSERT INTO products
+    (
+        created_at,
+        is_deleted
+    ) VALUES
+    (
+        now(),
+        0
+    )
+"""
+
+# product_info 입력 컬럼 (created_at, is_deleted 제외)
+PRODUCT_INFO_INSERT_COLUMNS = (
+    'product_id',
+    'product_code',
+    'seller_id',
+    'is_on_sale',
+    'is_displayed',
+    'name',
+    'simple_description',
+    'detail_description',
+    'price',
+    'discount_rate',
+    'discount_price',
+    'is_definite',
+    'discount_start_date',
+    'discount_end_date',
+    'min_unit',
+    'max_unit',
+    'is_stock_managed',
+    'stock_number',
+    'first_category_id',
+    'second_category_id',
+    'main_img',
+    'modifier_id'
+)
+
+PRODUCT_INFO_INSERT_TEMPLATE = """
+    INSERT INTO product_info
+    (
+        {columns},
+        created_at,
+        is_deleted
+    ) VALUES (
+        {values},
+        {created_at},
+        {is_deleted}
+    )
+    """
+
+# 상품 정보 이력 입력 쿼리 : 상품 등록, 수정에서 사용
+PRODUCT_INFO_INSERT_QUERY = PRODUCT_INFO_INSERT_TEMPLATE.format(
+    columns    = ',\n        '.join(PRODUCT_INFO_INSERT_COLUMNS),
+    values     = ',\n        '.join(f':{column}' for column in PRODUCT_INFO_INSERT_COLUMNS),
+    created_at = 'now()',
+    is_deleted = '0'
+)
+
+# 상품 정보 일괄 입력 쿼리 : 일괄 등록에서 사용
+# pymysql 은 VALUES 가 모두 placeholder 일 때만 executemany 를 multi-row INSERT 로 묶으므로 created_at, is_deleted 도 bind 한다.
+PRODUCT_INFO_BULK_INSERT_QUERY = PRODUCT_INFO_INSERT_TEMPLATE.format(
+    columns    = ',\n        '.join(PRODUCT_INFO_INSERT_COLUMNS),
+    values     = ',\n        '.join(f':{column}' for column in PRODUCT_INFO_INSERT_COLUMNS),
+    created_at = ':created_at',
+    is_deleted = ':is_deleted'
+)
+
+# 상품 이미지 일괄 입력 쿼리 : 일괄 등록에서 사용. 위와 같은 이유로 created_at 도 bind 한다.
+PRODUCT_IMAGE_BULK_INSERT_QUERY = """
+    INSERT INTO product_images
+    (
+        URL,
+        product_info_id,
+        ordering,
+        created_at
+    ) VALUES (
+        :image_url,
+        :product_info_id,
+        :ordering,
+        :created_at
+    )
+    """
+
 class ProductDao:
     def get_first_categories(self, seller_info, session):
         """ 1차 카테고리 데이터 전달
@@ -14,20 +112,18 @@ class ProductDao:
 
         History:
             2020-10-03 (고지원): 초기 생성
+            2026-10-18 (고지원): 테이블 JOIN 대신 기준 정보 캐시에서 조회
         """
-        filter_query = """
-            SELECT 
-                f_cat.id AS f_id,
-                f_cat.first_category_name AS f_name
-            FROM main_categories AS m_cat 
-            INNER JOIN first_categories AS f_cat ON m_cat.id = f_cat.main_category_id
-            INNER JOIN seller_attributes AS s_attr ON s_attr.id = :attribute_id 
-            AND s_attr.attribute_group_id = m_cat.id;
-            """
+        seller_attribute = reference_cache.get('seller_attributes', int(seller_info), session)
 
-        row = session.execute(filter_query, {'attribute_id' : seller_info}).fetchall()
+        if seller_attribute is None:
+            return []
 
-        return row
+        # 셀러 속성 그룹에 해당하는 메인 카테고리의 1차 카테고리
+        return [{
+            'f_id': f_cat['id'], 'f_name': f_cat['first_category_name']
+        } for f_cat in reference_cache.rows('first_categories', session)
+            if f_cat['main_category_id'] == seller_attribute['attribute_group_id']]
 
     def get_second_categories(self, first_category_id, session):
         """ 2차 카테고리 데이터 전달
@@ -44,19 +140,14 @@ class ProductDao:
 
         History:
             2020-10-03 (고지원): 초기 생성
+            2026-10-18 (고지원): 테이블 JOIN 대신 기준 정보 캐시에서 조회
         """
-        filter_query = """
-            SELECT 
-                s_cat.id AS s_id,
-                s_cat.second_category_name AS s_name
-            FROM first_categories AS f_cat 
-            INNER JOIN second_categories AS s_cat ON s_cat.first_category_id = :f_cat_id  
-            WHERE f_cat.id = :f_cat_id        
-            """
+        first_category_id = int(first_category_id)
 
-        row = session.execute(filter_query, {'f_cat_id' : first_category_id}).fetchall()
-
-        return row
+        return [{
+            's_id': s_cat['id'], 's_name': s_cat['second_category_name']
+        } for s_cat in reference_cache.rows('second_categories', session)
+            if s_cat['first_category_id'] == first_category_id]
 
     def get_sellers(self, seller_dict, session):
         """ 셀러 정보 리스트 전달
@@ -73,32 +164,27 @@ class ProductDao:
 
         History:
             2020-10-04 (고지원): 초기 생성
+            2026-10-18 (고지원): 현재 셀러 정보 스냅샷 테이블 조회
+            2026-10-18 (고지원): 셀러명 검색을 LIKE 대신 ngram FULLTEXT 인덱스로 조회
+            2026-10-18 (고지원): 셀러 속성 테이블 JOIN 제거
         """
         filter_query = """
             SELECT
                 s.id AS s_id, 
                 s_info.korean_name, 
                 s_info.image_url,
-                s_attr.id AS attr_id
-            FROM seller_info AS s_info
+                s_info.seller_attribute_id AS attr_id
+            FROM seller_info_current AS s_info
 
             # 셀러 테이블 조인 
             INNER JOIN sellers AS s ON s.id = s_info.seller_id
 
-            # 셀러의 속성 정보 테이블 조인 
-            INNER JOIN seller_attributes AS s_attr ON s_attr.id = s_info.seller_attribute_id
-
             WHERE s.is_deleted = 0
-            AND s_info.end_date = '9999-12-31 23:59:59'
         """
 
-        # 이름 검색어
+        # 이름 검색어 : ngram FULLTEXT 인덱스로 검색
         if seller_dict.get('name', None):
-            # 이름 검색어를 formatting 하여 LIKE 절에 사용
-            name = seller_dict['name']
-            seller_dict['name'] = f'%{name}%'
-
-            filter_query += " AND s_info.korean_name LIKE :name"
+            filter_query += " AND " + keyword_condition('s_info.korean_name', 'name', seller_dict['name'], seller_dict)
 
         filter_query += " LIMIT 10"
 
@@ -116,7 +202,7 @@ class ProductDao:
             session: 데이터베이스 session 객체
 
         returns :
-            200: 필터링된 상품 리스트
+            200: 필터링된 상품 리스트, 필터링된 상품 결과 개수 (skipCount 인 경우 None)
 
         Authors:
             고지원
@@ -124,6 +210,10 @@ class ProductDao:
         History:
             2020-10-01 (고지원): 초기 생성
             2020-10-12 (고지원): 검색 결과 count 쿼리 추가
+            2026-10-18 (고지원): get_product_count 통합, 상품 리스트와 개수를 한 번에 조회
+            2026-10-18 (고지원): 현재 상품/셀러 정보 스냅샷 테이블 조회
+            2026-10-18 (고지원): 상품명, 셀러명 검색을 LIKE 대신 ngram FULLTEXT 인덱스로 조회
+            2026-10-18 (고지원): 셀러 속성명을 테이블 JOIN 대신 기준 정보 캐시에서 조회
         """
         filter_query = """
             SELECT 
@@ -141,19 +231,17 @@ class ProductDao:
                 p_info.is_displayed,
                 p_info.is_promotion,
                 s_info.korean_name,
-                s_attr.attribution_name
+                s_info.seller_attribute_id
             FROM products AS p
             
             # 상품 정보 조인
-            INNER JOIN product_info AS p_info ON p.id = p_info.product_id
+            INNER JOIN product_info_current AS p_info ON p.id = p_info.product_id
 
             # 셀러 정보 조인 
             INNER JOIN sellers AS s ON p_info.seller_id = s.id
-            INNER JOIN seller_info AS s_info ON s_info.seller_id = s.id
-            INNER JOIN seller_attributes AS s_attr ON s_attr.id = s_info.seller_attribute_id
+            INNER JOIN seller_info_current AS s_info ON s_info.seller_id = s.id
 
-            WHERE p_info.is_deleted = 0 
-            AND p.is_deleted = 0 
+            WHERE p.is_deleted = 0 
             """
 
         # 조회 기간 시작
@@ -178,15 +266,12 @@ class ProductDao:
 
         # 셀러 속성
         if product_info.get('mdSeNo', None):
-            filter_query += " AND s_attr.id = :mdSeNo"
+            filter_query += " AND s_info.seller_attribute_id = :mdSeNo"
 
-        # 상품 검색: 상품명
+        # 상품 검색: 상품명 (ngram FULLTEXT 인덱스로 검색)
         if product_info.get('selectFilter', None) == 'productName':
-            # 검색어를 formatting 하여 LIKE 절에 사용
-            q = product_info['filterKeyword']
-            product_info['filterKeyword'] = f'%{q}%'
-
-            filter_query += " AND p_info.name LIKE :filterKeyword"
+            filter_query += " AND " + keyword_condition(
+                'p_info.name', 'filterKeyword', product_info['filterKeyword'], product_info)
 
         # 상품 검색: 상품 번호
         elif product_info.get('selectFilter', None) == 'productNo':
@@ -202,127 +287,138 @@ class ProductDao:
 
             filter_query += " AND p_info.product_code = :filterKeyword"
 
-        # 셀러명 검색
+        # 셀러명 검색 (ngram FULLTEXT 인덱스로 검색)
         if product_info.get('mdName', None):
-            name = product_info['mdName']
-            product_info['mdName'] = f'%{name}%'
-
-            filter_query += " AND s_info.korean_name LIKE :mdName"
-
-        # 엑셀 다운을 위한 상품 id list
-        if product_info.get('product_id', None):
-            for idx, id in enumerate(product_info.get('product_id', None)):
-
-                if idx == 0:
-                    filter_query += " AND p.id = " + id
-                else:
-                    filter_query += " OR p.id = " + id
+            filter_query += " AND " + keyword_condition(
+                's_info.korean_name', 'mdName', product_info['mdName'], product_info)
 
         # pagination
+        pagination_query = ""
         if product_info.get('filterLimit', None):
-            filter_query += " LIMIT :filterLimit"
+            pagination_query += " LIMIT :filterLimit"
 
-        # pagination
-        if product_info.get('page', None):
-            filter_query += " OFFSET :page"
+            # pagination: page 번호를 OFFSET 으로 변환
+            if product_info.get('page', None):
+                product_info['offset'] = (product_info['page'] - 1) * product_info['filterLimit']
+                pagination_query += " OFFSET :offset"
 
-        filtered_product = session.execute(filter_query, product_info).fetchall()
+        # 상품 리스트와 필터링 결과 개수를 한 번에 조회
+        filtered_product, product_count = select_list_with_count(
+            filter_query, pagination_query, product_info, session, product_info.get('skipCount', None)
+        )
+
+        # 셀러 속성명은 기준 정보 캐시에서 찾는다.
+        for product in filtered_product:
+            product['attribution_name'] = reference_cache.name(
+                'seller_attributes', product['seller_attribute_id'], 'attribution_name', session)
 
-        return filtered_product
+        return filtered_product, product_count
 
-    def get_product_count(self, product_info, session):
-        """ 상품 필터링 결과 카운트 데이터 전달
+    def select_seller_ids(self, seller_ids, session):
+        """ 존재하는 셀러 id 조회
 
-        쿼리 파라미터에 따른 필터링된 상품 리스트의 개수를 전달합니다.
+        상품 일괄 등록 시 파일의 seller_id 가 삭제되지 않은 셀러인지 확인합니다.
 
         args:
-            product_info: 필터링을 위한 상품 정보
+            seller_ids: 확인할 셀러 id 리스트
             session: 데이터베이스 session 객체
 
         returns :
-            200: 필터링된 상품 결과 개수
+            존재하는 셀러 id set
 
         Authors:
             고지원
 
         History:
-            2020-10-13 (고지원): 초기 생성
+            2026-10-18 (고지원): 초기 생성
         """
-        count_query = """
-            SELECT
-                COUNT(*) AS p_count
-            FROM products AS p
-
-            # 상품 정보 조인
-            INNER JOIN product_info AS p_info ON p.id = p_info.product_id
-
-            # 셀러 정보 조인 
-            INNER JOIN sellers AS s ON p_info.seller_id = s.id
-            INNER JOIN seller_info AS s_info ON s_info.seller_id = s.id
-            INNER JOIN seller_attributes AS s_attr ON s_attr.id = s_info.seller_attribute_id
-
-            WHERE p_info.is_deleted = 0 
-            AND p.is_deleted = 0 
-            """
+        select_query = cached_text("""
+        SELECT id
+        FROM sellers
+        WHERE id IN :seller_ids
+        AND is_deleted = 0
+        """, ('seller_ids',))
 
-        # 조회 기간 시작
-        if product_info.get('filterDateFrom', None):
-            count_query += " AND p_info.created_at >= :filterDateFrom"
+        return {row['id'] for row in session.execute(select_query, {'seller_ids': list(seller_ids)}).fetchall()}
 
-        # 조회 기간 끝
-        if product_info.get('filterDateTo', None):
-            count_query += " AND p_info.created_at <= :filterDateTo"
+    def get_products_for_export(self, product_ids, session):
+        """ 상품 정보 파일 다운로드용 데이터 전달
 
-        # 진열 여부
-        if product_info.get('exhibitionYn', None) in (0, 1):
-            count_query += " AND p_info.is_displayed = :exhibitionYn"
+        server side cursor 로 조회하여 상품을 일정 개수씩 나누어 전달합니다.
+        전체 결과를 메모리에 올리지 않으므로 상품 수와 관계없이 메모리 사용량이 일정합니다.
 
-        # 할인 여부
-        if product_info.get('discountYn', None) in (0, 1):
-            count_query += " AND p_info.is_promotion = :discountYn"
-
-        # 판매 여부
-        if product_info.get('sellYn', None) in (0, 1):
-            count_query += " AND p_info.is_on_sale = :sellYn"
-
-        # 셀러 속성
-        if product_info.get('mdSeNo', None):
-            count_query += " AND s_attr.id = :mdSeNo"
+        args:
+            product_ids: 다운로드할 상품 id 리스트, 없으면 전체 상품
+            session: 데이터베이스 session 객체
 
-        # 상품 검색: 상품명
-        if product_info.get('selectFilter', None) == 'productName':
-            # 검색어를 formatting 하여 LIKE 절에 사용
-            q = product_info['filterKeyword']
-            product_info['filterKeyword'] = f'%{q}%'
+        returns :
+            상품 정보 row generator
 
-            count_query += " AND p_info.name LIKE :filterKeyword"
+        Authors:
+            고지원
 
-        # 상품 검색: 상품 번호
-        elif product_info.get('selectFilter', None) == 'productNo':
-            q = product_info['filterKeyword']
-            product_info['filterKeyword'] = f'%{q}%'
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        export_query = """
+            SELECT 
+                p.id, 
+                p_info.main_img, 
+                p_info.name, 
+                p_info.price, 
+                p_info.discount_price, 
+                p_info.created_at,
+                p_info.product_code,
+                p_info.is_on_sale,
+                p_info.is_displayed,
+                p_info.is_promotion,
+                s_info.korean_name,
+                s_info.seller_attribute_id
+            FROM products AS p
+            
+            # 상품 정보 조인
+            INNER JOIN product_info_current AS p_info ON p.id = p_info.product_id
 
-            count_query += " AND p_info.product_id = :filterKeyword"
+            # 셀러 정보 조인 
+            INNER JOIN sellers AS s ON p_info.seller_id = s.id
+            INNER JOIN seller_info_current AS s_info ON s_info.seller_id = s.id
 
-        # 상품 검색: 상품 코드
-        elif product_info.get('selectFilter', None) == 'productCode':
-            q = product_info['filterKeyword']
-            product_info['filterKeyword'] = f'%{q}%'
+            WHERE p.is_deleted = 0 
+            """
+        params = {}
 
-            count_query += " AND p_info.product_code = :filterKeyword"
+        # 선택 상품 id list
+        if product_ids:
+            export_query += " AND p.id IN :product_ids"
+            params['product_ids'] = [int(product_id) for product_id in product_ids]
 
-        # 셀러명 검색
-        if product_info.get('mdName', None):
-            name = product_info['mdName']
-            product_info['mdName'] = f'%{name}%'
+        export_query += " ORDER BY p.id"
 
-            count_query += " AND s_info.korean_name LIKE :mdName"
+        statement = text(export_query)
+        if product_ids:
+            statement = statement.bindparams(bindparam('product_ids', expanding=True))
 
-        counted_product = session.execute(count_query, product_info).fetchone()
+        # 스트리밍 중에는 같은 connection 으로 다른 쿼리를 실행할 수 없으므로 기준 정보를 미리 읽어둔다.
+        seller_attributes = reference_cache.snapshot(session)[2]['seller_attributes']
 
-        return counted_product
+        # stream_results : 결과를 한번에 가져오지 않고 fetchmany 할 때마다 DB 에서 읽어온다.
+        # 인증이나 기준 정보 조회로 session 의 connection 이 이미 열려 있으면 session.connection() 의 옵션은 무시되므로
+        # 쿼리문에 옵션을 지정한다.
+        result = session.execute(statement.execution_options(stream_results=True), params)
 
+        try:
+            while True:
+                rows = result.fetchmany(EXPORT_FETCH_SIZE)
+                if not rows:
+                    break
 
+                for row in rows:
+                    product = dict(row)
+                    seller_attribute = seller_attributes.get(product['seller_attribute_id'])
+                    product['attribution_name'] = seller_attribute['attribution_name'] if seller_attribute else None
+                    yield product
+        finally:
+            result.close()
 
     def get_product(self, product_id, session):
         """ 상품 수정 시 기존 상세 데이터 전달
@@ -339,6 +435,8 @@ class ProductDao:
 
         History:
             2020-10-01 (고지원): 초기 생성
+            2026-10-18 (고지원): 최신 상품 정보를 정렬하여 찾지 않고 현재 상품 정보 스냅샷 테이블 조회
+            2026-10-18 (고지원): 이미지를 JSON_ARRAYAGG 로 함께 조회하여 한 번의 쿼리로 전달, 상품이 없으면 None
         """
         product_info = session.execute(("""
             SELECT 
@@ -358,42 +456,67 @@ class ProductDao:
                 p_info.max_unit,
                 p_info.seller_id,
                 f_cat.first_category_name,
-                s_cat.second_category_name
+                s_cat.second_category_name,
+
+                # 이미지 : JSON_ARRAYAGG 는 순서를 보장하지 않으므로 ordering 을 함께 조회하여 정렬한다.
+                (
+                    SELECT JSON_ARRAYAGG(JSON_OBJECT('id', img.id, 'image_url', img.URL, 'ordering', img.ordering))
+                    FROM product_images AS img
+                    WHERE img.product_info_id = p_info.id
+                ) AS images
             FROM products AS p 
             
             # 상품 정보 조인 
-            INNER JOIN product_info AS p_info ON p_info.product_id = p.id
+            INNER JOIN product_info_current AS p_info ON p_info.product_id = p.id
             
             # 카테고리 정보 조인 
             INNER JOIN first_categories AS f_cat ON f_cat.id = p_info.first_category_id
             INNER JOIN second_categories AS s_cat ON s_cat.id = p_info.second_category_id
             
             WHERE p_info.product_id = :product_id
-            ORDER BY p_info.created_at DESC 
-            LIMIT 1
         """), {'product_id' : product_id}).fetchone()
 
-        # 이미지
-        images = session.execute(("""
-            SELECT 
-                id, 
-                URL
-            FROM product_images
-            WHERE product_info_id = :product_info_id
-            ORDER BY ordering 
-        """), {'product_info_id' : product_info.p_info_id})
+        if product_info is None:
+            return None
 
         # 딕셔너리로 형변환
         product_info = dict(product_info)
 
-        # 이미지 리스트를 images 키에 저장
-        image_list = [{
-            "id": image.id, "image_url": image.URL
-        } for image in images]
-        product_info['images'] = image_list
+        # 이미지 리스트를 ordering 순서로 images 키에 저장
+        images = sorted(json.loads(product_info['images'] or '[]'), key=lambda image: image['ordering'])
+        product_info['images'] = [{"id": image['id'], "image_url": image['image_url']} for image in images]
 
         return product_info
 
+    def get_product_version(self, product_id, session):
+        """ 상품 상세 데이터의 version 전달
+
+        상품 수정 시 현재 상품 정보 row 가 새로 생성되므로 row 의 id 와 생성 시간을 version 으로 사용합니다.
+        상세 데이터의 JOIN 과 이미지 조회 없이 현재 상품 정보 테이블만 조회합니다.
+
+        args:
+            product_id: 상품 pk
+            session: 데이터베이스 session 객체
+
+        returns :
+            (현재 상품 정보 id, 생성 시간), 상품이 없으면 None
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        version = session.execute("""
+            SELECT 
+                id, 
+                created_at
+            FROM product_info_current
+            WHERE product_id = :product_id
+        """, {'product_id': product_id}).fetchone()
+
+        return tuple(version) if version else None
+
     def get_product_history(self, product_id, session):
         """ 상품 수정 이력 전달
 
@@ -409,6 +532,7 @@ class ProductDao:
 
         History:
             2020-10-10 (고지원): 초기 생성
+            2026-10-18 (고지원): 수정자 정보를 현재 셀러 정보 스냅샷 테이블에서 조회
         """
         product_info = session.execute(("""
             SELECT 
@@ -430,7 +554,7 @@ class ProductDao:
             
             # 셀러 (수정자) 정보 조인 
             INNER JOIN sellers AS s ON s.id = p_info.modifier_id
-            INNER JOIN seller_info AS s_info ON s_info.seller_id = s.id
+            INNER JOIN seller_info_current AS s_info ON s_info.seller_id = s.id
             
             WHERE p_info.product_id = :product_id
             ORDER BY p_info.created_at DESC 
@@ -453,21 +577,12 @@ class ProductDao:
 
         History:
             2020-10-02 (고지원): 초기 생성
+            2026-10-18 (고지원): 현재 상품 정보 스냅샷 갱신 추가
+            2026-10-18 (고지원): 이미지를 한 번의 multi-row INSERT 로 입력
         """
 
         # 1. products 테이블에 데이터를 입력한다.
-        insert_query = """
-        INSERT INTO products
-        (   
-            created_at,
-            is_deleted
-        ) VALUES 
-        (
-            now(),
-            0
-        )
-        """
-        row = session.execute(insert_query).lastrowid
+        row = session.execute(PRODUCT_INSERT_QUERY).lastrowid
 
         # 2. product_info 테이블에 데이터를 입력한다.
         product_info['product_id'] = row
@@ -476,89 +591,52 @@ class ProductDao:
         image_list = product_info['images']
         product_info['main_img'] = image_list[0]
 
-        insert_query = """
-        INSERT INTO product_info
-        (   
-            product_id,
-            product_code,
-            seller_id,
-            is_on_sale,
-            is_displayed,
-            name,
-            simple_description,
-            detail_description,
-            price,
-            discount_rate,
-            discount_price,
-            is_definite,
-            discount_start_date,
-            discount_end_date,
-            min_unit,
-            max_unit,
-            is_stock_managed,
-            stock_number,
-            first_category_id,
-            second_category_id,
-            main_img,
-            modifier_id,
-            created_at,
-            is_deleted
-        ) VALUES (
-            :product_id,
-            :product_code,
-            :seller_id,
-            :is_on_sale,
-            :is_displayed,
-            :name,
-            :simple_description,
-            :detail_description,
-            :price,
-            :discount_rate,
-            :discount_price,
-            :is_definite,
-            :discount_start_date,
-            :discount_end_date,
-            :min_unit,
-            :max_unit,
-            :is_stock_managed,
-            :stock_number,
-            :first_category_id,
-            :second_category_id,
-            :main_img,
-            :modifier_id,
-            now(),
-            0
-        )
-        """
+        row = session.execute(PRODUCT_INFO_INSERT_QUERY, product_info).lastrowid
 
-        row = session.execute(insert_query, product_info).lastrowid
+        # 3. image 테이블에 모든 이미지를 한번에 입력한다.
+        self.insert_product_images(row, image_list, session)
 
-        # 3. image 테이블에 데이터를 입력한다.
-        for idx, image in enumerate(image_list):
-            image_info = {
-                'image_url' : image,
-                'product_info_id' : row,
-                'ordering' : idx + 1
-            }
+        # 현재 상품 정보 스냅샷을 갱신한다.
+        refresh_current_snapshot('product_info', [product_info['product_id']], session)
 
-            insert_query = """
-            INSERT INTO product_images
-            (   
-                URL,
-                product_info_id,
-                ordering,
-                created_at
-            ) VALUES (
-                :image_url,
-                :product_info_id,
-                :ordering,
-                now()
-            )
-            """
+    def update_product(self, product_info, session):
+        """ 상품 데이터 수정
 
-            session.execute(insert_query, image_info)
+        이전 상품 정보를 삭제 처리하고 새로운 상품 정보 이력을 등록합니다.
+        저장할 이미지 리스트가 DB 에 저장된 이전 이미지와 순서까지 같으면 INSERT ... SELECT 로 그대로 복사합니다.
+
+        args:
+            product_info: 상품의 정보 (images : 기존 이미지 url 리스트, new_images : 저장할 이미지 url 리스트)
+            session: 데이터베이스 session 객체
+
+        returns :
+            이전 상품 정보 id, DB 에 저장되어 있던 이전 이미지 url 리스트
+
+        Authors:
+            고지원
+
+        History:
+            2020-10-10 (고지원): 초기 생성
+            2026-10-18 (고지원): 현재 상품 정보 스냅샷 갱신 추가
+            2026-10-18 (고지원): 이미지를 한 번의 multi-row INSERT 로 입력, 이미지가 바뀌지 않으면 이전 이미지 복사
+            2026-10-18 (고지원): 상세 데이터 캐시를 지우기 위해 이전 상품 정보 id 반환
+            2026-10-18 (고지원): 요청의 이미지 리스트가 아닌 DB 에 저장된 이전 이미지와 비교하여 복사 여부 결정
+            2026-10-18 (고지원): 교체된 이미지를 구하기 위해 이전 이미지 리스트 반환
+        """
+        # 이전 상품 정보 id(상세 데이터 캐시 삭제용)와 저장된 이미지를 순서대로 조회한다.
+        previous = session.execute("""
+        SELECT
+            p_info.id,
+            images.URL
+        FROM product_info_current AS p_info
+        LEFT JOIN product_images AS images ON images.product_info_id = p_info.id
+        WHERE p_info.product_id = :product_id
+        ORDER BY images.ordering
+        """, product_info).fetchall()
+
+        previous_info_id = previous[0]['id'] if previous else None
+        stored_images = [row['URL'] for row in previous if row['URL']]
 
-    def update_product(self, product_info, session):
         # 1. 이전 상품 데이터의 is_deleted 컬럼을 1로 수정한다.
         update_query = """
         UPDATE product_info
@@ -574,84 +652,277 @@ class ProductDao:
         # 이미지 리스트의 첫 번째 이미지를 대표 이미지로 지정한다.
         product_info['main_img'] = image_list[0]
 
+        row = session.execute(PRODUCT_INFO_INSERT_QUERY, product_info).lastrowid
+
+        # 3. image 테이블에 데이터를 입력한다.
+        # 이미지가 DB 에 저장된 것과 같으면 복사하고, 삭제나 순서 변경이 있으면 요청한 리스트를 입력한다.
+        # 스냅샷은 아직 이전 상품 정보를 가리키므로 갱신 전에 이전 이미지를 복사한다.
+        if image_list == stored_images:
+            self.copy_product_images(product_info['product_id'], row, session)
+        else:
+            self.insert_product_images(row, image_list, session)
+
+        # 현재 상품 정보 스냅샷을 갱신한다.
+        refresh_current_snapshot('product_info', [product_info['product_id']], session)
+
+        return previous_info_id, stored_images
+
+    def insert_product_images(self, product_info_id, image_list, session):
+        """ 상품 이미지 등록
+
+        상품 정보 하나의 모든 이미지를 한 번의 multi-row INSERT 로 입력합니다.
+        이미지 순서대로 ordering 을 1 부터 저장합니다.
+
+        args:
+            product_info_id: 이미지를 등록할 상품 정보 id
+            image_list: 이미지 url 리스트
+            session: 데이터베이스 session 객체
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        if not image_list:
+            return
+
+        image_info = {'product_info_id': product_info_id}
+        values = []
+
+        for idx, image in enumerate(image_list):
+            image_info[f'image_url_{idx}'] = image
+            values.append(f'(:image_url_{idx}, :product_info_id, {idx + 1}, now())')
+
+        # 이미지 갯수(최대 5개)마다 같은 쿼리문이 되므로 text() 객체를 재사용한다.
+        insert_query = cached_text("""
+        INSERT INTO product_images
+        (
+            URL,
+            product_info_id,
+            ordering,
+            created_at
+        ) VALUES """ + ', '.join(values))
+
+        session.execute(insert_query, image_info)
+
+    def copy_product_images(self, product_id, product_info_id, session):
+        """ 이전 상품 정보의 이미지 복사
+
+        현재 상품 정보 스냅샷이 가리키는 상품 정보의 이미지를 순서 그대로 새로운 상품 정보의 이미지로 복사합니다.
+        이미지 url 을 다시 전달하지 않고 데이터베이스 안에서 INSERT ... SELECT 로 처리합니다.
+
+        args:
+            product_id: 상품 id
+            product_info_id: 이미지를 복사할 새로운 상품 정보 id
+            session: 데이터베이스 session 객체
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
         insert_query = """
-        INSERT INTO product_info
-        (   
-            product_id,
-            product_code,
-            seller_id,
-            is_on_sale,
-            is_displayed,
-            name,
-            simple_description,
-            detail_description,
-            price,
-            discount_rate,
-            discount_price,
-            is_definite,
-            discount_start_date,
-            discount_end_date,
-            min_unit,
-            max_unit,
-            is_stock_managed,
-            stock_number,
-            first_category_id,
-            second_category_id,
-            main_img,
-            modifier_id,
-            created_at,
-            is_deleted
-        ) VALUES (
-            :product_id,
-            :product_code,
-            :seller_id,
-            :is_on_sale,
-            :is_displayed,
-            :name,
-            :simple_description,
-            :detail_description,
-            :price,
-            :discount_rate,
-            :discount_price,
-            :is_definite,
-            :discount_start_date,
-            :discount_end_date,
-            :min_unit,
-            :max_unit,
-            :is_stock_managed,
-            :stock_number,
-            :first_category_id,
-            :second_category_id,
-            :main_img,
-            :modifier_id,
-            now(),
-            0
+        INSERT INTO product_images
+        (
+            URL,
+            product_info_id,
+            ordering,
+            created_at
         )
+        SELECT
+            images.URL,
+            :product_info_id,
+            images.ordering,
+            now()
+        FROM product_images AS images
+        INNER JOIN product_info_current AS p_info ON p_info.id = images.product_info_id
+        WHERE p_info.product_id = :product_id
         """
 
-        row = session.execute(insert_query, product_info).lastrowid
+        session.execute(insert_query, {'product_id': product_id, 'product_info_id': product_info_id})
 
-        # 3. image 테이블에 데이터를 입력한다.
-        for idx, image in enumerate(image_list):
-            image_info = {
-                'image_url' : image,
-                'product_info_id' : row,
-                'ordering' : idx + 1
+    def insert_products(self, product_infos, session):
+        """ 상품 데이터 일괄 등록
+
+        여러 상품을 적은 수의 쿼리로 등록합니다.
+            1. products : 상품마다 INSERT 하여 각 row 의 lastrowid 를 상품 id 로 사용한다.
+               multi-row INSERT 의 id 는 innodb_autoinc_lock_mode, auto_increment_increment 설정에 따라 연속이 아닐 수 있다.
+            2. product_info : executemany
+            3. product_images : 입력한 product_info id 를 조회한 뒤 executemany
+            4. 현재 상품 정보 스냅샷 갱신
+            pymysql 은 VALUES 가 모두 placeholder 인 INSERT 의 executemany 만 multi-row INSERT 로 묶어서 실행하므로
+            2, 3 은 created_at 과 is_deleted 를 DB 에서 한 번 조회한 시간과 상수로 bind 합니다.
+
+        args:
+            product_infos: 상품 정보 리스트 (images : 이미지 url 리스트, 첫 번째 이미지가 대표 이미지)
+            session: 데이터베이스 session 객체
+
+        returns :
+            등록된 상품 id 리스트
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        if not product_infos:
+            return []
+
+        # 모든 row 의 created_at 으로 사용할 DB 시간
+        created_at = session.execute("SELECT now()").scalar()
+
+        # 1. products 테이블에 상품마다 입력하고 입력된 id 를 저장한다.
+        for product_info in product_infos:
+            product_info['product_id'] = session.execute(PRODUCT_INSERT_QUERY).lastrowid
+            product_info['main_img'] = product_info['images'][0]
+            product_info['created_at'] = created_at
+            product_info['is_deleted'] = 0
+
+        # 2. product_info 테이블에 multi-row INSERT 로 입력한다.
+        session.execute(PRODUCT_INFO_BULK_INSERT_QUERY, product_infos)
+
+        product_ids = [product_info['product_id'] for product_info in product_infos]
+
+        select_query = cached_text("""
+        SELECT
+            id,
+            product_id
+        FROM product_info
+        WHERE product_id IN :product_ids
+        AND is_deleted = 0
+        """, ('product_ids',))
+
+        product_info_ids = {
+            row['product_id']: row['id']
+            for row in session.execute(select_query, {'product_ids': product_ids}).fetchall()
+        }
+
+        # 3. image 테이블에 모든 상품의 이미지를 multi-row INSERT 로 입력한다.
+        images = [
+            {
+                'image_url'       : image,
+                'product_info_id' : product_info_ids[product_info['product_id']],
+                'ordering'        : idx + 1,
+                'created_at'      : created_at
             }
+            for product_info in product_infos
+            for idx, image in enumerate(product_info['images'])
+        ]
 
-            insert_query = """
-            INSERT INTO product_images
-            (   
-                URL,
-                product_info_id,
-                ordering,
-                created_at
-            ) VALUES (
-                :image_url,
-                :product_info_id,
-                :ordering,
-                now()
-            )
-            """
+        session.execute(PRODUCT_IMAGE_BULK_INSERT_QUERY, images)
+
+        # 4. 현재 상품 정보 스냅샷을 갱신한다.
+        refresh_current_snapshot('product_info', product_ids, session)
+
+        return product_ids
+
+    def insert_image_deletions(self, image_keys, session):
+        """ 삭제할 s3 이미지 기록
+
+        상품 수정으로 교체된 이미지의 key 를 삭제 대기열에 기록합니다.
+        상품 수정과 같은 트랜잭션에서 실행되므로 수정이 rollback 되면 삭제 요청도 함께 취소됩니다.
+
+        args:
+            image_keys: 삭제할 s3 이미지 key 리스트
+            session: 데이터베이스 session 객체
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        insert_query = """
+        INSERT INTO product_image_deletions
+        (
+            image_key
+        ) VALUES (
+            :image_key
+        )
+        """
+
+        # executemany 로 한번에 입력한다.
+        session.execute(insert_query, [{'image_key': image_key} for image_key in image_keys])
+
+    def get_image_deletions(self, limit, session):
+        """ 삭제 대기 중인 s3 이미지 조회
+
+        삭제 대기열에서 오래된 순서로 limit 개의 이미지를 조회합니다.
+        여러 worker 가 동시에 실행되어도 같은 row 를 처리하지 않도록 lock 이 걸린 row 는 건너뜁니다.
+
+        args:
+            limit: 한번에 조회할 이미지 수
+            session: 데이터베이스 session 객체
+
+        returns :
+            삭제 대기 중인 이미지 id, key 리스트
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        select_query = """
+        SELECT
+            id,
+            image_key
+        FROM product_image_deletions
+        WHERE attempts < :max_attempts
+        ORDER BY id
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+        """
+
+        rows = session.execute(select_query, {'limit': limit, 'max_attempts': IMAGE_DELETION_MAX_ATTEMPTS}).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def delete_image_deletions(self, deletion_ids, session):
+        """ 삭제 완료된 s3 이미지를 대기열에서 제거
+
+        args:
+            deletion_ids: 삭제 대기열 id 리스트
+            session: 데이터베이스 session 객체
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        delete_query = text("""
+        DELETE FROM product_image_deletions
+        WHERE id IN :deletion_ids
+        """).bindparams(bindparam('deletion_ids', expanding=True))
+
+        session.execute(delete_query, {'deletion_ids': deletion_ids})
+
+    def update_image_deletion_errors(self, failed_deletions, session):
+        """ s3 이미지 삭제 실패 기록
+
+        삭제에 실패한 이미지의 실패 횟수와 실패 사유를 기록합니다.
+        실패 횟수가 IMAGE_DELETION_MAX_ATTEMPTS 에 도달하면 더 이상 조회되지 않습니다.
+
+        args:
+            failed_deletions: 삭제 대기열 id 와 실패 사유 리스트
+            session: 데이터베이스 session 객체
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        update_query = """
+        UPDATE product_image_deletions
+        SET
+            attempts = attempts + 1,
+            last_error = :last_error
+        WHERE id = :id
+        """
 
-            session.execute(insert_query, image_info)
\ No newline at end of file
+        session.execute(update_query, failed_deletions)
@@ -2,6 +2,9 @@ import math
 from flask           import jsonify
 from sqlalchemy import text
 
+from model.query_util import select_list_with_count
+from model.reference_dao import reference_cache
+
 class QnADao:
     def get_qna_list(self, valid_param, seller_info, session):
         """
@@ -21,12 +24,15 @@ class QnADao:
             2020-10-05 (hj885353@gmail.com) : 초기 생성
             2020-10-12 (hj885353@gmail.com) : QueryString 및 INNER -> LEFT JOIN 변경
             2020-10-13 (hj885353@gmail.com) : question_id를 기준으로 내림차순 정렬 기능 추가
+            2026-10-18 (hj885353@gmail.com) : COUNT(*) OVER()로 목록과 갯수를 한 번에 조회, skipCount 추가
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 상품/셀러 정보 스냅샷 테이블 조회
+            2026-10-18 (hj885353@gmail.com) : 문의 유형명을 question_types JOIN 대신 기준 정보 캐시에서 조회
         """
         # db로부터 Q&A 목록 반환해주는데 필요한 field를 조회하는 쿼리문
         get_qna_list_statement = """
             SELECT
                 q.id as question_id,
-                qt.type_name,
+                q.type_id,
                 q.created_at,
                 u.phone_number,
                 pi.name,
@@ -34,12 +40,11 @@ class QnADao:
                 q.content,
                 u.id as user_id
             FROM questions as q
-            LEFT JOIN question_types as qt ON qt.id = q.type_id
             LEFT JOIN answers as a ON a.id = q.id
             LEFT JOIN products as p ON q.product_id = p.id
-            LEFT JOIN product_info as pi ON p.id = pi.product_id
+            LEFT JOIN product_info_current as pi ON p.id = pi.product_id
             LEFT JOIN users as u ON q.user_id = u.id
-            LEFT JOIN seller_info as si ON pi.seller_id = si.seller_id
+            LEFT JOIN seller_info_current as si ON pi.seller_id = si.seller_id
             WHERE q.is_deleted = 0
             AND a.is_deleted = 0
             AND u.is_deleted = 0
@@ -47,75 +52,58 @@ class QnADao:
             AND pi.is_deleted = 0
         """
 
-        # QueryString으로 필터링 했을 때, 해당 필터링 된 Q&A의 갯수를 count하는 쿼리문
-        filter_query_values_count_statement = """
-            SELECT 
-                COUNT(0) as filtered_qna_count
-            FROM questions as q
-            LEFT JOIN question_types as qt ON qt.id = q.type_id
-            LEFT JOIN answers as a ON a.id = q.id
-            LEFT JOIN products as p ON q.product_id = p.id
-            LEFT JOIN product_info as pi ON p.id = pi.product_id
-            LEFT JOIN users as u ON q.user_id = u.id
-            LEFT JOIN seller_info as si ON pi.seller_id = si.seller_id
-            WHERE q.is_deleted = 0
-            AND a.is_deleted = 0
-            AND u.is_deleted = 0
-            AND p.is_deleted = 0
-            AND pi.is_deleted = 0
-        """
         # 상품명
         if valid_param.get('PRODUCT_NAME', None):
             get_qna_list_statement += " AND pi.name = :PRODUCT_NAME"
-            filter_query_values_count_statement += " AND pi.name = :PRODUCT_NAME"
 
         # 글번호
         if valid_param.get('PRDUCT_INQRY_NO', None):
             get_qna_list_statement += " AND q.id = :PRDUCT_INQRY_NO"
-            filter_query_values_count_statement += " AND q.id = :PRDUCT_INQRY_NO"
 
         # 셀러 한글명
         if valid_param.get('MD_KO_NAME', None):
             get_qna_list_statement += " AND si.korean_name = :MD_KO_NAME"
-            filter_query_values_count_statement += " AND si.korean_name = :MD_KO_NAME"
 
         # 회원 번호
         if valid_param.get('ORDER_NO', None):
             get_qna_list_statement += " AND s.id = :ORDER_NO"
-            filter_query_values_count_statement += " AND s.id = :ORDER_NO"
         
-        # 문의 유형
+        # 문의 유형 : 기준 정보 캐시에서 문의 유형명에 해당하는 id 를 찾아 조건으로 사용
         if valid_param.get('inquiryType', None):
-            get_qna_list_statement += " AND qt.type_name = :inquiryType"
-            filter_query_values_count_statement += " AND qt.type_name = :inquiryType"
+            valid_param['inquiry_type_id'] = next((
+                question_type['id'] for question_type in reference_cache.rows('question_types', session)
+                if question_type['type_name'] == valid_param['inquiryType']), None)
+            get_qna_list_statement += " AND q.type_id = :inquiry_type_id"
 
         # 등록일 ~부터
         if valid_param.get('filterDateFrom', None):
             get_qna_list_statement += " AND DATE(q.created_at) >= :filterDateFrom"
-            filter_query_values_count_statement += " AND DATE(q.created_at) >= :filterDateFrom"
 
         # 등록일 ~까지
         if valid_param.get('filterDateFrom', None) and valid_param.get('filterDateTo', None):
             get_qna_list_statement += " AND DATE(q.created_at) BETWEEN :filterDateFrom AND :filterDateTo"
-            filter_query_values_count_statement += " AND DATE(q.created_at) BETWEEN :filterDateFrom AND :filterDateTo"
 
         # pagination 및 내림차순 정렬
+        pagination_statement = " ORDER BY q.id DESC"
         if valid_param.get('filterLimit', None):
             if valid_param.get('page', None):
                 valid_param['offset'] = (valid_param['page']-1) * valid_param['filterLimit']
-                get_qna_list_statement += " ORDER BY q.id DESC LIMIT :filterLimit OFFSET :offset"
+                pagination_statement += " LIMIT :filterLimit OFFSET :offset"
             else:
-                get_qna_list_statement += " ORDER BY q.id DESC LIMIT :filterLimit"
+                pagination_statement += " LIMIT :filterLimit"
 
-        # Q&A 전체 목록을 다 가져옴
-        qna_lists = session.execute(get_qna_list_statement, valid_param).fetchall()
-        # dict 형태로 변환
-        qna_list = [ dict(qna) for qna in qna_lists ]
+        # Q&A 목록과 필터링 된 count를 한 번의 쿼리로 가져옴. skipCount인 경우 count는 None
+        qna_list, qna_count = select_list_with_count(
+            get_qna_list_statement, pagination_statement, valid_param, session, valid_param.get('skipCount', None)
+        )
 
-        # 필터링 된 count를 fetch 및 dictionary로 casting
-        qna_count = int(session.execute(filter_query_values_count_statement, valid_param).fetchone()[0])
+        # 문의 유형명은 기준 정보 캐시에서 찾는다.
+        for qna in qna_list:
+            qna['type_name'] = reference_cache.name('question_types', qna.pop('type_id'), 'type_name', session)
 
-        page_number = math.ceil(qna_count / valid_param['filterLimit'])
+        page_number = None
+        if qna_count is not None and valid_param.get('filterLimit', None):
+            page_number = math.ceil(qna_count / valid_param['filterLimit'])
 
         return qna_list, qna_count, page_number
 
@@ -134,23 +122,24 @@ class QnADao:
         History:
             2020-10-06 (hj885353@gmail.com) : 초기 생성
             2020-10-06 (hj885353@gmail.com) : QueryString을 path_parameter로 수정
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 상품/셀러 정보 스냅샷 테이블 조회
+            2026-10-18 (hj885353@gmail.com) : 문의 유형명을 question_types JOIN 대신 기준 정보 캐시에서 조회
         """
         
         # 해당 문의 내용에 대한 내용을 조회하는 쿼리문
         answer_info_statement = """
             SELECT
                 q.id,
-                qt.type_name,
+                q.type_id,
                 u.login_id,
                 pi.name,
                 pi.main_img,
                 q.content,
                 q.created_at
             FROM questions as q
-            LEFT JOIN question_types as qt ON qt.id = q.type_id
             LEFT JOIN users as u ON u.id = q.user_id
             LEFT JOIN products as p ON p.id = q.product_id
-            LEFT JOIN product_info as pi ON pi.product_id = p.id
+            LEFT JOIN product_info_current as pi ON pi.product_id = p.id
             WHERE q.id = :parameter_question_no
             AND q.is_deleted = 0
             AND u.is_deleted = 0
@@ -160,6 +149,9 @@ class QnADao:
         # 조회한 쿼리문을 fetch 및 dict로 casting
         answer_info = dict(session.execute(answer_info_statement, valid_param).fetchone())
 
+        # 문의 유형명은 기준 정보 캐시에서 찾는다.
+        answer_info['type_name'] = reference_cache.name('question_types', answer_info.pop('type_id'), 'type_name', session)
+
         return answer_info        
 
     def insert_answer(self, valid_param, session):
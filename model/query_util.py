@@ -0,0 +1,258 @@
+import re
+import weakref
+
+from sqlalchemy      import text, bindparam
+from sqlalchemy.util import LRUCache
+
+# 목록 조회 쿼리의 첫 번째 SELECT 키워드
+SELECT_KEYWORD = re.compile(r'^\s*SELECT', re.IGNORECASE)
+
+# 쿼리문 -> text() 객체 캐시 크기
+STATEMENT_CACHE_SIZE = 500
+
+# 프로세스 전체에서 공유하는 text() 객체 캐시
+statement_cache = LRUCache(STATEMENT_CACHE_SIZE)
+
+# cached_text 로 만든 text() 객체. engine 의 compiled_cache 는 이 객체들의 컴파일 결과만 보관한다.
+cached_statements = weakref.WeakSet()
+
+
+class CachedTextCompiledCache(LRUCache):
+    """
+    cached_text 로 만든 쿼리의 컴파일 결과만 보관하는 engine compiled_cache
+        session.execute("...") 처럼 문자열로 실행한 쿼리는 실행할 때마다 새로운 text() 객체가 되어 다시 조회되지 않으므로,
+        보관하면 cached_text 쿼리의 컴파일 결과만 LRU 에서 밀려납니다.
+        SQLAlchemy 1.3 은 statement 의 execution_options 에 있는 compiled_cache 를 사용하지 않으므로 engine 에 설정하고 여기서 거릅니다.
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    def __setitem__(self, key, value):
+        # key : (dialect, 실행한 statement, 바인딩 파라미터 이름, schema, executemany 여부)
+        if key[1] in cached_statements:
+            super().__setitem__(key, value)
+
+
+def cached_text(query, expanding=()):
+    """
+    쿼리문에 해당하는 text() 객체 조회
+        DAO 는 검색 조건마다 쿼리문을 이어붙이고 값은 바인딩하므로, 같은 검색 조건 조합은 항상 같은 쿼리문이 됩니다.
+        쿼리문(과 expanding 파라미터)을 키로 text() 객체를 캐시하여 요청마다 쿼리문을 다시 파싱하지 않고,
+        같은 객체를 실행하므로 engine 의 compiled_cache 에서 컴파일 결과도 재사용됩니다.
+
+    args :
+        query     : 쿼리문
+        expanding : IN 절에 리스트를 바인딩할 파라미터 이름 tuple
+
+    returns :
+        text() 객체
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    key = (query, expanding)
+    statement = statement_cache.get(key)
+
+    if statement is None:
+        statement = text(query)
+        if expanding:
+            statement = statement.bindparams(*[bindparam(name, expanding=True) for name in expanding])
+        statement_cache[key] = statement
+        cached_statements.add(statement)
+
+    return statement
+
+
+def select_list_with_count(query, tail, params, session, skip_count=False, expanding=(), serializer=None):
+    """
+    목록과 전체 갯수를 한 번의 쿼리로 조회
+        SELECT 절에 COUNT(*) OVER() 윈도우 함수를 추가하여 LIMIT 적용 전의 전체 row 수를 목록과 함께 조회합니다.
+        같은 JOIN, WHERE 조건을 가진 COUNT 쿼리를 따로 실행하지 않아도 됩니다.
+        요청한 페이지가 마지막 페이지를 넘어 조회된 row가 없을 때만 COUNT 쿼리를 추가로 실행합니다.
+
+    args :
+        query      : 검색 조건까지 적용된 SELECT 쿼리문 (ORDER BY, LIMIT 제외)
+        tail       : 정렬, 페이지네이션 쿼리문 (ORDER BY ... LIMIT ... OFFSET ...)
+        params     : 쿼리에 바인딩할 값
+        session    : connection 형성된 session 객체
+        skip_count : True 이면 전체 갯수를 구하지 않음 (무한 스크롤 등 전체 갯수가 필요없는 화면)
+        expanding  : IN 절에 리스트를 바인딩할 파라미터 이름 tuple
+        serializer : row 를 응답 dict 로 바로 변환하는 serializer.RowSerializer (없으면 dict(row))
+
+    returns :
+        row dict 리스트, 전체 갯수 (skip_count 인 경우 None)
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    if skip_count:
+        rows = session.execute(cached_text(query + tail, expanding), params).fetchall()
+        return [serializer(row) if serializer else dict(row) for row in rows], None
+
+    counted_query = SELECT_KEYWORD.sub('SELECT COUNT(*) OVER() AS total_count,', query, count=1)
+    rows = session.execute(cached_text(counted_query + tail, expanding), params).fetchall()
+
+    # serializer 는 spec 에 있는 컬럼만 꺼내므로 total_count 는 첫 row 에서 읽는다.
+    if serializer:
+        result_list = [serializer(row) for row in rows]
+        if rows:
+            total_count = rows[0]['total_count']
+    else:
+        result_list = []
+        for row in rows:
+            dict_row = dict(row)
+            total_count = dict_row.pop('total_count')
+            result_list.append(dict_row)
+
+    # 조회된 row가 없는 경우 : 검색결과가 없거나 OFFSET이 전체 갯수를 넘은 경우
+    if not result_list:
+        total_count = session.execute(cached_text(f"SELECT COUNT(*) FROM ({query}) AS filtered", expanding), params).fetchone()[0]
+
+    return result_list, int(total_count)
+
+
+class ConditionBuilder:
+    """
+    검색 조건문 생성기
+        검색 조건마다 값 대신 바인딩 파라미터를 가진 조건문을 추가하고 값은 params 에 모읍니다.
+        값이 조건문에 들어가지 않으므로 SQL injection 이 불가능하고, 같은 검색 조건 조합은 항상 같은 쿼리문이 되어
+        cached_text 와 MySQL 의 statement digest 별 통계/실행계획을 재사용할 수 있습니다.
+
+        builder = ConditionBuilder()
+        builder.add('coupons.is_deleted = 0')
+        builder.add('coupons.id = :coupon_id', coupon_id=1)
+        builder.add_in('s_info.seller_attribute_id', 'mdSeNo', [1, 2])
+        query += builder.where()
+        session.execute(cached_text(query, builder.expanding), builder.params)
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    def __init__(self):
+        self.conditions = []
+        self.params = {}
+        self.expanding = ()
+
+    def add(self, condition, **params):
+        self.conditions.append(condition)
+        self.params.update(params)
+
+    def add_in(self, column, param_name, values):
+        # 값의 갯수와 상관없이 같은 쿼리문이 되도록 expanding 파라미터로 바인딩
+        self.conditions.append(f'{column} IN :{param_name}')
+        self.params[param_name] = list(values)
+        self.expanding += (param_name,)
+
+    def add_like(self, column, param_name, keyword):
+        self.add(f'{column} LIKE :{param_name}', **{param_name: f'%{keyword}%'})
+
+    def add_keyword(self, column, param_name, keyword):
+        self.conditions.append(keyword_condition(column, param_name, keyword, self.params))
+
+    def where(self):
+        if not self.conditions:
+            return ''
+        return ' WHERE ' + ' AND '.join(self.conditions)
+
+
+# 현재 상태 스냅샷 테이블 : 이력 테이블명 -> (스냅샷 테이블명, 업무 키 컬럼, 현재 이력 조건)
+CURRENT_SNAPSHOT_TABLES = {
+    'product_info'    : ('product_info_current',    'product_id',      "is_deleted = 0"),
+    'seller_info'     : ('seller_info_current',     'seller_id',       "end_date = '9999-12-31 23:59:59' AND is_deleted = 0"),
+    'order_item_info' : ('order_item_info_current', 'order_detail_id', "end_date = '9999-12-31 23:59:59'")
+}
+
+
+def refresh_current_snapshot(table, keys, session, key_column=None):
+    """
+    현재 상태 스냅샷 갱신
+        이력 테이블에서 keys 에 해당하는 현재 row 를 읽어 스냅샷 테이블(*_current)의 row 를 교체합니다.
+        이력이 종료되어 현재 row 가 없는 키는 스냅샷에서도 삭제됩니다.
+        이력을 INSERT / UPDATE 한 DAO 메소드에서 같은 session 으로 호출하여 같은 트랜잭션에서 갱신합니다.
+
+    args :
+        table      : 이력 테이블명 (product_info, seller_info, order_item_info)
+        keys       : 갱신할 업무 키 리스트
+        session    : connection 형성된 session 객체
+        key_column : keys 에 해당하는 컬럼 (기본값 테이블의 업무 키, 이력 id 로 갱신할 때는 'id')
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    if not keys:
+        return
+
+    current_table, business_key, current_condition = CURRENT_SNAPSHOT_TABLES[table]
+    key_column = key_column or business_key
+
+    delete_query = cached_text(f""" DELETE FROM {current_table}
+                                    WHERE {key_column} IN :keys
+                               """, ('keys',))
+
+    # 스냅샷 테이블은 이력 테이블과 컬럼 순서가 같다. (CREATE TABLE ... LIKE)
+    insert_query = cached_text(f""" INSERT INTO {current_table}
+                                    SELECT *
+                                    FROM {table}
+                                    WHERE {key_column} IN :keys
+                                    AND {current_condition}
+                               """, ('keys',))
+
+    session.execute(delete_query, {'keys': list(keys)})
+    session.execute(insert_query, {'keys': list(keys)})
+
+
+# ngram FULLTEXT 인덱스의 토큰 길이 (MySQL ngram_token_size, 기본값 2)
+NGRAM_TOKEN_SIZE = 2
+
+
+def keyword_condition(column, param_name, keyword, params):
+    """
+    키워드 검색 조건 생성
+        ngram FULLTEXT 인덱스가 있는 컬럼에 대해 MATCH ... AGAINST 구문 검색 조건을 만들고 바인딩할 값을 params 에 추가합니다.
+        키워드를 큰따옴표로 감싸 ngram 토큰이 연속으로 나타나는 row 만 찾으므로 LIKE '%키워드%' 와 같은 결과를 인덱스로 조회합니다.
+        키워드가 ngram 토큰보다 짧으면 인덱스로 찾을 수 없으므로 LIKE 조건을 사용합니다.
+
+    args :
+        column     : 검색할 컬럼 (FULLTEXT ... WITH PARSER ngram 인덱스가 있어야 함)
+        param_name : 바인딩할 파라미터 이름
+        keyword    : 검색어
+        params     : 쿼리에 바인딩할 값 dict
+
+    returns :
+        검색 조건 쿼리문
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    # 구문 검색의 구분자인 큰따옴표는 검색어에서 제외
+    keyword = str(keyword).replace('"', '').strip()
+
+    if len(keyword) < NGRAM_TOKEN_SIZE:
+        params[param_name] = f'%{keyword}%'
+        return f'{column} LIKE :{param_name}'
+
+    params[param_name] = f'"{keyword}"'
+    return f'MATCH({column}) AGAINST (:{param_name} IN BOOLEAN MODE)'
@@ -0,0 +1,112 @@
+import time
+import threading
+
+# 거의 바뀌지 않아 프로세스 내에 캐시하는 기준 정보 테이블
+REFERENCE_TABLES = (
+    'main_categories',
+    'first_categories',
+    'second_categories',
+    'seller_attributes',
+    'seller_status',
+    'order_status',
+    'refund_reasons',
+    'cancel_reasons',
+    'coupon_issue_types',
+    'coupon_issue_method',
+    'question_types'
+)
+
+# 기준 정보 캐시 만료 시간(초)
+REFERENCE_DATA_TTL = 600
+
+class ReferenceDao:
+    def select_reference_tables(self, session):
+        """
+        기준 정보 테이블 조회
+            REFERENCE_TABLES 의 모든 row 를 조회합니다.
+
+        args :
+            session : connection 형성된 session 객체
+
+        returns :
+            테이블명 -> row dict 리스트
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        return {
+            table: [dict(row) for row in session.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()]
+            for table in REFERENCE_TABLES
+        }
+
+class ReferenceDataCache:
+    """
+    프로세스 내 기준 정보 캐시
+        카테고리, 셀러 속성, 주문상태, 환불/취소 사유, 쿠폰 발급유형, 문의유형 테이블을 한번에 읽어 보관하고
+        DAO 는 JOIN 대신 이 캐시에서 id 로 이름을 찾습니다.
+        ttl(초)이 지나면 다음 조회 시 다시 읽고, reload 로 즉시 다시 읽을 수 있습니다.
+        다시 읽을 때마다 version 이 1 씩 증가하며, 조회 중인 요청은 교체 전 snapshot 을 그대로 사용합니다.
+        ttl 이 지나 다시 읽는 것은 한 요청만 실행하고, 그동안 다른 요청은 이전 snapshot 을 사용합니다.
+        처음 읽는 경우에만 다른 요청이 읽기를 마칠 때까지 기다립니다.
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    def __init__(self, loader, ttl):
+        self.loader = loader
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # ttl 만료 시 한 요청만 다시 읽도록 하는 lock
+        self._reload_lock = threading.Lock()
+        # (version, 읽은 시간, 테이블명 -> row 리스트, 테이블명 -> {id: row})
+        self._snapshot = (0, None, {}, {})
+
+    def reload(self, session):
+        tables = self.loader(session)
+        indexes = {table: {row['id']: row for row in rows} for table, rows in tables.items()}
+
+        with self._lock:
+            version = self._snapshot[0] + 1
+            self._snapshot = (version, time.monotonic(), tables, indexes)
+
+        return version
+
+    def _expired(self, loaded_at):
+        return loaded_at is None or time.monotonic() - loaded_at >= self.ttl
+
+    def snapshot(self, session):
+        version, loaded_at, tables, indexes = self._snapshot
+
+        if self._expired(loaded_at):
+            # 이전 snapshot 이 있으면 다른 요청이 다시 읽는 중일 때 기다리지 않고 이전 snapshot 을 사용한다.
+            if self._reload_lock.acquire(blocking = loaded_at is None):
+                try:
+                    # lock 을 기다리는 동안 다른 요청이 이미 다시 읽었으면 다시 읽지 않는다.
+                    if self._expired(self._snapshot[1]):
+                        self.reload(session)
+                finally:
+                    self._reload_lock.release()
+
+                version, loaded_at, tables, indexes = self._snapshot
+
+        return version, tables, indexes
+
+    def rows(self, table, session):
+        return self.snapshot(session)[1][table]
+
+    def get(self, table, row_id, session):
+        return self.snapshot(session)[2][table].get(row_id)
+
+    def name(self, table, row_id, name_column, session):
+        row = self.get(table, row_id, session)
+        return row[name_column] if row else None
+
+# 프로세스 전체에서 공유하는 기준 정보 캐시
+reference_cache = ReferenceDataCache(ReferenceDao().select_reference_tables, REFERENCE_DATA_TTL)
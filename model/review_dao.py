@@ -1,6 +1,8 @@
 import math
 from flask           import jsonify
 
+from model.query_util import select_list_with_count
+
 class ReviewDao:
     def get_review_list(self, valid_param, session):
         """
@@ -24,6 +26,9 @@ class ReviewDao:
              - SQL LIMIT, OFFSET 사용하여 10개씩 보기 등의 로직 가능하도록 구현
              - 마지막 페이지 number return 하도록 변경
             2020-10-13 (hj885353@gmail.com) : review_id 기준 내림차순 정렬 추가
+            2026-10-18 (hj885353@gmail.com) : COUNT(*) OVER()로 목록과 갯수를 한 번에 조회, skipCount 추가
+             - 등록일시, 수정일시 최신순 정렬 시 ORDER BY가 두 번 붙던 문제 수정
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 상품/셀러 정보 스냅샷 테이블 조회
         """
         # 리뷰에 필요한 데이터를 조회하는 쿼리문
         select_review_statement = """
@@ -39,25 +44,9 @@ class ReviewDao:
             FROM reviews as r
             LEFT JOIN order_item_info as oii ON r.order_item_info_id = oii.id
             LEFT JOIN products as p ON oii.product_id = p.id
-            LEFT JOIN product_info as pi ON p.id = pi.product_id
+            LEFT JOIN product_info_current as pi ON p.id = pi.product_id
             LEFT JOIN users as u ON r.user_id = u.id
-            LEFT JOIN seller_info as si ON pi.seller_id = si.seller_id
-            WHERE si.is_deleted = 0
-            AND p.is_deleted = 0
-            AND pi.is_deleted = 0
-            AND u.is_deleted = 0
-        """
-
-        # 쿼리스트링이 들어왔을 때, 조건에 맞게 필터링 된 리뷰의 갯수를 count 해주는 쿼리문
-        filter_query_values_count_statement = """
-            SELECT 
-                COUNT(0) as filtered_review_count
-            FROM reviews as r
-            LEFT JOIN order_item_info as oii ON r.order_item_info_id = oii.id
-            LEFT JOIN products as p ON oii.product_id = p.id
-            LEFT JOIN product_info as pi ON p.id = pi.product_id
-            LEFT JOIN users as u ON r.user_id = u.id
-            LEFT JOIN seller_info as si ON pi.seller_id = si.seller_id
+            LEFT JOIN seller_info_current as si ON pi.seller_id = si.seller_id
             WHERE si.is_deleted = 0
             AND p.is_deleted = 0
             AND pi.is_deleted = 0
@@ -67,54 +56,53 @@ class ReviewDao:
         # 글 내용
         if valid_param.get('REVIEW_TEXT', None):
             select_review_statement += " AND r.content = :REVIEW_TEXT"
-            filter_query_values_count_statement += " AND r.content = :REVIEW_TEXT"
 
         # 글 번호
         if valid_param.get('PRODUCT_INQRY_NO', None):
             select_review_statement += " AND r.id = :PRODUCT_INQRY_NO"
-            filter_query_values_count_statement += " AND r.id = :PRODUCT_INQRY_NO"
 
         # 셀러명
         if valid_param.get('MEMBER_NAME', None):
             select_review_statement += " AND u.login_id = :MEMBER_NAME"
-            filter_query_values_count_statement += " AND u.login_id = :MEMBER_NAME"
 
         # 등록일. ~부터 ~까지
         if valid_param.get('registStartDate', None) and valid_param.get('registEndDate', None):
             select_review_statement += " AND date_format(r.created_at, '%Y-%m-%d %h:%i %p') BETWEEN :registStartDate AND :registEndDate"
-            filter_query_values_count_statement += " AND date_format(r.created_at, '%Y-%m-%d %h:%i %p') BETWEEN :registStartDate AND :registEndDate"
 
         # 수정일. ~부터 ~까지
         if valid_param.get('updateStartDate', None) and valid_param.get('updateEndDate', None):
             select_review_statement += " AND date_format(r.updated_at, '%Y-%m-%d %h:%i %p') BETWEEN :updateStartDate AND :updateEndDate"
-            filter_query_values_count_statement += " AND date_format(r.updated_at, '%Y-%m-%d %h:%i %p') BETWEEN :updateStartDate AND :updateEndDate"
+
+        # 정렬 기준. 등록일시, 수정일시 최신순이 들어오지 않으면 review_id 기준 내림차순
+        order_by_columns = []
 
         # 등록일시 최신순
         if valid_param.get('NEW_REGIST', None):
-            select_review_statement += " ORDER BY created_at DESC"
-            filter_query_values_count_statement += " ORDER BY created_at DESC"
+            order_by_columns.append("r.created_at DESC")
 
         # 수정일시 최신순
         if valid_param.get('NEW_EDIT', None):
-            select_review_statement += " ORDER BY updated_at DESC"
-            filter_query_values_count_statement += " ORDER BY updated_at DESC"
+            order_by_columns.append("r.updated_at DESC")
+
+        order_by_columns.append("r.id DESC")
+        pagination_statement = " ORDER BY " + ", ".join(order_by_columns)
 
-        # pagination 및 내림차순 정렬
+        # pagination
         if valid_param.get('filterLimit', None):
             if valid_param.get('page', None):
                 valid_param['offset'] = (valid_param['page']-1) * valid_param['filterLimit']
-                select_review_statement += " ORDER BY r.id DESC LIMIT :filterLimit OFFSET :offset"
+                pagination_statement += " LIMIT :filterLimit OFFSET :offset"
             else:
-                select_review_statement += " ORDER BY r.id DESC LIMIT :filterLimit"
-
-        # 리뷰 전체 가져와서 dict 형태로 casting
-        review_lists = session.execute(select_review_statement, valid_param).fetchall()
-        review_list = [ dict(review) for review in review_lists ]
+                pagination_statement += " LIMIT :filterLimit"
 
-        # 필터링 된 count를 fetch 및 dictionary로 casting
-        review_count = int(session.execute(filter_query_values_count_statement, valid_param).fetchone()[0])
+        # 리뷰 목록과 필터링 된 count를 한 번의 쿼리로 가져옴. skipCount인 경우 count는 None
+        review_list, review_count = select_list_with_count(
+            select_review_statement, pagination_statement, valid_param, session, valid_param.get('skipCount', None)
+        )
 
-        page_number = math.ceil(review_count / valid_param['filterLimit'])
+        page_number = None
+        if review_count is not None and valid_param.get('filterLimit', None):
+            page_number = math.ceil(review_count / valid_param['filterLimit'])
 
         return review_list, review_count, page_number
 
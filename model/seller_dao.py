@@ -4,6 +4,9 @@ import math
 from flask           import jsonify
 from sqlalchemy import text
 
+from model.query_util import select_list_with_count, refresh_current_snapshot
+from utils import invalidate_seller_principal
+
 class SellerDao:
     def insert_seller(self, seller_info, session):
         """
@@ -32,6 +35,7 @@ class SellerDao:
                 기존 : seller_info Table -> loginID
                 변경 : sellers Table -> login_id
             2020-10-12 (hj885353@gmail.com) : f-string 방식을 dict insert 방식으로 변경
+            2026-10-18 (hj885353@gmail.com) : 현재 셀러 정보 스냅샷 테이블(seller_info_current) 갱신 추가
         """
         
         # sellers table에 data를 input
@@ -102,6 +106,9 @@ class SellerDao:
             )
         """), seller_info)
 
+        # 현재 셀러 정보 스냅샷 갱신
+        refresh_current_snapshot('seller_info', [new_seller_last_id], session)
+
     def get_seller_id_and_password(self, seller_info, session):
         """
         로그인 하기 위해 seller의 id와 password를 select 하는 함수
@@ -121,6 +128,7 @@ class SellerDao:
             2020-10-07 (hj885353@gmail.com) : schema 변경으로 쿼리문 수정
                 기존 : seller_info Table -> loginID
                 변경 : sellers Table -> login_id
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 셀러 정보 스냅샷 테이블(seller_info_current) 조회
         """
         # request로 들어 온 ID에 해당하는 password를 가지고 와서 fetch. return type : tuple
         seller_info_statement = """
@@ -128,7 +136,7 @@ class SellerDao:
                 sellers.id,
                 password
             FROM
-                seller_info
+                seller_info_current AS seller_info
             LEFT OUTER JOIN sellers ON sellers.id = seller_info.seller_id
             WHERE sellers.login_id = :login_id
         """
@@ -161,6 +169,10 @@ class SellerDao:
                       마지막 페이지 번호도 Response로 보내주도록 구현
                       필터링 된 갯수만 return해주도록 변경. 
             2020-10-13 (hj885353@gmail.com) : 내림차순 로직 추가
+            2026-10-18 (hj885353@gmail.com) : 셀러 리스트와 셀러 수를 COUNT(*) OVER()로 한 번에 조회, skipCount 추가
+                기존 : 같은 검색조건으로 리스트 쿼리와 COUNT 쿼리를 각각 실행
+                변경 : 리스트 쿼리 한 번으로 필터 된 셀러 수까지 조회. skipCount인 경우 seller_count, page_number는 None
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 셀러 정보 스냅샷 테이블(seller_info_current) 조회
         """
         # 키워드 검색을 위한 쿼리문
         select_seller_list_statement = """
@@ -175,120 +187,93 @@ class SellerDao:
                 managers.email,
                 seller_attribute_id,
                 (
-                    SELECT COUNT(DISTINCT product_info.product_id)
-                    FROM product_info
+                    SELECT COUNT(*)
+                    FROM product_info_current AS product_info
                     WHERE product_info.seller_id = sellers.id
                 ) as product_count,
                 site_url,
                 start_at
-            FROM seller_info
+            FROM seller_info_current AS seller_info
             INNER JOIN sellers ON sellers.id = seller_info.seller_id
             INNER JOIN managers ON managers.id = seller_info.manager_id
-            WHERE seller_info.end_date = '9999-12-31 23:59:59'
-            AND seller_info.is_deleted = 0
-            AND sellers.is_deleted = 0
+            WHERE sellers.is_deleted = 0
             AND managers.is_deleted = 0
         """
         
-        # 키워드검색이 들어왔을 때 검색결과의 셀러를 count 하기 위한 쿼리
-        filter_query_values_count_statement = """
-            SELECT 
-                COUNT(0) as filtered_seller_count
-            FROM seller_info
-            INNER JOIN sellers ON sellers.id = seller_info.seller_id
-            INNER JOIN managers ON managers.id = seller_info.manager_id
-            WHERE seller_info.end_date = '9999-12-31 23:59:59'
-            AND seller_info.is_deleted = 0
-            AND sellers.is_deleted = 0
-        """
-
         # 회원 번호
         if valid_param.get('mber_no', None):
             select_seller_list_statement += " AND seller_id = :mber_no"
-            filter_query_values_count_statement += " AND seller_id = :mber_no"
 
         # 셀러 아이디
         if valid_param.get('mber_ncnm', None):
             select_seller_list_statement += " AND sellers.login_id = :mber_ncnm"
-            filter_query_values_count_statement += " AND sellers.login_id = :mber_ncnm"
 
         # 영어 이름
         if valid_param.get('mber_en', None):
             select_seller_list_statement += " AND eng_name = :mber_en"
-            filter_query_values_count_statement += " AND eng_name = :mber_en"
 
         # 한글 이름
         if valid_param.get('mber_ko', None):
             select_seller_list_statement += " AND korean_name = :mber_ko"
-            filter_query_values_count_statement += " AND korean_name = :mber_ko"
 
         # 담당자 이름
         if valid_param.get('manager_name', None):
             select_seller_list_statement += " AND managers.name = :manager_name"
-            filter_query_values_count_statement += " AND managers.name = :manager_name"
 
         # 셀러 상태
         if valid_param.get('seller_status', None):
             select_seller_list_statement += " AND seller_status_id = :seller_status"
-            filter_query_values_count_statement += " AND seller_status_id = :seller_status"
 
         # 담당자 연락처
         if valid_param.get('manager_telno', None):
             select_seller_list_statement += " AND managers.phone_number = :manager_telno"
-            filter_query_values_count_statement += " AND managers.phone_number = :manager_telno"
 
         # 담당자 이메일
         if valid_param.get('manager_email', None):
             select_seller_list_statement += " AND managers.email = :manager_email"
-            filter_query_values_count_statement += " AND managers.email = :manager_email"
 
         # 셀러 속성
         if valid_param.get('seller_attribute', None):
             select_seller_list_statement += " AND seller_attribute_id = :seller_attribute"
-            filter_query_values_count_statement += " AND seller_attribute_id = :seller_attribute"
 
         # 등록일 검색 시작 날짜
         if valid_param.get('mber_date_from', None):
             select_seller_list_statement += " AND DATE(start_at) >= :mber_date_from"
-            filter_query_values_count_statement += " AND DATE(start_at) >= :mber_date_from"
 
         # 등록일 검색 끝 날짜
         if valid_param.get('mber_date_from', None) and valid_param.get('mber_date_to', None):
             select_seller_list_statement += " AND DATE(start_at) BETWEEN :mber_date_from AND :mber_date_to"
-            filter_query_values_count_statement += " AND DATE(start_at) BETWEEN :mber_date_from AND :mber_date_to"
 
         # action
         if valid_param.get('action', None):
             select_seller_list_statement += " AND action = :action"
-            filter_query_values_count_statement += " AND action = :action"
 
         # 선분이력 시작
         if valid_param.get('start_at', None):
             select_seller_list_statement += " AND start_at = :start_at"
-            filter_query_values_count_statement += " AND start_at = :start_at"
 
         # 선분이력 끝
         if valid_param.get('end_date', None):
             select_seller_list_statement += " AND end_date = :end_date"
-            filter_query_values_count_statement += " AND end_date = :end_date"
 
         # 페이지네이션
+        pagination_statement = " ORDER BY sellers.id DESC"
         if valid_param.get('filterLimit', None):
             if valid_param.get('page', None):
                 valid_param['offset'] = (valid_param['page']-1) * valid_param['filterLimit']
-                select_seller_list_statement += " ORDER BY sellers.id DESC LIMIT :filterLimit OFFSET :offset"
+                pagination_statement += " LIMIT :filterLimit OFFSET :offset"
             else:
-                select_seller_list_statement += " ORDER BY sellers.id DESC LIMIT :filterLimit"
-        
-        # sql 명령문에 키워드 추가가 완료되면 정렬, limit, offset 쿼리문 추가
-        seller_infos = session.execute(select_seller_list_statement, valid_param).fetchall()
-        seller_info = [ dict(seller) for seller in seller_infos ]
+                pagination_statement += " LIMIT :filterLimit"
 
-        # 쿼리파라미터가 들어오면 필터 된 셀러를 카운트하고 리턴 값에 포함시킨다. 쿼리파라미터가 들어오지않으면 전체 셀러 수를 포함시킴.
-        seller_count = session.execute(filter_query_values_count_statement, valid_param).fetchone()[0]
+        # 셀러 리스트와 필터 된 셀러 수를 한 번의 쿼리로 조회. skipCount가 들어오면 셀러 수는 구하지 않는다.
+        seller_info, seller_count = select_list_with_count(
+            select_seller_list_statement, pagination_statement, valid_param, session, valid_param.get('skipCount', None)
+        )
 
         # 마지막 페이지 번호 출력. filterLimit으로 count를 나누고 그 값을 올림해주어 Return
-        page_number = math.ceil(seller_count / valid_param['filterLimit'])
+        page_number = None
+        if seller_count is not None and valid_param.get('filterLimit', None):
+            page_number = math.ceil(seller_count / valid_param['filterLimit'])
 
         return seller_info, seller_count, page_number
 
@@ -306,6 +291,7 @@ class SellerDao:
             hj885353@gmail.com (김해준)
         History:
             2020-09-30 (hj885353@gmail.com) : 초기 생성
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 셀러 정보 스냅샷 테이블(seller_info_current) 조회
         """
         # 인자로 받은 seller_info에섯 seller_no를 미리 정의하기 위한 dict
         # 해당 작업을 수행하지 않을 경우 python dict cannot converted Error 발생
@@ -345,14 +331,12 @@ class SellerDao:
                 model_pants_size,
                 model_foots_size,
                 update_feed_message
-            FROM seller_info as si
+            FROM seller_info_current as si
             INNER JOIN sellers as s ON s.id = si.seller_id
             INNER JOIN managers as m ON m.id = si.manager_id
             INNER JOIN seller_status as ss ON ss.id = si.seller_status_id
             INNER JOIN seller_attributes as sa ON sa.id = si.seller_attribute_id
-            WHERE si.end_date = '9999-12-31 23:59:59'
-            AND s.id = :seller_no
-            AND si.is_deleted = 0
+            WHERE s.id = :seller_no
             AND s.is_deleted = 0
             AND m.is_deleted = 0
         """
@@ -382,6 +366,8 @@ class SellerDao:
                 기존 : now()를 바로 사용
                 변경 : db에서 now()를 미리 조회 한 후 해당 값을 변수에 할당하여 그 값을 INSERT 및 UPDATE로 선분이력 관리되도록 변경
                     : 새로운 row INSERT 시 password가 INSERT 되지 않아 해당 부분 수정
+            2026-10-18 (hj885353@gmail.com) : 수정 commit 후 로그인 셀러 정보 캐시 삭제
+            2026-10-18 (hj885353@gmail.com) : 현재 셀러 정보 스냅샷 테이블(seller_info_current) 갱신 추가
         """
         # 선분이력에 사용 할 now를 db에서 조회
         now = session.execute("""
@@ -508,6 +494,9 @@ class SellerDao:
                 0
             )"""), seller_info)
 
+        # 현재 셀러 정보 스냅샷 갱신
+        refresh_current_snapshot('seller_info', [seller_info['seller_no']], session)
+
         # 인자로 받은 seller_info_data의 값을 가지고 와서 db에 넣어주기 위한 작업
         manager_info = {
             'manager_name'        : seller_info_data['seller_data']['manager_name'],
@@ -527,6 +516,9 @@ class SellerDao:
                 :manager_email
             )"""), manager_info)
 
+        # 새로운 선분이력이 생성되었으므로 commit 이후 캐시된 로그인 셀러 정보를 삭제
+        invalidate_seller_principal(seller_info['seller_no'], session)
+
     def check_duplication_kor(self, kor_name, session):
         """
         셀러 정보 수정에서 한글 셀러명에 대한 중복검사를 하기 위해 DB에서 한글 셀러명을 조회하는 함수
@@ -543,14 +535,14 @@ class SellerDao:
             2020-10-07 (hj885353@gmail.com)
                 기존 : DB의 한글 셀러명을 모두 다 가져와서 list에 append 후 존재하는지 look up 하는 로직
                 변경 : DB에 request로 넘어온 한글 셀러명이 존재하는지 count로 확인. 존재하는 경우 count = 1, 존재하지 않는 경우 count = 0. 이걸로 판별하도록 변경
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 셀러 정보 스냅샷 테이블(seller_info_current) 조회
         """
         # DB에 있는 한글 셀러명 중 인자로 넘어온 kor_name이 있는지 조회하는 쿼리문
         seller_kor_name_statement = """
             SELECT
                 count(*)
-            FROM seller_info
-            WHERE korean_name = :korean_name 
-            AND is_deleted = 0
+            FROM seller_info_current
+            WHERE korean_name = :korean_name
         """
         # count로 쿼리문을 만족하는 갯수를 가져온다. 있을 경우 1, 없을 경우 0
         seller_kor_name = session.execute(seller_kor_name_statement, kor_name).fetchone()[0]
@@ -572,14 +564,14 @@ class SellerDao:
             2020-10-07 (hj885353@gmail.com)
                 기존 : DB의 영문 셀러명을 모두 다 가져와서 list에 append 후 존재하는지 look up 하는 로직
                 변경 : DB에 request로 넘어온 영문 셀러명이 존재하는지 count로 확인. 존재하는 경우 count = 1, 존재하지 않는 경우 count = 0. 이걸로 판별하도록 변경
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 셀러 정보 스냅샷 테이블(seller_info_current) 조회
         """
         # DB에 있는 한글 셀러명 중 인자로 넘어온 eng_name이 있는지 조회하는 쿼리문
         seller_eng_name_statement = """
             SELECT
                 count(*)
-            FROM seller_info
+            FROM seller_info_current
             WHERE eng_name = :eng_name
-            AND is_deleted = 0
         """
         # count로 쿼리문을 만족하는 갯수를 가져온다. 있을 경우 1, 없을 경우 0
         seller_eng_name = session.execute(seller_eng_name_statement, eng_name).fetchone()[0]
@@ -600,6 +592,7 @@ class SellerDao:
             hj885353@gmail.com (김해준)
         History:
             2020-10-02 (hj885353@gmail.com) : 초기 생성
+            2026-10-18 (hj885353@gmail.com) : 이력 테이블 대신 현재 셀러 정보 스냅샷 테이블(seller_info_current) 조회
         """
         seller_no_data = {
             'seller_no' : change_info['seller_info']['seller_no']
@@ -609,9 +602,8 @@ class SellerDao:
         seller_password_statement = """
             SELECT
                 password
-            FROM seller_info
-            WHERE is_deleted = 0
-            AND seller_id = :seller_no
+            FROM seller_info_current
+            WHERE seller_id = :seller_no
         """
         origin_password = dict(session.execute(seller_password_statement, seller_no_data).fetchone())
 
@@ -632,6 +624,8 @@ class SellerDao:
             hj885353@gmail.com (김해준)
         History:
             2020-10-02 (hj885353@gmail.com) : 초기 생성
+            2026-10-18 (hj885353@gmail.com) : 수정 commit 후 로그인 셀러 정보 캐시 삭제
+            2026-10-18 (hj885353@gmail.com) : 현재 셀러 정보 스냅샷 테이블(seller_info_current) 갱신 추가
         """
         change_info_data = {
             'password' : hashed_password,
@@ -648,4 +642,10 @@ class SellerDao:
             AND is_deleted = 0
         """
 
-        session.execute(update_password_statement, change_info_data)
\ No newline at end of file
+        session.execute(update_password_statement, change_info_data)
+
+        # 현재 셀러 정보 스냅샷 갱신
+        refresh_current_snapshot('seller_info', [change_info_data['seller_no']], session)
+
+        # commit 이후 로그인 셀러 정보 캐시 삭제
+        invalidate_seller_principal(change_info_data['seller_no'], session)
\ No newline at end of file
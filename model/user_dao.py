@@ -1,5 +1,7 @@
 import math
 
+from model.query_util import select_list_with_count
+
 class UserDao:
     def get_user_info(self, valid_param, session):
         """
@@ -19,6 +21,9 @@ class UserDao:
                 controller에서 dict casting 후 return
             변경 : QueryString을 사용한 filtering 기능 추가
                 dao에서 dict casting 한 후 그 값을 controller에서 받아서 return
+            2026-10-18 (hj885353@gmail.com)
+            기존 : 같은 filtering 조건으로 user_list 쿼리와 count 쿼리를 각각 실행
+            변경 : COUNT(*) OVER()로 user_list와 갯수를 한 번에 조회, skipCount 추가
         """
         select_user_statement = """
             SELECT
@@ -32,55 +37,43 @@ class UserDao:
             WHERE is_deleted = 0
         """
 
-        filter_query_values_count_statement = """
-            SELECT
-                count(0) as filtered_user_count
-            FROM
-                users
-            WHERE is_deleted = 0
-        """
-        
         # 회원 번호
         if valid_param.get('mber_no', None):
             select_user_statement += " AND id = :mber_no"
-            filter_query_values_count_statement += " AND id = :mber_no"
 
         # 회원 로그인 아이디
         if valid_param.get('mber_ncnm', None):
             select_user_statement += " AND login_id = :mber_ncnm"
-            filter_query_values_count_statement += " AND login_id = :mber_ncnm"
 
         # 회원 핸드폰 번호
         if valid_param.get('mber_phone', None):
             select_user_statement += " AND phone_number = :mber_phone"
-            filter_query_values_count_statement += " AND phone_number = :mber_phone"
 
         # 회원 이메일
         if valid_param.get('mber_email', None):
             select_user_statement += " AND email = :mber_email"
-            filter_query_values_count_statement += " AND email = :mber_email"
 
         # 등록일시 ~부터 ~까지
         if valid_param.get('mber_date_from', None) and valid_param.get('mber_date_to', None):
             select_user_statement += " AND DATE(created_at) BETWEEN :mber_date_from AND :mber_date_to"
-            filter_query_values_count_statement += " AND DATE(created_at) BETWEEN :mber_date_from AND :mber_date_to"
 
         # 페이지네이션
+        pagination_statement = " ORDER BY id DESC"
         if valid_param.get('filterLimit', None):
             if valid_param.get('page', None):
                 valid_param['offset'] = (valid_param['page']-1) * valid_param['filterLimit']
-                select_user_statement += " ORDER BY id DESC LIMIT :filterLimit OFFSET :offset"
+                pagination_statement += " LIMIT :filterLimit OFFSET :offset"
             else:
-                select_user_statement += " ORDER BY id DESC LIMIT :filterLimit"
-
-        # 쿼리문을 만족하는 모든 user_list를 가져옴
-        user_lists = session.execute(select_user_statement, valid_param).fetchall()
-        user_list = [ dict(user) for user in user_lists ]
+                pagination_statement += " LIMIT :filterLimit"
 
-        # 쿼리문을 만족하는 raw의 갯수
-        user_count = int(session.execute(filter_query_values_count_statement, valid_param).fetchone()[0])
+        # 쿼리문을 만족하는 user_list와 raw의 갯수를 한 번의 쿼리로 가져옴. skipCount인 경우 갯수는 None
+        user_list, user_count = select_list_with_count(
+            select_user_statement, pagination_statement, valid_param, session, valid_param.get('skipCount', None)
+        )
 
         # 마지막 페이지 number를 넘겨줌. 올림 처리
-        page_number = math.ceil(user_count / valid_param['filterLimit'])
+        page_number = None
+        if user_count is not None and valid_param.get('filterLimit', None):
+            page_number = math.ceil(user_count / valid_param['filterLimit'])
 
-        return user_list, user_count, page_number
\ No newline at end of file
+        return user_list, user_count, page_number
@@ -0,0 +1,86 @@
+"""
+상품 일괄 등록 스크립트
+    CSV / XLSX 파일을 한 줄씩 읽어 상품 등록 API 와 같은 제한 사항을 확인하고 --batch-size 개씩 등록한 뒤 batch 마다 commit 합니다.
+    batch 가 끝날 때마다 진행 상황과 처리 속도를 출력하고, 제한 사항에 맞지 않는 줄은 줄 번호와 에러 메세지를 출력합니다.
+    파일 컬럼은 service/product_service.py 의 PRODUCT_IMPORT_COLUMNS 를 참고합니다.
+
+    python product_import.py products.csv --modifier-id 1
+    python product_import.py products.xlsx --modifier-id 1 --seller-id 3 --batch-size 1000
+
+Authors:
+    고지원
+
+History:
+    2026-10-18 (고지원): 초기 생성
+"""
+import sys
+import time
+import argparse
+import traceback
+
+from sqlalchemy     import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import config
+
+from model                   import ProductDao
+from service                 import ProductService
+from service.product_service import PRODUCT_IMPORT_BATCH_SIZE
+from utils                   import read_import_rows
+
+def run(path, modifier_id, seller_id, batch_size):
+    database = create_engine(config.DB_URL, encoding = 'utf-8', pool_size = 1)
+    Session = sessionmaker(bind = database)
+
+    product_service = ProductService(ProductDao())
+
+    file_format = path.rsplit('.', 1)[-1].lower()
+
+    started_at = time.time()
+    batch_number = 0
+    inserted_count = 0
+    failed_count = 0
+
+    session = Session()
+    try:
+        with open(path, 'rb') as stream:
+            rows = read_import_rows(stream, file_format)
+
+            for batch_count, batch_errors in product_service.import_products(
+                    rows, modifier_id, session, seller_id, batch_size):
+                # batch 마다 commit 한다.
+                session.commit()
+
+                batch_number += 1
+                inserted_count += batch_count
+                failed_count += len(batch_errors)
+
+                for error in batch_errors:
+                    print(f"{error['line']} 번째 줄 : {error['message']}", flush = True)
+
+                elapsed = time.time() - started_at
+                print(f'batch {batch_number} : {batch_count} 개 등록 '
+                      f'(누적 {inserted_count} 개, 실패 {failed_count} 줄, {elapsed:.1f}초, '
+                      f'분당 {inserted_count / elapsed * 60 if elapsed else 0:.0f} 개)', flush = True)
+
+    except Exception:
+        session.rollback()
+        traceback.print_exc()
+        print(f'상품 일괄 등록 중단 : {inserted_count} 개 등록 후 실패', flush = True)
+        return 1
+
+    finally:
+        session.close()
+
+    print(f'상품 일괄 등록 완료 : {inserted_count} 개 등록, {failed_count} 줄 실패, {time.time() - started_at:.1f}초', flush = True)
+    return 1 if failed_count else 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = '상품 일괄 등록')
+    parser.add_argument('path', help = '상품 정보 파일 (.csv, .xlsx)')
+    parser.add_argument('--modifier-id', type = int, required = True, help = '등록하는 셀러(관리자) id')
+    parser.add_argument('--seller-id', type = int, default = None, help = '지정하면 파일의 seller_id 대신 사용')
+    parser.add_argument('--batch-size', type = int, default = PRODUCT_IMPORT_BATCH_SIZE, help = '한 transaction 에서 등록할 상품 수')
+    args = parser.parse_args()
+
+    sys.exit(run(args.path, args.modifier_id, args.seller_id, args.batch_size))
@@ -0,0 +1,23 @@
+/*
+product_image_deletions 테이블
+    상품 수정으로 교체된 s3 이미지의 삭제 대기열 (outbox)
+    상품 수정 트랜잭션 안에서 삭제할 이미지 key 를 기록하고,
+    image_deletion_worker.py 가 commit 된 row 만 읽어 s3 에서 일괄 삭제한 뒤 row 를 지운다.
+    트랜잭션이 rollback 되면 row 도 남지 않으므로 사용 중인 이미지가 삭제되지 않는다.
+
+Authors:
+    고지원
+
+History:
+    2026-10-18 (고지원) : 초기 생성
+*/
+
+CREATE TABLE brandi.product_image_deletions
+(
+    `id`          INT             NOT NULL    AUTO_INCREMENT, 
+    `image_key`   VARCHAR(500)    NOT NULL    COMMENT 's3 이미지 key', 
+    `attempts`    INT             NOT NULL    DEFAULT 0                    COMMENT '삭제 실패 횟수', 
+    `last_error`  VARCHAR(500)    NULL        COMMENT '마지막 삭제 실패 사유', 
+    `created_at`  DATETIME        NOT NULL    DEFAULT CURRENT_TIMESTAMP    COMMENT '삭제 요청 시간', 
+    PRIMARY KEY (id)
+);
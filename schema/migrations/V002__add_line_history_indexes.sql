@@ -0,0 +1,67 @@
+/*
+선분이력 테이블 복합 인덱스
+    현재 이력(end_date = '9999-12-31 23:59:59' 또는 is_deleted = 0)과 업무 키를 같이 조건으로 거는
+    DAO 쿼리들이 PK/FK 인덱스만으로는 full scan 하거나 FK 인덱스로 찾은 뒤 이력 row 를 모두 읽었다.
+    각 인덱스는 아래 쿼리의 WHERE / JOIN / ORDER BY 컬럼 순서에 맞추어 설계하였다.
+    schema/explain_check.py 로 인덱스가 사용되는지 확인한다.
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+*/
+
+-- order_item_info
+--   주문 목록 : WHERE order_status_id = ? AND end_date = '9999-12-31 23:59:59' 후 orders 와 order_id 로 JOIN
+ALTER TABLE brandi.order_item_info
+    ADD INDEX IX_order_item_info_order_status_id_end_date_order_id (order_status_id, end_date, order_id);
+
+--   주문상태변경 / 상세 : WHERE order_detail_id IN (...) AND end_date = ? AND is_deleted = ?
+ALTER TABLE brandi.order_item_info
+    ADD INDEX IX_order_item_info_order_detail_id_end_date_is_deleted (order_detail_id, end_date, is_deleted);
+
+--   결제일 검색으로 orders 부터 읽는 주문 목록 : ON order_id = orders.id AND end_date = '9999-12-31 23:59:59'
+--   주문 이력 : WHERE order_id = ? (FK 인덱스 FK_order_item_info_order_id_orders_id 를 대신한다)
+ALTER TABLE brandi.order_item_info
+    ADD INDEX IX_order_item_info_order_id_end_date (order_id, end_date);
+
+--   자동 구매확정 : WHERE order_status_id = 4 AND end_date = '9999-12-31 23:59:59' AND shipping_complete_date <= ?
+ALTER TABLE brandi.order_item_info
+    ADD INDEX IX_order_item_info_order_status_id_end_date_shipping_complete_date (order_status_id, end_date, shipping_complete_date);
+
+
+-- orders
+--   주문 목록 : 결제일 기간 검색, 결제일 정렬
+ALTER TABLE brandi.orders
+    ADD INDEX IX_orders_payment_date (payment_date);
+
+
+-- seller_info
+--   셀러 JOIN / 로그인 / 셀러 상세 : ON seller_id = ? AND end_date = '9999-12-31 23:59:59' AND is_deleted = 0
+ALTER TABLE brandi.seller_info
+    ADD INDEX IX_seller_info_seller_id_end_date_is_deleted (seller_id, end_date, is_deleted);
+
+--   셀러 속성 필터 : WHERE seller_attribute_id IN (...) AND end_date = '9999-12-31 23:59:59'
+ALTER TABLE brandi.seller_info
+    ADD INDEX IX_seller_info_seller_attribute_id_end_date_seller_id (seller_attribute_id, end_date, seller_id);
+
+
+-- product_info
+--   상품 JOIN / 상품 상세 : ON product_id = ? AND is_deleted = 0 ORDER BY created_at DESC
+ALTER TABLE brandi.product_info
+    ADD INDEX IX_product_info_product_id_is_deleted_created_at (product_id, is_deleted, created_at);
+
+--   상품 목록 : WHERE is_deleted = 0 AND created_at BETWEEN ? AND ?
+ALTER TABLE brandi.product_info
+    ADD INDEX IX_product_info_is_deleted_created_at (is_deleted, created_at);
+
+--   셀러 목록의 상품 갯수 : WHERE seller_id = ? AND is_deleted = 0
+ALTER TABLE brandi.product_info
+    ADD INDEX IX_product_info_seller_id_is_deleted (seller_id, is_deleted);
+
+
+-- product_images
+--   상품 상세 이미지 : WHERE product_info_id = ? ORDER BY ordering
+ALTER TABLE brandi.product_images
+    ADD INDEX IX_product_images_product_info_id_ordering (product_info_id, ordering);
@@ -0,0 +1,67 @@
+/*
+현재 상태 스냅샷 테이블
+    product_info, seller_info, order_item_info 선분이력 테이블의 현재 row 만 담는 테이블.
+    목록/상세 조회는 이력이 쌓일수록 커지는 이력 테이블 대신 이 테이블을 읽는다.
+
+    - 이력 테이블과 컬럼 순서가 같도록 CREATE TABLE ... LIKE 로 생성한다.
+      (이력 테이블에 컬럼을 추가하면 스냅샷 테이블에도 같은 위치에 추가해야 한다)
+    - id 는 현재 row 의 이력 테이블 id 와 같고, 업무 키마다 한 row 만 존재한다.
+    - DAO 의 이력 INSERT / UPDATE 와 같은 트랜잭션 안에서 model.query_util.refresh_current_snapshot 으로 갱신한다.
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+*/
+
+-- product_info_current : 상품별 현재(is_deleted = 0) 상품 정보
+CREATE TABLE brandi.product_info_current LIKE brandi.product_info;
+
+ALTER TABLE brandi.product_info_current
+    ADD UNIQUE KEY UQ_product_info_current_product_id (product_id);
+
+INSERT INTO brandi.product_info_current
+SELECT *
+FROM brandi.product_info
+WHERE id IN (
+    SELECT MAX(id)
+    FROM brandi.product_info
+    WHERE is_deleted = 0
+    GROUP BY product_id
+);
+
+
+-- seller_info_current : 셀러별 현재(end_date = '9999-12-31 23:59:59', is_deleted = 0) 셀러 정보
+CREATE TABLE brandi.seller_info_current LIKE brandi.seller_info;
+
+ALTER TABLE brandi.seller_info_current
+    ADD UNIQUE KEY UQ_seller_info_current_seller_id (seller_id);
+
+INSERT INTO brandi.seller_info_current
+SELECT *
+FROM brandi.seller_info
+WHERE id IN (
+    SELECT MAX(id)
+    FROM brandi.seller_info
+    WHERE end_date = '9999-12-31 23:59:59'
+    AND is_deleted = 0
+    GROUP BY seller_id
+);
+
+
+-- order_item_info_current : 주문상세별 현재(end_date = '9999-12-31 23:59:59') 주문 상태
+CREATE TABLE brandi.order_item_info_current LIKE brandi.order_item_info;
+
+ALTER TABLE brandi.order_item_info_current
+    ADD UNIQUE KEY UQ_order_item_info_current_order_detail_id (order_detail_id);
+
+INSERT INTO brandi.order_item_info_current
+SELECT *
+FROM brandi.order_item_info
+WHERE id IN (
+    SELECT MAX(id)
+    FROM brandi.order_item_info
+    WHERE end_date = '9999-12-31 23:59:59'
+    GROUP BY order_detail_id
+);
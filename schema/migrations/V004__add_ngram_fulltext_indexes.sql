@@ -0,0 +1,37 @@
+/*
+키워드 검색 ngram FULLTEXT 인덱스
+    상품명, 셀러명, 주문자명 등 키워드 검색이 LIKE '%키워드%' 로 인덱스를 사용하지 못해 전체 row 를 읽었다.
+    한글은 띄어쓰기 단위로 자를 수 없으므로 ngram parser 로 FULLTEXT 인덱스를 만들고
+    model.query_util.keyword_condition 에서 MATCH ... AGAINST 구문 검색으로 조회한다.
+
+    - ngram_token_size 는 기본값 2 를 사용한다. (query_util.NGRAM_TOKEN_SIZE 와 같아야 한다)
+    - 영문 불용어(a, is 등)가 포함된 토큰이 인덱스에서 빠지지 않도록 불용어를 끄고 인덱스를 생성한다.
+    - 목록 조회가 읽는 현재 상태 스냅샷 테이블(*_current)에 인덱스를 만든다.
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+*/
+
+SET SESSION innodb_ft_enable_stopword = OFF;
+
+-- 상품 목록 / 주문 목록 : 상품명 검색
+ALTER TABLE brandi.product_info_current
+    ADD FULLTEXT INDEX FT_product_info_current_name (name) WITH PARSER ngram;
+
+-- 상품 목록 / 주문 목록 / 상품 등록 셀러 검색 : 셀러명 검색
+ALTER TABLE brandi.seller_info_current
+    ADD FULLTEXT INDEX FT_seller_info_current_korean_name (korean_name) WITH PARSER ngram;
+
+-- 주문 목록 : 주문상세번호 검색
+ALTER TABLE brandi.order_item_info_current
+    ADD FULLTEXT INDEX FT_order_item_info_current_order_detail_id (order_detail_id) WITH PARSER ngram;
+
+-- 주문 목록 : 주문자명, 핸드폰번호 검색
+ALTER TABLE brandi.orders
+    ADD FULLTEXT INDEX FT_orders_orderer_name (orderer_name) WITH PARSER ngram;
+
+ALTER TABLE brandi.orders
+    ADD FULLTEXT INDEX FT_orders_orderer_phone (orderer_phone) WITH PARSER ngram;
@@ -0,0 +1,248 @@
+"""
+조회 결과 row 직렬화
+    endpoint 마다 응답 컬럼 spec 을 한 번 정의하면 RowSerializer 가 SQLAlchemy row 에서 바로 응답 dict 를 만듭니다.
+    dict(row) 로 복사한 뒤 컬럼마다 값을 바꾸지 않고, 형식 변환이 필요한 컬럼만 미리 만들어 둔 formatter 로 변환합니다.
+
+    컬럼 spec :
+        'key'                                 : row['key'] 를 그대로 사용
+        ('key', formatter)                    : formatter(row['key'])
+        ('key', ('source1', 'source2'), formatter) : formatter(row['source1'], row['source2'])
+
+    json_response 는 key 정렬 없이 미리 만들어 둔 encoder 로 응답 body 를 한 번에 만듭니다.
+    AppJSONEncoder 는 datetime 과 Decimal 을 직접 변환하므로 json_response 로 응답하는 service 는 날짜를 미리 문자열로 바꾸지 않아도 됩니다.
+    jsonify 로 응답하는 다른 endpoint 의 형식은 바꾸지 않도록 app.json_encoder 로는 등록하지 않습니다.
+    orjson 이 설치되어 있으면 orjson 으로, 없으면 json 모듈로 encode 하며 app config JSON_BACKEND 로 선택합니다.
+    목록 응답은 Accept-Encoding 에 따라 br(brotli 설치 시) 또는 gzip 으로 압축합니다.
+
+Authors:
+    eymin1259@gmail.com 이용민
+
+History:
+    2026-10-18 (이용민) : 초기 생성
+"""
+import gzip
+import datetime
+from decimal  import Decimal
+from operator import itemgetter
+
+from flask      import Response, request
+from flask.json import JSONEncoder
+
+# 선택 설치 : 설치되어 있지 않으면 json 모듈과 gzip 만 사용한다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def datetime_formatter(timespec):
+    """
+    datetime 을 '연-월-일 시간:분(:초)' 문자열로 변환하는 formatter 생성
+        isoformat 은 strftime 과 같은 결과를 format 문자열 해석 없이 만듭니다.
+        값이 없으면 그대로 None 을 반환합니다.
+
+    args :
+        timespec : 'seconds' ('%Y-%m-%d %H:%M:%S') 또는 'minutes' ('%Y-%m-%d %H:%M')
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    def format_datetime(value):
+        return value.isoformat(' ', timespec) if value else value
+
+    return format_datetime
+
+def suffix_formatter(suffix):
+    # 값 뒤에 단위를 붙이는 formatter (ex. 1000 -> '1000원')
+    def format_suffix(value):
+        return f'{value}{suffix}'
+
+    return format_suffix
+
+def choice_formatter(choices, default = None):
+    # 코드 값을 표시할 문자열로 바꾸는 formatter (ex. {1: '제한'}, default '무제한')
+    def format_choice(value):
+        return choices.get(value, default)
+
+    return format_choice
+
+def join_formatter(separator):
+    # 여러 컬럼 값을 separator 로 이어 붙이는 formatter (ex. 'black / L')
+    def format_join(*values):
+        return separator.join(str(value) for value in values)
+
+    return format_join
+
+# 자주 사용하는 날짜 formatter. '연-월-일 시간:분:초' 는 AppJSONEncoder 가 변환한다.
+DATETIME_MINUTES = datetime_formatter('minutes')
+
+class RowSerializer:
+    """
+    컬럼 spec 으로 row 를 응답 dict 로 변환
+        생성할 때 spec 을 그대로 복사할 컬럼, 하나의 컬럼을 변환할 컬럼, 여러 컬럼을 합칠 컬럼으로 나누어 두고
+        그대로 복사할 컬럼은 itemgetter 한 번으로 값을 꺼냅니다.
+        row 는 SQLAlchemy RowProxy 와 dict 모두 사용할 수 있습니다.
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    def __init__(self, columns):
+        self.plain_keys = []
+        self.formatted = []
+        self.combined = []
+
+        for column in columns:
+            if isinstance(column, str):
+                self.plain_keys.append(column)
+            elif len(column) == 2:
+                self.formatted.append(column)
+            else:
+                key, sources, formatter = column
+                self.combined.append((key, itemgetter(*sources), formatter))
+
+        # itemgetter 는 key 가 하나면 tuple 이 아닌 값을 반환하므로 항상 tuple 로 맞춘다.
+        if len(self.plain_keys) == 1:
+            plain_key = self.plain_keys[0]
+            self.plain_getter = lambda row: (row[plain_key],)
+        else:
+            self.plain_getter = itemgetter(*self.plain_keys) if self.plain_keys else lambda row: ()
+
+        self.keys = self.plain_keys + [column[0] for column in self.formatted + self.combined]
+
+    def __call__(self, row):
+        result = dict(zip(self.plain_keys, self.plain_getter(row)))
+
+        for key, formatter in self.formatted:
+            result[key] = formatter(row[key])
+
+        for key, getter, formatter in self.combined:
+            result[key] = formatter(*getter(row))
+
+        return result
+
+    def serialize_all(self, rows):
+        return [self(row) for row in rows]
+
+class AppJSONEncoder(JSONEncoder):
+    """
+    datetime 과 Decimal 을 변환하는 JSON encoder
+        - datetime : '연-월-일 시간:분:초'
+        - date     : '연-월-일'
+        - Decimal  : 정수이면 int, 아니면 float
+        그 밖의 값은 flask JSONEncoder 가 변환합니다. json_response 에서만 사용합니다.
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat(' ', 'seconds')
+
+        if isinstance(o, datetime.date):
+            return o.isoformat()
+
+        if isinstance(o, Decimal):
+            return int(o) if o == o.to_integral_value() else float(o)
+
+        return super().default(o)
+
+# 응답 body encoder : key 정렬과 들여쓰기 없이 C encoder 로 한 번에 문자열을 만든다.
+RESPONSE_ENCODER = AppJSONEncoder(ensure_ascii = False, separators = (',', ':'))
+
+# orjson 이 직접 변환하는 datetime 도 AppJSONEncoder 와 같은 형식이 되도록 default 로 넘긴다.
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+def dumps_json(payload):
+    return RESPONSE_ENCODER.encode(payload).encode('utf-8')
+
+def dumps_orjson(payload):
+    return orjson.dumps(payload, default = RESPONSE_ENCODER.default, option = ORJSON_OPTIONS)
+
+# app config JSON_BACKEND 값별 encode 함수. orjson 이 없으면 json 을 사용한다.
+JSON_BACKENDS = {
+    'json'   : dumps_json,
+    'orjson' : dumps_orjson if orjson else dumps_json
+}
+JSON_BACKEND_DEFAULT = 'orjson'
+
+# json_response 가 사용하는 encode 함수. init_json 에서 config 에 맞게 바꾼다.
+dumps_response = JSON_BACKENDS[JSON_BACKEND_DEFAULT]
+
+# 이 크기(byte)보다 작은 응답은 압축하지 않는다.
+COMPRESS_MIN_SIZE = 1024
+
+# 응답 압축 함수. 앞에 있는 방식을 우선한다. 동적 응답이므로 압축률보다 속도를 우선한 level 을 사용한다.
+COMPRESSORS = {}
+if brotli:
+    COMPRESSORS['br'] = lambda body: brotli.compress(body, quality = 4)
+COMPRESSORS['gzip'] = lambda body: gzip.compress(body, compresslevel = 6)
+
+def init_json(app):
+    """
+    json_response encode 방식 설정
+
+    args :
+        app : flask app. config JSON_BACKEND 로 'orjson' 또는 'json' 선택 (기본값 orjson, 설치되지 않았으면 json)
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+    global dumps_response
+
+    dumps_response = JSON_BACKENDS[app.config.get('JSON_BACKEND', JSON_BACKEND_DEFAULT)]
+
+def json_response(payload, status = 200, compress = False):
+    """
+    payload 를 JSON 응답으로 변환
+        jsonify 와 같은 application/json 응답을 만들지만 key 를 정렬하지 않고 한글을 escape 하지 않습니다.
+        compress 이면 Accept-Encoding 에서 지원하는 방식(br, gzip)으로 body 를 압축합니다.
+
+    args :
+        payload  : 응답 dict 또는 list
+        status   : 응답 status code
+        compress : 응답 압축 여부 (목록 응답)
+
+    returns :
+        flask Response
+
+    Authors:
+        eymin1259@gmail.com 이용민
+
+    History:
+        2026-10-18 (이용민) : 초기 생성
+    """
+
+    body = dumps_response(payload)
+
+    encoding = None
+    if compress and len(body) >= COMPRESS_MIN_SIZE:
+        encoding = request.accept_encodings.best_match(list(COMPRESSORS))
+        if encoding:
+            body = COMPRESSORS[encoding](body)
+
+    response = Response(body, status = status, mimetype = 'application/json')
+
+    if compress:
+        # 같은 url 이라도 Accept-Encoding 에 따라 body 가 다르므로 캐시가 구분하도록 한다.
+        response.vary.add('Accept-Encoding')
+    if encoding:
+        response.content_encoding = encoding
+
+    return response
@@ -5,6 +5,8 @@ from .product_service import ProductService
 from .qna_service import QnAService
 from .review_service import ReviewService
 from .coupon_service import CouponService
+from .reference_service import ReferenceService
+from .database_service import DatabaseService
 
 __all__ = [
     'OrderService',
@@ -13,5 +15,7 @@ __all__ = [
     'ProductService',
     'QnAService',
     'ReviewService',
-    'CouponService'
+    'CouponService',
+    'ReferenceService',
+    'DatabaseService'
 ]
@@ -1,3 +1,22 @@
+from serializer import RowSerializer, DATETIME_MINUTES, choice_formatter, suffix_formatter
+
+# 쿠폰 목록 응답 컬럼 : 날짜는 '연-월-일 시간:분' 형태, 제한여부는 제한/무제한, 할인금액은 '원' 을 붙여 전달한다.
+# issue_type_id 는 DAO 에서 발급유형명으로 바꾼다.
+COUPON_LIST_SERIALIZER = RowSerializer([
+    'coupon_id',
+    'coupon_name',
+    ('discount_price',        suffix_formatter('원')),
+    ('validation_start_date', DATETIME_MINUTES),
+    ('validation_end_date',   DATETIME_MINUTES),
+    ('download_start_date',   DATETIME_MINUTES),
+    ('download_end_date',     DATETIME_MINUTES),
+    'issue_type_id',
+    ('is_limited',            choice_formatter({1: '제한'}, '무제한')),
+    'maximum_number',
+    'issue_number',
+    'used_number'
+])
+
 class CouponService:
     def __init__(self, coupon_dao):
         self.coupon_dao = coupon_dao
@@ -39,23 +58,12 @@ class CouponService:
 
         History:
             2020-10-06 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 날짜, 제한여부, 할인금액 변환을 COUPON_LIST_SERIALIZER 로 처리
         """
 
-        coupon_list = self.coupon_dao.select_coupons(select_condition, session)
-
-        res_coupon_list = []
-        for coupon_info in coupon_list:
-            dict_coupon_info = dict(coupon_info)
-            dict_coupon_info['validation_start_date'] = dict_coupon_info['validation_start_date'].strftime('%Y-%m-%d %H:%M')
-            dict_coupon_info['validation_end_date'] = dict_coupon_info['validation_end_date'].strftime('%Y-%m-%d %H:%M')
-            dict_coupon_info['download_start_date'] = dict_coupon_info['download_start_date'].strftime('%Y-%m-%d %H:%M')
-            dict_coupon_info['download_end_date'] = dict_coupon_info['download_end_date'].strftime('%Y-%m-%d %H:%M')
-            dict_coupon_info['is_limited'] = '제한' if dict_coupon_info['is_limited'] == 1 else '무제한'
-            dict_coupon_info['discount_price'] = f"{dict_coupon_info['discount_price']}원"
-
-            res_coupon_list.append(dict_coupon_info)
+        coupon_list = self.coupon_dao.select_coupons(select_condition, session, COUPON_LIST_SERIALIZER)
 
-        return res_coupon_list
+        return coupon_list
 
     def get_coupon_detail(self, coupon_id, session):
         """
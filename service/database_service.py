@@ -0,0 +1,29 @@
+class DatabaseService:
+    def __init__(self, database, replicas, config, pool_status, pool_metrics):
+        self.database = database
+        self.replicas = replicas
+        self.config = config
+        self.pool_status = pool_status
+        self.pool_metrics = pool_metrics
+
+    def get_pool_status(self):
+        """
+        connection pool 상태 조회 비즈니스 로직
+            이 프로세스의 primary, replica pool 설정과 사용중/대기/overflow connection 수,
+            모든 pool 의 누적 대기시간과 timeout 횟수를 controller에게 전달합니다.
+
+        returns :
+            pool 상태 dict
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        return {
+            'primary'  : self.pool_status(self.database, self.config),
+            'replicas' : [self.pool_status(replica, self.config) for replica in self.replicas],
+            'metrics'  : self.pool_metrics.snapshot()
+        }
@@ -1,5 +1,75 @@
 import datetime
 
+from model.order_dao import ORDER_SORT_KEYS
+from serializer      import RowSerializer, join_formatter
+from utils           import encode_cursor, generate_csv, generate_ndjson
+
+# 주문 목록 다운로드 시 한번에 조회하는 주문 수
+ORDER_EXPORT_CHUNK_SIZE = 1000
+
+# 주문 목록 다운로드 컬럼 : (헤더명, 조회결과 key)
+ORDER_EXPORT_COLUMNS = [
+    ('결제일자',       'payment_date'),
+    ('배송시작일',     'shipping_start_date'),
+    ('배송완료일',     'shipping_complete_date'),
+    ('환불요청일',     'refund_request_date'),
+    ('환불완료일',     'refund_complete_date'),
+    ('주문취소완료일', 'complete_cancellation_date'),
+    ('주문번호',       'order_id'),
+    ('주문상세번호',   'order_detail_id'),
+    ('셀러명',         'seller_name'),
+    ('상품명',         'product_name'),
+    ('옵션정보',       'option_info'),
+    ('옵션추가금액',   'option_additional_price'),
+    ('수량',           'units'),
+    ('주문자명',       'orderer_name'),
+    ('핸드폰번호',     'orderer_phone'),
+    ('결제금액',       'total_payment'),
+    ('할인금액',       'discount_price'),
+    ('환불사유',       'refund_reason_id'),
+    ('주문취소사유',   'cancel_reason_id'),
+    ('환불금액',       'refund_amount')
+]
+
+# 주문 목록 응답 컬럼 : 옵션 색상과 사이즈를 option_info 로 합친다.
+# 날짜는 응답 encoder(serializer.AppJSONEncoder) 가 '연-월-일 시간:분:초' 형태로 변환한다.
+ORDER_LIST_SERIALIZER = RowSerializer([
+    'payment_date',
+    'shipping_start_date',
+    'shipping_complete_date',
+    'refund_request_date',
+    'refund_complete_date',
+    'complete_cancellation_date',
+    'order_id',
+    'order_detail_id',
+    'order_item_id',
+    'seller_name',
+    'product_name',
+    'option_color',
+    'option_size',
+    ('option_info', ('option_color', 'option_size'), join_formatter(' / ')),
+    'option_additional_price',
+    'units',
+    'orderer_name',
+    'orderer_phone',
+    'total_payment',
+    'discount_price',
+    'refund_reason_id',
+    'cancel_reason_id',
+    'refund_amount'
+])
+
+# 배송완료 후 자동 구매확정까지 걸리는 기간(일)
+AUTO_CONFIRM_DAYS = 3
+
+# 자동 구매확정 시 한번에 처리하는 주문 수
+AUTO_CONFIRM_BATCH_SIZE = 1000
+
+# 다운로드 파일 형식별 writer
+ORDER_EXPORT_WRITERS = {
+    'csv'    : generate_csv,
+    'ndjson' : generate_ndjson
+}
 
 class OrderService:
     def __init__(self, order_dao):
@@ -15,7 +85,7 @@ class OrderService:
             session          : connection 형성된 session 객체
 
         returns :
-            검색조건에 해당하는 주문정보 리스트
+            검색조건에 해당하는 주문 갯수 (skipCount 인 경우 None), 주문정보 리스트, 다음 페이지 조회를 위한 커서
 
         Authors:
             eymin1259@gmail.com 이용민
@@ -24,39 +94,89 @@ class OrderService:
             2020-09-22 (이용민) : 초기 생성
             2020-09-24 (이용민) : 주문상태 분류 로직 추가
             2020-09-28 (이용민) : 주문상태 통합 로직으로 변경
+            2026-10-18 (이용민) : 다음 페이지 커서 반환 추가
+            2026-10-18 (이용민) : 주문 목록과 갯수를 한 번의 쿼리로 조회
+            2026-10-18 (이용민) : 조회 결과를 ORDER_LIST_SERIALIZER 로 응답 dict 로 바로 변환
+            2026-10-18 (이용민) : 날짜 변환을 응답 encoder 로 이동
         """
-        total_order_number = self.order_dao.select_orders_count(select_condition, session)
-        order_list = self.order_dao.select_orders(select_condition, session)
+        # option_info 추가는 ORDER_LIST_SERIALIZER 가 row 를 변환하면서 처리한다.
+        order_list, total_order_number = self.order_dao.select_orders(select_condition, session, ORDER_LIST_SERIALIZER)
 
-        result_order_list = []
+        # 다음 페이지 커서 : 조회된 마지막 주문의 (정렬값, 주문상세 id), 마지막 페이지라면 None
+        next_cursor = None
+        if order_list and len(order_list) == select_condition.get('filterLimit', None):
+            _, sort_value_key, _ = ORDER_SORT_KEYS.get(select_condition['filterOrder'], ORDER_SORT_KEYS['NEW'])
+            last_order = order_list[-1]
+            next_cursor = encode_cursor(last_order[sort_value_key], last_order['order_item_id'])
 
-        for order in order_list:
-            dict_order = dict(order)
-            # option_size와 option_olor 값을 합친 option_info 정보 추가
-            dict_order['option_info'] = f"{dict_order['option_color']} / {dict_order['option_size']}"
+        return total_order_number, order_list, next_cursor
+
+    def export_order_list(self, select_condition, export_format, session):
+        """
+        주문 목록 다운로드 로직
+            주문 목록 조회와 같은 검색 조건에 해당하는 모든 주문을 CSV 또는 NDJSON 으로 한 줄씩 생성합니다.
+            ORDER_EXPORT_CHUNK_SIZE 개씩 커서 기반으로 나누어 조회하므로 주문 수와 관계없이 메모리 사용량이 일정합니다.
+            날짜 형식 변환은 writer 에서 처리합니다.
+
+        args :
+            select_condition : 주문 검색에 필요한 조건들
+            export_format    : 다운로드 파일 형식 (csv / ndjson)
+            session          : connection 형성된 session 객체
 
-            # datetime 객체를 '연-월-일 시간:분:초' 형태로 변환
-            if dict_order.get('payment_date', None):
-                dict_order['payment_date'] = dict_order['payment_date'].strftime('%Y-%m-%d %H:%M:%S')
+        returns :
+            다운로드 파일 내용 generator
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        orders = self._iterate_orders(select_condition, session)
+
+        return ORDER_EXPORT_WRITERS[export_format](ORDER_EXPORT_COLUMNS, orders)
+
+    def _iterate_orders(self, select_condition, session):
+        """
+        검색 조건에 해당하는 모든 주문을 커서 기반으로 나누어 조회하는 generator
+
+        args :
+            select_condition : 주문 검색에 필요한 조건들
+            session          : connection 형성된 session 객체
+
+        Authors:
+            eymin1259@gmail.com 이용민
 
-            if dict_order.get('shipping_start_date', None):
-                dict_order['shipping_start_date'] = dict_order['shipping_start_date'].strftime('%Y-%m-%d %H:%M:%S')
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
 
-            if dict_order.get('shipping_complete_date', None):
-                dict_order['shipping_complete_date'] = dict_order['shipping_complete_date'].strftime('%Y-%m-%d %H:%M:%S')
+        chunk_condition = dict(select_condition)
+        chunk_condition.update({
+            'filterLimit' : ORDER_EXPORT_CHUNK_SIZE,
+            'page'        : None,
+            'cursor'      : None,
+            'skipCount'   : True
+        })
 
-            if dict_order.get('refund_request_date', None):
-                dict_order['refund_request_date'] = dict_order['refund_request_date'].strftime('%Y-%m-%d %H:%M:%S')
+        _, sort_value_key, _ = ORDER_SORT_KEYS.get(chunk_condition['filterOrder'], ORDER_SORT_KEYS['NEW'])
 
-            if dict_order.get('refund_complete_date', None):
-                dict_order['refund_complete_date'] = dict_order['refund_complete_date'].strftime('%Y-%m-%d %H:%M:%S')
+        while True:
+            order_list, _ = self.order_dao.select_orders(chunk_condition, session)
 
-            if dict_order.get('complete_cancellation_date', None):
-                dict_order['complete_cancellation_date'] = dict_order['complete_cancellation_date'].strftime('%Y-%m-%d %H:%M:%S')
+            for order in order_list:
+                # option_size와 option_olor 값을 합친 option_info 정보 추가
+                order['option_info'] = f"{order['option_color']} / {order['option_size']}"
+                yield order
 
-            result_order_list.append(dict_order)
+            # 마지막 chunk
+            if len(order_list) < ORDER_EXPORT_CHUNK_SIZE:
+                break
 
-        return total_order_number, result_order_list
+            # 다음 chunk 는 이번 chunk 마지막 주문의 (정렬값, 주문상세 id) 다음부터 조회
+            last_order = order_list[-1]
+            chunk_condition['cursor'] = [last_order[sort_value_key], last_order['order_item_id']]
 
     def get_order_detail_info(self, order_item_id, session):
         """
@@ -89,6 +209,27 @@ class OrderService:
 
         return dict_order_detail_info, order_history_list
 
+    def get_order_detail_version(self, order_item_id, session):
+        """
+        주문상세정보 version 조회 로직
+            주문상세정보의 ETag 를 만들기 위한 version 을 controller에게 반환
+
+        args :
+            order_item_id : 주문상세번호
+            session       : connection 형성된 session 객체
+
+        returns :
+            주문상세정보 version, 주문이 없으면 None
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        return self.order_dao.select_order_detail_version(order_item_id, session)
+
     def update_order_detail_info(self, changement, session):
         """
         주문상세정보 수정 로직
@@ -116,130 +257,262 @@ class OrderService:
         if changement.get('refundBank', None) or changement.get('refundAccountNum', None) or changement.get('refundAccountHolder', None) or changement.get('shippingCompany', None) or changement.get('shippingNumber', None):
             self.order_dao.update_order_item_info(changement, session)
 
+    def _classify_order_items(self, order_list, session):
+        """
+        주문상태변경 대상 주문 분류 로직
+            요청된 주문들 중 현재 이력이 존재하는 주문만 처리 대상으로 분류하고 주문별 처리결과를 생성합니다.
+            같은 주문상세번호가 여러번 요청된 경우 첫번째 요청만 처리합니다.
+
+        args :
+            order_list : 주문상세번호 및 변경내용이 담긴 딕셔너리 리스트
+            session    : connection 형성된 session 객체
+
+        returns :
+            처리 대상 주문 리스트, 주문별 처리결과 리스트
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        # 주문상세번호 컬럼은 문자열이므로 문자열로 비교해야 인덱스를 사용
+        for order in order_list:
+            order['order_item_id'] = str(order['order_item_id'])
+
+        current_order_item_ids = set()
+        if order_list:
+            current_order_item_ids = self.order_dao.select_current_order_items(
+                list({order['order_item_id'] for order in order_list}), session)
+
+        target_order_list = []
+        results = []
+        requested_order_item_ids = set()
+
+        for order in order_list:
+            order_item_id = order['order_item_id']
+
+            if order_item_id in requested_order_item_ids:
+                result = 'DUPLICATED_ORDER_ITEM'
+            elif order_item_id not in current_order_item_ids:
+                result = 'ORDER_ITEM_NOT_FOUND'
+            else:
+                result = 'SUCCESS'
+                target_order_list.append(order)
+
+            requested_order_item_ids.add(order_item_id)
+            results.append({'order_item_id': order_item_id, 'result': result})
+
+        return target_order_list, results
+
     def change_order_status(self, next_status_order_list, session):
         """
         주문상태변경 비즈니스 로직
-            주문상태변경 주문리스트를 받아서 각각의 주문에 대해 이전상태를 종료하는 DAO 메소드와
-            새로운 주문처리상태의 이력을 생성하는 DAO 메소드 호출합니다.
+            주문상태변경 주문리스트를 받아서 이전상태를 한번에 종료하는 DAO 메소드와
+            새로운 주문처리상태의 이력을 한번에 생성하는 DAO 메소드 호출합니다.
 
         args :
             cancel_order_list : 주문상태변경 주문리스트
             session           : connection 형성된 session 객체
 
+        returns :
+            주문별 처리결과 리스트
+
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-10-02 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문별 반복 실행에서 일괄 처리로 변경, 주문별 처리결과 반환
         """
 
         # 비즈니스로직 트랜잭션 실행 시간
         now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        for next_status_order in next_status_order_list:
+        target_order_list, results = self._classify_order_items(next_status_order_list, session)
+
+        if target_order_list:
+            order_item_ids = [order['order_item_id'] for order in target_order_list]
             # 현재 이력 종료
-            self.order_dao.end_record(next_status_order, now, session)
+            self.order_dao.end_records(order_item_ids, now, session)
             # 새로운 주문상태의 row 생성
-            self.order_dao.insert_new_status_order_item(next_status_order, now, session)
+            self.order_dao.insert_new_status_order_items(
+                order_item_ids, target_order_list[0]['next_order_status_id'], now, session)
+
+        return results
 
     def cancel_order(self, cancel_order_list, session):
         """
         주문취소처리 비즈니스 로직
-            주문취소처리 주문리스트를 받아서 각각의 주문에 대해 이전상태를 종료하는 DAO 메소드와
-            새로운 주문처리상태의 이력을 생성하는 DAO 메소드 호출합니다.
+            주문취소처리 주문리스트를 받아서 이전상태를 한번에 종료하는 DAO 메소드와
+            새로운 주문처리상태의 이력을 한번에 생성하는 DAO 메소드 호출합니다.
 
         args :
             cancel_order_list : 주문취소처리 주문리스트
             session           : connection 형성된 session 객체
 
+        returns :
+            주문별 처리결과 리스트
+
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-09-29 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문별 반복 실행에서 일괄 처리로 변경, 주문별 처리결과 반환
         """
 
         # 비즈니스로직 트랜잭션 실행 시간
         now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        for cancel_order in cancel_order_list:
+        target_order_list, results = self._classify_order_items(cancel_order_list, session)
+
+        if target_order_list:
             # 현재 이력 종료
-            self.order_dao.end_record(cancel_order, now, session)
+            self.order_dao.end_records([order['order_item_id'] for order in target_order_list], now, session)
             # 주문취소상태 이력 생성
-            self.order_dao.insert_cancel_order_item(cancel_order, now, session)
+            self.order_dao.insert_cancel_order_items(target_order_list, now, session)
+
+        return results
 
     def refund_request_order(self, refund_request_list, session):
         """
         환불요청 비즈니스 로직
-            환불요청 주문리스트를 받아서 각각의 주문에 대해 이전상태를 종료하는 DAO 메소드와
-            새로운 환불요청상태의 이력을 생성하는 DAO 메소드 호출합니다.
+            환불요청 주문리스트를 받아서 이전상태를 한번에 종료하는 DAO 메소드와
+            새로운 환불요청상태의 이력을 한번에 생성하는 DAO 메소드 호출합니다.
 
         args :
             cancel_order_list : 환불요청 주문리스트
             session           : connection 형성된 session 객체
 
+        returns :
+            주문별 처리결과 리스트
+
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-10-02 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문별 반복 실행에서 일괄 처리로 변경, 주문별 처리결과 반환
         """
 
         # 비즈니스로직 트랜잭션 실행 시간
         now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        for refund_request in refund_request_list:
+        target_order_list, results = self._classify_order_items(refund_request_list, session)
+
+        if target_order_list:
             # 현재 이력 종료
-            self.order_dao.end_record(refund_request, now, session)
+            self.order_dao.end_records([order['order_item_id'] for order in target_order_list], now, session)
             # 환불요청상태 이력 생성
-            self.order_dao.insert_refund_request_order_item(refund_request, now, session)
+            self.order_dao.insert_refund_request_order_items(target_order_list, now, session)
+
+        return results
 
     def refund_complete_order(self, refund_complete_list, session):
         """
         환불완료 비즈니스 로직
-            환불완료 주문리스트를 받아서 각각의 주문에 대해 이전상태를 종료하는 DAO 메소드와
-            새로운 환불완료상태의 이력을 생성하는 DAO 메소드 호출합니다.
+            환불완료 주문리스트를 받아서 이전상태를 한번에 종료하는 DAO 메소드와
+            새로운 환불완료상태의 이력을 한번에 생성하는 DAO 메소드 호출합니다.
 
         args :
             cancel_order_list : 환불완료 주문리스트
             session           : connection 형성된 session 객체
 
+        returns :
+            주문별 처리결과 리스트
+
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-10-02 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문별 반복 실행에서 일괄 처리로 변경, 주문별 처리결과 반환
         """
 
         # 비즈니스로직 트랜잭션 실행 시간
         now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        for refund_complete in refund_complete_list:
+        target_order_list, results = self._classify_order_items(refund_complete_list, session)
+
+        if target_order_list:
+            order_item_ids = [order['order_item_id'] for order in target_order_list]
             # 현재 이력 종료
-            self.order_dao.end_record(refund_complete, now, session)
+            self.order_dao.end_records(order_item_ids, now, session)
             # 환불완료상태 이력 생성
-            self.order_dao.insert_refund_complete_order_item(refund_complete, now, session)
+            self.order_dao.insert_refund_complete_order_items(
+                order_item_ids, target_order_list[0]['order_status_id'], now, session)
+
+        return results
 
     def cancel_refund_request(self, restore_order_list, session):
         """
         환불요청취소 비즈니스 로직
-            환불요청상태 주문 row를 삭제하고 이전의 상태로 되돌리는 DAO 메소드를 호출합니다.
+            환불요청상태 주문 row들을 한번에 종료하고 이전의 상태로 되돌리는 DAO 메소드를 호출합니다.
 
         args :
             restore_order_list : 환불요청취소 주문리스트
             sess               : connection 형성된 session 객체
 
+        returns :
+            주문별 처리결과 리스트
+
         Authors:
             eymin1259@gmail.com 이용민
 
         History:
             2020-10-05 (이용민) : 초기 생성
+            2026-10-18 (이용민) : 주문별 반복 실행에서 일괄 처리로 변경, 주문별 처리결과 반환
         """
 
         now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        for restore_order in restore_order_list:
+        target_order_list, results = self._classify_order_items(restore_order_list, session)
+
+        if target_order_list:
+            order_item_ids = [order['order_item_id'] for order in target_order_list]
             # 환불요청상태 주문 취소
-            self.order_dao.end_record(restore_order, now, session)
+            self.order_dao.end_records(order_item_ids, now, session)
             # 마지막상태로 되돌리기
-            self.order_dao.restore_record(restore_order, now, session)
+            self.order_dao.restore_records(
+                order_item_ids, target_order_list[0]['restore_order_status_id'], now, session)
+
+        return results
+
+    def auto_confirm_orders(self, session, batch_size=AUTO_CONFIRM_BATCH_SIZE, confirm_days=AUTO_CONFIRM_DAYS):
+        """
+        자동 구매확정 비즈니스 로직
+            배송완료 후 confirm_days 일이 지난 주문을 최대 batch_size 개 구매확정 처리합니다.
+            배송완료상태 이력을 하나의 UPDATE 문으로 종료하고 구매확정상태 이력을 하나의 INSERT ... SELECT 문으로 생성합니다.
+            호출하는 쪽에서 batch 마다 commit 하고 0 이 반환될 때까지 반복 호출합니다.
+
+        args :
+            session      : connection 형성된 session 객체
+            batch_size   : 한번에 처리할 최대 주문 수
+            confirm_days : 배송완료 후 구매확정까지 걸리는 기간(일)
+
+        returns :
+            구매확정 처리한 주문 수
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        # 비즈니스로직 트랜잭션 실행 시간
+        now = datetime.datetime.now()
+        updated_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        confirm_before = (now - datetime.timedelta(days=confirm_days)).strftime('%Y-%m-%d %H:%M:%S')
+
+        order_item_ids = self.order_dao.select_auto_confirm_targets(confirm_before, batch_size, session)
+
+        if order_item_ids:
+            # 배송완료상태 이력 종료
+            self.order_dao.end_records(order_item_ids, updated_at, session)
+            # 구매확정상태 row 생성
+            self.order_dao.insert_confirm_order_items(order_item_ids, updated_at, session)
+
+        return len(order_item_ids)
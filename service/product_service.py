@@ -1,15 +1,119 @@
-import re
-from datetime import datetime
+import uuid
+from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
 
 from werkzeug.utils import secure_filename
 
 from config import get_s3_resource
-from utils import allowed_file
+from model.reference_dao import reference_cache
+from utils import TTLCache, allowed_file, generate_csv, get_image_key, validate_product_info
+
+# 이미지를 저장하는 s3 bucket 과 url
+S3_BUCKET = 'brandi-images'
+S3_URL = 'https://brandi-images.s3.ap-northeast-2.amazonaws.com'
+
+# delete_objects 한번에 삭제할 수 있는 최대 이미지 수
+S3_DELETE_BATCH_SIZE = 1000
+
+# 동시에 업로드 할 수 있는 최대 이미지 수
+IMAGE_UPLOAD_MAX_WORKERS = 10
+
+# 상품 정보 파일 다운로드 컬럼 : (헤더명, 조회결과 key)
+PRODUCT_EXPORT_COLUMNS = [
+    ('등록일',     'created_at'),
+    ('대표이미지', 'main_img'),
+    ('상품명',     'name'),
+    ('상품코드',   'product_code'),
+    ('상품번호',   'id'),
+    ('셀러속성',   'attribution_name'),
+    ('셀러명',     'korean_name'),
+    ('판매가',     'price'),
+    ('할인가',     'discount_price'),
+    ('판매여부',   'is_on_sale'),
+    ('진열여부',   'is_displayed'),
+    ('할인여부',   'is_promotion')
+]
+
+# 상품 일괄 등록 파일의 컬럼. 파일의 첫 줄(헤더)에 같은 이름이 있어야 한다.
+# images 는 s3 에 업로드 된 이미지 url 을 쉼표로 구분하여 1~5 개 입력하고, 첫 번째 이미지가 대표 이미지가 된다.
+PRODUCT_IMPORT_COLUMNS = (
+    'seller_id',
+    'name',
+    'simple_description',
+    'detail_description',
+    'price',
+    'discount_rate',
+    'discount_price',
+    'discount_start_date',
+    'discount_end_date',
+    'min_unit',
+    'max_unit',
+    'is_on_sale',
+    'is_displayed',
+    'is_definite',
+    'is_stock_managed',
+    'stock_number',
+    'first_category_id',
+    'second_category_id',
+    'images'
+)
+
+# 상품 일괄 등록 파일에서 숫자로 변환하는 컬럼
+PRODUCT_IMPORT_INTEGER_COLUMNS = (
+    'seller_id',
+    'price',
+    'discount_rate',
+    'discount_price',
+    'min_unit',
+    'max_unit',
+    'is_on_sale',
+    'is_displayed',
+    'is_definite',
+    'is_stock_managed',
+    'stock_number',
+    'first_category_id',
+    'second_category_id'
+)
+
+# 상품 일괄 등록 파일에서 날짜(연-월-일)로 변환하는 컬럼
+PRODUCT_IMPORT_DATE_COLUMNS = ('discount_start_date', 'discount_end_date')
+
+# 비어있으면 NULL 로 등록하는 컬럼 (product_info 의 NULL 허용 컬럼)
+PRODUCT_IMPORT_NULLABLE_COLUMNS = (
+    'simple_description',
+    'detail_description',
+    'discount_price',
+    'discount_start_date',
+    'discount_end_date',
+    'is_definite'
+)
+
+# 상품 일괄 등록 시 한 transaction 에서 입력하는 상품 수
+PRODUCT_IMPORT_BATCH_SIZE = 500
+
+# 상품 하나에 등록할 수 있는 최대 이미지 수
+PRODUCT_MAX_IMAGES = 5
+
+# 상품 상세 데이터 캐시 : product_info.id -> 상품 상세 데이터
+# 상품을 수정하면 새로운 product_info row 가 등록되므로 한 product_info.id 의 데이터는 바뀌지 않는다.
+# 다른 프로세스의 캐시도 수정 이후에는 새로운 id 로 조회하므로 이전 데이터를 전달하지 않는다.
+# ttl 은 카테고리 이름 변경을 반영하기 위한 값이다.
+PRODUCT_DETAIL_CACHE_SIZE = 1024
+PRODUCT_DETAIL_CACHE_TTL = 300
 
 class ProductService:
-    def __init__(self, product_dao):
+    def __init__(self, product_dao, s3_client_factory = get_s3_resource):
         self.product_dao = product_dao
 
+        # s3 client 생성 함수. 테스트 시 로컬 s3 서버에 연결된 client 를 생성하는 함수로 교체할 수 있다.
+        self.s3_client_factory = s3_client_factory
+
+        # 이미지 업로드용 thread pool. 동시에 실행되는 업로드 수를 제한한다.
+        self.upload_executor = ThreadPoolExecutor(max_workers = IMAGE_UPLOAD_MAX_WORKERS)
+
+        # 상품 상세 데이터 캐시
+        self.product_detail_cache = TTLCache(PRODUCT_DETAIL_CACHE_SIZE, PRODUCT_DETAIL_CACHE_TTL)
+
     def get_first_categories(self, seller_info, session):
         """ 상품 등록 시 셀러의 속성에 맞는 첫 번째 카테고리 리스트 전달
 
@@ -60,34 +164,263 @@ class ProductService:
         """
         self.product_dao.insert_product(product_info, session)
 
+    def import_products(self, rows, modifier_id, session, seller_id = None, batch_size = PRODUCT_IMPORT_BATCH_SIZE):
+        """ 상품 일괄 등록
+
+        파일에서 읽은 row 를 상품 등록 API 와 같은 제한 사항으로 확인하고, 통과한 상품을 batch_size 개씩 모아 등록합니다.
+        batch 를 등록할 때마다 (등록한 상품 수, 이번 batch 까지 발견한 row 에러 리스트) 를 yield 하며,
+        호출하는 쪽에서 yield 마다 commit 하여 batch 단위 transaction 으로 처리합니다.
+        이미지는 이미 s3 에 업로드 된 url 을 사용하므로 s3 요청은 하지 않습니다.
+
+        args:
+            rows: (파일의 줄 번호, {컬럼명: 값} dict) 를 전달하는 iterable (utils.read_import_rows)
+            modifier_id: 등록하는 셀러 id
+            session: 데이터베이스 session 객체
+            seller_id: 지정하면 파일의 seller_id 대신 사용 (관리자가 아닌 셀러는 자신의 상품만 등록)
+            batch_size: 한 transaction 에서 등록할 상품 수
+
+        returns :
+            generator. (등록한 상품 수, [{'line': 파일의 줄 번호, 'message': 에러 메세지}, ...])
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+            2026-10-18 (고지원): 값의 형식, 날짜, 셀러/카테고리 id 를 줄마다 확인하여 batch 전체가 실패하지 않도록 수정
+            2026-10-18 (고지원): 빈 줄을 건너뛰어도 맞도록 파일에서 읽은 줄 번호로 에러 위치 전달
+        """
+        batch = list()
+        errors = list()
+
+        # 확인한 셀러 id -> 존재 여부. 같은 셀러의 상품이 많으므로 셀러마다 한 번만 조회한다.
+        seller_exists = dict()
+
+        for line, row in rows:
+            try:
+                product_info = self._build_import_product(row, modifier_id, seller_id)
+                message = (
+                    validate_product_info(product_info)
+                    or self._check_import_references(product_info, seller_exists, session)
+                )
+            except KeyError as e:
+                message = f'KEY_ERROR : {e}'
+            except ValueError as e:
+                message = f'INVALID_VALUE : {e}'
+
+            if message:
+                errors.append({'line': line, 'message': message})
+                continue
+
+            batch.append(product_info)
+
+            if len(batch) >= batch_size:
+                self.product_dao.insert_products(batch, session)
+                yield len(batch), errors
+                batch = list()
+                errors = list()
+
+        if batch or errors:
+            self.product_dao.insert_products(batch, session)
+            yield len(batch), errors
+
+    def _build_import_product(self, row, modifier_id, seller_id):
+        """ 상품 일괄 등록 파일의 row 를 상품 정보로 변환
+
+        CSV 는 모든 값이 문자열이고 XLSX 는 숫자, 날짜가 그대로 전달되므로 컬럼마다 같은 형식으로 변환합니다.
+        변환할 수 없는 값은 ValueError 가 발생합니다.
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        product_info = {column: row[column] for column in PRODUCT_IMPORT_COLUMNS}
+
+        if seller_id is not None:
+            product_info['seller_id'] = seller_id
+
+        for column in PRODUCT_IMPORT_COLUMNS:
+            value = product_info[column]
+            if isinstance(value, str):
+                value = value.strip()
+
+            if value in ('', None):
+                if column not in PRODUCT_IMPORT_NULLABLE_COLUMNS:
+                    raise ValueError(f'{column.upper()}_REQUIRED')
+                product_info[column] = None
+            elif column in PRODUCT_IMPORT_INTEGER_COLUMNS:
+                product_info[column] = self._import_integer(column, value)
+            elif column in PRODUCT_IMPORT_DATE_COLUMNS:
+                product_info[column] = self._import_date(column, value)
+            elif column != 'images':
+                product_info[column] = str(value)
+
+        product_info['product_code'] = str(uuid.uuid4())
+        product_info['modifier_id'] = modifier_id
+
+        images = [image.strip() for image in str(product_info['images']).split(',') if image.strip()]
+
+        if not images or len(images) > PRODUCT_MAX_IMAGES:
+            raise ValueError('IMAGE_COUNT_MUST_BE_1_TO_5')
+
+        # 수정 시 get_image_key 로 s3 key 를 구하므로 s3 에 업로드 된 이미지만 허용한다.
+        if any(not image.startswith(S3_URL + '/') for image in images):
+            raise ValueError('IMAGE_MUST_BE_UPLOADED_TO_S3')
+
+        product_info['images'] = images
+
+        return product_info
+
+    def _import_integer(self, column, value):
+        # XLSX 의 숫자는 float 로 전달될 수 있으므로 소수점이 없는 값만 허용한다.
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+
+        if isinstance(value, (int, str)) and not isinstance(value, bool):
+            try:
+                return int(value)
+            except ValueError:
+                pass
+
+        raise ValueError(f'{column.upper()}_MUST_BE_INTEGER')
+
+    def _import_date(self, column, value):
+        # XLSX 의 날짜는 datetime, CSV 는 '연-월-일' 문자열로 전달된다.
+        if isinstance(value, datetime):
+            return value.date()
+
+        if isinstance(value, date):
+            return value
+
+        try:
+            return datetime.strptime(str(value), '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError(f'{column.upper()}_MUST_BE_YYYY-MM-DD')
+
+    def _check_import_references(self, product_info, seller_exists, session):
+        """ 상품 일괄 등록 시 셀러, 카테고리 id 확인
+
+        FK 에러로 batch 전체가 실패하지 않도록 등록 전에 존재하는 셀러와 카테고리인지 확인합니다.
+        카테고리는 기준 정보 캐시에서 찾고, 셀러는 처음 나온 id 만 조회하여 seller_exists 에 저장합니다.
+
+        returns :
+            문제가 없으면 None, 있으면 에러 메세지
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        seller_id = product_info['seller_id']
+        if seller_id not in seller_exists:
+            seller_exists[seller_id] = seller_id in self.product_dao.select_seller_ids([seller_id], session)
+
+        if not seller_exists[seller_id]:
+            return 'SELLER_DOES_NOT_EXIST'
+
+        if reference_cache.get('first_categories', product_info['first_category_id'], session) is None:
+            return 'FIRST_CATEGORY_DOES_NOT_EXIST'
+
+        if reference_cache.get('second_categories', product_info['second_category_id'], session) is None:
+            return 'SECOND_CATEGORY_DOES_NOT_EXIST'
+
+        return None
+
     def update_product(self, product_info, session):
         """ 상품 정보 수정
 
-        상품 수정 시 새로운 이미지와 기존 이미지 리스트를 비교하여 s3에서 이미지를 삭제하고 새로운 상품 이력을 등록합니다.
+        상품 수정 시 새로운 상품 이력을 등록하고, DB 에 저장되어 있던 이전 이미지 중 새로운 이미지 리스트에 없는 이미지를 삭제 대기열에 기록합니다.
+        s3 이미지 삭제는 commit 이후 image_deletion_worker 가 처리합니다.
 
         Authors:
             고지원
 
         History:
             2020-10-10 (고지원): 초기 생성
+            2026-10-18 (고지원): s3 이미지 즉시 삭제에서 같은 트랜잭션의 삭제 대기열 기록으로 변경
+            2026-10-18 (고지원): 새로 업로드한 이미지가 없으면 기존 이미지를 그대로 사용
+            2026-10-18 (고지원): 이전 상품 정보의 상세 데이터 캐시 삭제
+            2026-10-18 (고지원): 요청의 기존 이미지 리스트가 아닌 DB 에 저장된 이전 이미지로 교체된 이미지 계산
         """
-        s3_resource = get_s3_resource()
+        # 기존 이미지 url 리스트
+        product_info['images'] = [old_img for old_img in product_info['images'] if old_img]
+
+        # 새로 업로드한 이미지가 없으면 기존 이미지를 그대로 사용한다.
+        if not product_info['new_images']:
+            product_info['new_images'] = product_info['images']
+
+        previous_info_id, stored_images = self.product_dao.update_product(product_info, session)
 
-        for old_img in product_info['images']:
+        # 이전 상품 정보는 더 이상 조회되지 않으므로 캐시에서 지운다.
+        self.product_detail_cache.invalidate(previous_info_id)
 
-            # 이미지 url 에서 파일 이름을 가져온다.
-            file_name = re.findall('https:\/\/brandi-images\.s3\.ap-northeast-2\.amazonaws\.com\/(.*)', old_img)
+        # DB 에 저장되어 있던 이미지가 새로운 이미지 리스트에 없을 경우 삭제 대기열에 기록한다.
+        replaced_image_keys = [
+            get_image_key(old_img)
+            for old_img in stored_images
+            if old_img not in product_info['new_images']
+        ]
 
-            # 기존 이미지가 새로운 이미지 리스트에 없을 경우 s3 서버에서 이미지를 삭제한다.
-            if old_img not in product_info['new_images']:
-                s3_resource.delete_object(Bucket = 'brandi-images', Key = f'{file_name[0]}')
+        if replaced_image_keys:
+            self.product_dao.insert_image_deletions(replaced_image_keys, session)
 
-        self.product_dao.update_product(product_info, session)
+    def purge_deleted_images(self, session):
+        """ 삭제 대기열의 s3 이미지 삭제
+
+        삭제 대기열에서 최대 1000 개의 이미지를 가져와 한번의 delete_objects 요청으로 s3 에서 삭제합니다.
+        삭제된 이미지는 대기열에서 제거하고, 실패한 이미지는 실패 사유를 기록하여 다음에 다시 시도합니다.
+
+        returns :
+            처리한 이미지 수
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        deletions = self.product_dao.get_image_deletions(S3_DELETE_BATCH_SIZE, session)
+
+        if not deletions:
+            return 0
+
+        s3_resource = self.s3_client_factory()
+
+        response = s3_resource.delete_objects(
+            Bucket = S3_BUCKET,
+            Delete = {
+                'Objects': [{'Key': deletion['image_key']} for deletion in deletions],
+                'Quiet': True
+            }
+        )
+
+        # Quiet 모드에서는 실패한 key 만 반환된다.
+        errors = {error['Key']: error.get('Message', error.get('Code')) for error in response.get('Errors', [])}
+
+        deleted_ids = [deletion['id'] for deletion in deletions if deletion['image_key'] not in errors]
+        failed_deletions = [
+            {'id': deletion['id'], 'last_error': errors[deletion['image_key']]}
+            for deletion in deletions if deletion['image_key'] in errors
+        ]
+
+        if deleted_ids:
+            self.product_dao.delete_image_deletions(deleted_ids, session)
+
+        if failed_deletions:
+            self.product_dao.update_image_deletion_errors(failed_deletions, session)
+
+        return len(deletions)
 
     def upload_image(self, product_code, images):
         """ s3에 이미지를 업로드
 
         S3 서버에 이미지를 업로드 하고 데이터베이스에 저장될 이미지 url 리스트를 반환한다.
+        모든 이미지의 확장자를 먼저 확인한 뒤 thread pool 에서 동시에 업로드하므로
+        전체 업로드 시간은 가장 오래 걸리는 이미지 한 장의 업로드 시간과 비슷하다.
+        업로드 중 하나라도 실패하면 이미 업로드 된 이미지를 삭제하고 예외를 다시 발생시킨다.
 
         Authors:
             고지원
@@ -95,28 +428,58 @@ class ProductService:
         History:
             2020-10-05 (고지원): 초기 생성
             2020-10-09 (고지원): 이미지 url 상품 코드와 파일의 이름 조합으로 수정
+            2026-10-18 (고지원): 확장자 확인 후 thread pool 로 동시 업로드, 실패 시 업로드 된 이미지 삭제
         """
-        image_urls = list()
-
-        # s3 서버 연결 및 이미지 업로드
-        s3_resource = get_s3_resource()
-
         for image in images:
             # 허용된 jpg, jpeg 확장자인지 확인한다.
             message = allowed_file(image.filename)
 
-            # jpg, jpeg 확장자가 아닐 경우 에러 메세지가 반환된다.
+            # jpg, jpeg 확장자가 아닐 경우 업로드 전에 에러 메세지가 반환된다.
             if message:
                 return message
 
-            # s3 서버에 이미지 업로드
-            s3_resource.put_object(Body = image, Bucket = 'brandi-images', Key = f'{product_code}_{image.filename}', ContentType = 'image/jpeg')
+        # s3 서버 연결
+        s3_resource = self.s3_client_factory()
 
-            # 데이터베이스에 저장할 이미지 url 을 리스트에 추가한다.
-            image_url = f'https://brandi-images.s3.ap-northeast-2.amazonaws.com/{product_code}_{image.filename}'
-            image_urls.append(image_url)
+        # 이미지 업로드 작업을 thread pool 에 전달한다.
+        futures = [
+            self.upload_executor.submit(self._put_image, s3_resource, f'{product_code}_{image.filename}', image)
+            for image in images
+        ]
 
-        return image_urls
+        # 모든 업로드가 끝날 때까지 기다린 뒤 결과를 확인한다.
+        uploaded_keys = list()
+        upload_error = None
+
+        for future in futures:
+            try:
+                uploaded_keys.append(future.result())
+            except Exception as e:
+                upload_error = upload_error or e
+
+        # 업로드에 실패한 이미지가 있으면 업로드 된 이미지를 삭제한다.
+        if upload_error:
+            for key in uploaded_keys:
+                s3_resource.delete_object(Bucket = S3_BUCKET, Key = key)
+            raise upload_error
+
+        # 데이터베이스에 저장할 이미지 url 리스트
+        return [f'{S3_URL}/{key}' for key in uploaded_keys]
+
+    def _put_image(self, s3_resource, key, image):
+        """ s3 에 이미지 한 장 업로드
+
+        thread pool 에서 실행되며 업로드 된 이미지의 key 를 반환한다.
+
+        Authors:
+            고지원
+
+        History:
+            2026-10-18 (고지원): 초기 생성
+        """
+        s3_resource.put_object(Body = image, Bucket = S3_BUCKET, Key = key, ContentType = 'image/jpeg')
+
+        return key
 
     def get_products(self, filter_dict, session):
         """ 상품 리스트 전달
@@ -127,37 +490,57 @@ class ProductService:
         History:
             2020-09-21 (고지원): 초기 생성
             2020-10-01 (고지원): JSON 응답 형식 정의
+            2026-10-18 (고지원): 상품 리스트와 조회 결과 개수를 함께 전달
         """
-        products = self.product_dao.get_products(filter_dict, session)
+        products, count = self.product_dao.get_products(filter_dict, session)
 
-        return products
+        return products, count
 
-    def get_product_count(self, product_info, session):
-        """ 상품 조회 결과 개수
+    def get_product(self, product_id, session, product_info_id = None):
+        """ 상품 상세 데이터 전달
+
+        현재 상품 정보 id(get_product_version)를 알고 있으면 캐시에서 먼저 찾고,
+        없으면 DB 에서 조회하여 조회한 상품 정보 id 로 캐시에 저장합니다.
+
+        args:
+            product_id: 상품 id
+            session: 데이터베이스 session 객체
+            product_info_id: 현재 상품 정보 id
+
+        returns :
+            상품 상세 데이터, 상품이 없으면 None
 
         Authors:
             고지원
 
         History:
-            2020-10-13 (고지원): 초기 생성
+            2020-10-03 (고지원): 초기 생성
+            2026-10-18 (고지원): 상품 정보 id 단위 상세 데이터 캐시 추가
         """
+        if product_info_id is not None:
+            product = self.product_detail_cache.get(product_info_id)
+            if product is not None:
+                return product
+
+        product = self.product_dao.get_product(product_id, session)
 
-        count = self.product_dao.get_product_count(product_info, session)
+        if product is not None:
+            self.product_detail_cache.set(product['p_info_id'], product)
 
-        return count
+        return product
 
-    def get_product(self, product_id, session):
-        """ 상품 상세 데이터 전달
+    def get_product_version(self, product_id, session):
+        """ 상품 상세 데이터의 version 전달
 
         Authors:
             고지원
 
         History:
-            2020-10-03 (고지원): 초기 생성
+            2026-10-18 (고지원): 초기 생성
         """
-        product = self.product_dao.get_product(product_id, session)
+        version = self.product_dao.get_product_version(product_id, session)
 
-        return product
+        return version
 
     def get_product_history(self, product_id, session):
         """ 상품 수정 이력 전달
@@ -173,43 +556,19 @@ class ProductService:
 
         return history
 
-    def make_excel(self, id_list, session):
-        """ 상품 정보 엑셀 파일 다운로드
+    def export_products(self, id_list, session):
+        """ 상품 정보 파일 다운로드
 
-        특정 아이디의 상품 정보를 엑셀 파일로 다운로드합니다.
+        특정 아이디의 상품 정보 또는 전체 상품 정보를 CSV 파일로 만들어 한 줄씩 전달합니다.
+        파일을 디스크에 저장하지 않고 응답으로 바로 흘려보냅니다.
 
         Authors:
             고지원
 
         History:
             2020-10-03 (고지원): 초기 생성
+            2026-10-18 (고지원): pandas 엑셀 파일 저장에서 CSV streaming 으로 변경
         """
+        products = self.product_dao.get_products_for_export(id_list, session)
 
-        # excel 파일을 만들기 위한 패키지
-        import pandas as pd
-
-        # make excel file
-        writer = pd.ExcelWriter('../excels_products.xlsx')
-
-        # 선택 상품 필터링을 위한 딕셔너리
-        filter_dict = {
-            'product_id': id_list
-        }
-        res = self.product_dao.get_products(filter_dict, session)
-
-        df = pd.DataFrame({
-            "등록일": product.created_at,
-            "대표이미지": product.main_img,
-            "상품명": product.name,
-            "상품코드": product.product_code,
-            "상품번호": product.id,
-            "셀러속성": product.attribution_name,
-            "셀러명": product.korean_name,
-            "판매가": product.price,
-            "할인가": product.discount_price,
-            "판매여부": product.is_on_sale,
-            "진열여부": product.is_displayed,
-            "할인여부": product.is_promotion} for product in res)
-
-        df.to_excel(writer, 'sheet1')
-        writer.save()
\ No newline at end of file
+        return generate_csv(PRODUCT_EXPORT_COLUMNS, products)
@@ -0,0 +1,46 @@
+class ReferenceService:
+    def __init__(self, reference_cache):
+        self.reference_cache = reference_cache
+
+    def get_reference_data(self, session):
+        """
+        기준 정보 조회 비즈니스 로직
+            프로세스 내 기준 정보 캐시의 version 과 전체 기준 정보를 controller에게 전달합니다.
+            캐시가 만료되었으면 다시 읽어서 전달합니다.
+
+        args :
+            session : connection 형성된 session 객체
+
+        returns :
+            캐시 version, 테이블명 -> row 리스트
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        version, tables, _ = self.reference_cache.snapshot(session)
+
+        return version, tables
+
+    def reload_reference_data(self, session):
+        """
+        기준 정보 캐시 갱신 비즈니스 로직
+            관리자가 기준 정보 테이블을 수정한 뒤 ttl 을 기다리지 않고 이 프로세스의 캐시를 바로 다시 읽습니다.
+
+        args :
+            session : connection 형성된 session 객체
+
+        returns :
+            갱신된 캐시 version
+
+        Authors:
+            eymin1259@gmail.com 이용민
+
+        History:
+            2026-10-18 (이용민) : 초기 생성
+        """
+
+        return self.reference_cache.reload(session)
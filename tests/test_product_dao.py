@@ -0,0 +1,34 @@
+import pymysql
+import pytest
+from sqlalchemy                import event, text
+from sqlalchemy.dialects.mysql import pymysql as mysql_pymysql
+
+from model.product_dao import ProductDao, PRODUCT_INFO_BULK_INSERT_QUERY, PRODUCT_IMAGE_BULK_INSERT_QUERY
+from utils import get_seller_principal, seller_principal_cache
+
+def test_export_uses_server_side_cursor_after_auth_lookup(database, session):
+    # login_required 와 같이 요청 session 으로 셀러를 먼저 조회하여 connection 을 연다.
+    seller_principal_cache.clear()
+    get_seller_principal(0, lambda: session)
+
+    cursors = []
+
+    def record_cursor(conn, cursor, statement, parameters, context, executemany):
+        if 'FROM products AS p' in statement:
+            cursors.append(cursor)
+
+    event.listen(database, 'before_cursor_execute', record_cursor)
+    try:
+        list(ProductDao().get_products_for_export(None, session))
+    finally:
+        event.remove(database, 'before_cursor_execute', record_cursor)
+
+    assert len(cursors) == 1
+    assert isinstance(cursors[0], pymysql.cursors.SSCursor)
+
+@pytest.mark.parametrize('query', [PRODUCT_INFO_BULK_INSERT_QUERY, PRODUCT_IMAGE_BULK_INSERT_QUERY])
+def test_bulk_insert_query_is_batched_by_pymysql(query):
+    # pymysql 은 이 정규식에 맞는 INSERT 의 executemany 만 multi-row INSERT 로 묶는다.
+    statement = str(text(query).compile(dialect = mysql_pymysql.dialect()))
+
+    assert pymysql.cursors.RE_INSERT_VALUES.match(statement)
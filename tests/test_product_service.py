@@ -0,0 +1,122 @@
+import datetime
+
+import pytest
+
+from model.product_dao import ProductDao
+from service.product_service import ProductService, S3_URL
+from utils import get_image_key
+
+def import_row(**values):
+    row = {
+        'seller_id'           : '0',
+        'name'                : '테스트 상품',
+        'simple_description'  : '',
+        'detail_description'  : '',
+        'price'               : '10000',
+        'discount_rate'       : '0',
+        'discount_price'      : '',
+        'discount_start_date' : '',
+        'discount_end_date'   : '',
+        'min_unit'            : '1',
+        'max_unit'            : '10',
+        'is_on_sale'          : '1',
+        'is_displayed'        : '1',
+        'is_definite'         : '',
+        'is_stock_managed'    : '0',
+        'stock_number'        : '0',
+        'first_category_id'   : '1',
+        'second_category_id'  : '1',
+        'images'              : f'{S3_URL}/test/1.jpg'
+    }
+    row.update(values)
+    return row
+
+def import_errors(rows, session):
+    product_service = ProductService(ProductDao())
+    errors = []
+    # 첫 줄은 헤더이므로 상품은 2 번째 줄부터 시작한다.
+    for _, batch_errors in product_service.import_products(enumerate(rows, start = 2), 1, session):
+        errors.extend(batch_errors)
+    return {error['line']: error['message'] for error in errors}
+
+def test_import_reports_invalid_rows_as_row_errors(session):
+    errors = import_errors([
+        # XLSX 날짜와 빈 값 비교, 존재하지 않는 셀러
+        import_row(discount_start_date = datetime.datetime(2020, 10, 1), discount_end_date = ''),
+        import_row(price = 'abc'),
+        import_row(discount_start_date = '2020/10/01'),
+        import_row(min_unit = 1.5)
+    ], session)
+
+    assert errors == {
+        2: 'SELLER_DOES_NOT_EXIST',
+        3: 'INVALID_VALUE : PRICE_MUST_BE_INTEGER',
+        4: 'INVALID_VALUE : DISCOUNT_START_DATE_MUST_BE_YYYY-MM-DD',
+        5: 'INVALID_VALUE : MIN_UNIT_MUST_BE_INTEGER'
+    }
+
+def test_import_reports_unknown_category_as_row_error(session):
+    seller = session.execute("SELECT id FROM sellers WHERE is_deleted = 0 LIMIT 1").fetchone()
+    if seller is None:
+        pytest.skip('테스트 DB 에 셀러가 없습니다.')
+
+    errors = import_errors([import_row(seller_id = str(seller.id), first_category_id = '0')], session)
+
+    assert errors == {2: 'FIRST_CATEGORY_DOES_NOT_EXIST'}
+
+def test_update_without_upload_removes_image(session):
+    category = session.execute("""
+        SELECT s_cat.first_category_id, s_cat.id AS second_category_id, sellers.id AS seller_id
+        FROM second_categories AS s_cat, sellers
+        WHERE sellers.is_deleted = 0
+        LIMIT 1
+    """).fetchone()
+    if category is None:
+        pytest.skip('테스트 DB 에 셀러 또는 카테고리가 없습니다.')
+
+    product_dao = ProductDao()
+    product_service = ProductService(product_dao)
+    images = [f'{S3_URL}/test/{idx}.jpg' for idx in range(1, 4)]
+
+    product_info = {
+        'product_code'        : 'TEST_UPDATE_IMAGES',
+        'seller_id'           : category.seller_id,
+        'is_on_sale'          : 1,
+        'is_displayed'        : 1,
+        'name'                : '테스트 상품',
+        'simple_description'  : None,
+        'detail_description'  : None,
+        'price'               : 10000,
+        'discount_rate'       : 0,
+        'discount_price'      : None,
+        'is_definite'         : None,
+        'discount_start_date' : None,
+        'discount_end_date'   : None,
+        'min_unit'            : 1,
+        'max_unit'            : 10,
+        'is_stock_managed'    : 0,
+        'stock_number'        : 0,
+        'first_category_id'   : category.first_category_id,
+        'second_category_id'  : category.second_category_id,
+        'modifier_id'         : category.seller_id,
+        'images'              : list(images)
+    }
+    product_dao.insert_product(product_info, session)
+
+    # 두 번째 이미지를 지우고 새로운 이미지는 업로드 하지 않는다.
+    product_info['images'] = [images[0], images[2]]
+    product_info['new_images'] = []
+    product_service.update_product(product_info, session)
+
+    product = product_dao.get_product(product_info['product_id'], session)
+
+    assert [image['image_url'] for image in product['images']] == [images[0], images[2]]
+
+    # 지운 이미지는 s3 삭제 대기열에 기록된다.
+    deletions = session.execute("""
+        SELECT image_key
+        FROM product_image_deletions
+        WHERE image_key IN :image_keys
+    """, {'image_keys': tuple(get_image_key(image) for image in images)}).fetchall()
+
+    assert [deletion.image_key for deletion in deletions] == [get_image_key(images[1])]
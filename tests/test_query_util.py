@@ -0,0 +1,16 @@
+from sqlalchemy     import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from model.query_util import CachedTextCompiledCache, cached_text
+
+def test_compiled_cache_keeps_only_cached_text():
+    compiled_cache = CachedTextCompiledCache(10)
+    engine = create_engine('sqlite://', execution_options = {'compiled_cache': compiled_cache})
+    session = sessionmaker(bind = engine)()
+
+    # 문자열 쿼리는 실행할 때마다 새로운 text() 가 되므로 보관하지 않는다.
+    for _ in range(10):
+        session.execute("SELECT :value", {'value': 1})
+        session.execute(cached_text("SELECT :value AS cached"), {'value': 1})
+
+    assert len(compiled_cache) == 1
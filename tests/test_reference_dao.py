@@ -0,0 +1,27 @@
+import time
+import threading
+
+from model.reference_dao import ReferenceDataCache
+
+def test_expired_snapshot_reloads_once():
+    calls = []
+
+    def loader(session):
+        calls.append(session)
+        time.sleep(0.2)
+        return {'order_status': [{'id': 1, 'name': '상품준비'}]}
+
+    cache = ReferenceDataCache(loader, 0.1)
+    cache.snapshot(None)
+    time.sleep(0.1)
+
+    # 만료 후 동시에 조회해도 한 요청만 다시 읽고 나머지는 이전 snapshot 을 사용한다.
+    versions = []
+    threads = [threading.Thread(target = lambda: versions.append(cache.snapshot(None)[0])) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 2
+    assert sorted(versions) == [1] * 7 + [2]
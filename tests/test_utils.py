@@ -0,0 +1,87 @@
+import io
+import base64
+import json
+
+import pytest
+from sqlalchemy     import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from utils import decode_cursor, encode_cursor, invalidate_seller_principal, read_import_rows, seller_principal_cache, validate_product_info
+
+def raw_cursor(value):
+    return base64.urlsafe_b64encode(json.dumps(value).encode('utf-8')).decode('utf-8')
+
+def test_decode_cursor_round_trip():
+    assert decode_cursor(encode_cursor('2020-10-01 12:30:15', 10)) == ['2020-10-01 12:30:15', 10]
+    assert decode_cursor(encode_cursor(None, 10)) == [None, 10]
+
+@pytest.mark.parametrize('value', [
+    {},
+    [1],
+    'x',
+    [1, 2, 3],
+    ['2020-10-01 12:30:15', '10'],
+    ['2020-10-01 12:30:15', True],
+    ['2020-10-01 12:30:15', 1.5],
+    [{'a': 1}, 10],
+    [[1], 10]
+])
+def test_decode_cursor_rejects_wrong_shape(value):
+    with pytest.raises(ValueError):
+        decode_cursor(raw_cursor(value))
+
+def test_decode_cursor_rejects_invalid_base64():
+    with pytest.raises(ValueError):
+        decode_cursor('not a cursor')
+
+def test_seller_principal_is_invalidated_after_commit():
+    session = sessionmaker(bind = create_engine('sqlite://'))()
+    seller_principal_cache.set(1, {'is_admin': 0, 'is_deleted': 0, 'manager_id': 1})
+
+    # commit 전에는 다른 요청이 이전 셀러 정보를 다시 캐시하지 않도록 그대로 둔다.
+    invalidate_seller_principal(1, session)
+    session.execute("SELECT 1")
+    assert seller_principal_cache.get(1) is not None
+
+    session.commit()
+    assert seller_principal_cache.get(1) is None
+
+def test_read_import_rows_reports_file_line_after_blank_line():
+    stream = io.BytesIO('name,price\n상품1,10000\n\n상품2,20000\n'.encode('utf-8'))
+
+    assert [(line, row['name']) for line, row in read_import_rows(stream, 'csv')] == [(2, '상품1'), (4, '상품2')]
+
+def test_read_import_rows_reports_sheet_row_after_blank_row():
+    openpyxl = pytest.importorskip('openpyxl')
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['name', 'price'])
+    sheet.append(['상품1', 10000])
+    sheet.append([])
+    sheet.append(['상품2', 20000])
+
+    stream = io.BytesIO()
+    workbook.save(stream)
+    stream.seek(0)
+
+    assert [(line, row['name']) for line, row in read_import_rows(stream, 'xlsx')] == [(2, '상품1'), (4, '상품2')]
+
+@pytest.mark.parametrize('discount_rate, message', [
+    (0, None),
+    (99, None),
+    (100, 'DISCOUNT_RANGE_CAN_BE_SET_FROM_0_TO_99'),
+    (-1, 'DISCOUNT_RANGE_CAN_BE_SET_FROM_0_TO_99')
+])
+def test_validate_product_info_discount_rate(discount_rate, message):
+    product_info = {
+        'name'                : '테스트 상품',
+        'discount_start_date' : None,
+        'discount_end_date'   : None,
+        'min_unit'            : 1,
+        'max_unit'            : 10,
+        'price'               : 10000,
+        'discount_rate'       : discount_rate
+    }
+
+    assert validate_product_info(product_info) == message
@@ -1,47 +1,121 @@
-import jwt, re
-from flask import request, g, jsonify
+import jwt, re, json, base64, binascii, threading, time, io, csv, datetime, hashlib
+from collections import OrderedDict
+from flask import request, g, jsonify, Response
+from sqlalchemy import event
 from config import SECRET, get_s3_resource
 
+class TTLCache:
+    """
+    크기 제한이 있는 프로세스 내 TTL/LRU 캐시
+        maxsize 를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+        ttl(초)이 지난 항목은 조회 시 만료 처리합니다.
+        여러 요청 스레드에서 동시에 접근하므로 lock 으로 보호합니다.
+
+    Authors:
+        hj885353@gmail.com (김해준)
+
+    History:
+        2026-10-18 (hj885353@gmail.com) : 초기 생성
+    """
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._items[key]
+                return None
+
+            # 최근 사용한 항목을 맨 뒤로 이동
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, value)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+# 로그인한 셀러 정보 캐시 : seller_no -> {is_admin, is_deleted, manager_id}
+# 셀러 정보가 수정되면 SellerDao 에서 invalidate_seller_principal 로 commit 이후에 삭제하도록 등록한다.
+# 프로세스마다 캐시가 따로 있으므로 다른 프로세스의 캐시는 ttl 이 지나야 갱신된다.
+SELLER_PRINCIPAL_CACHE_SIZE = 1024
+SELLER_PRINCIPAL_CACHE_TTL = 60
+seller_principal_cache = TTLCache(SELLER_PRINCIPAL_CACHE_SIZE, SELLER_PRINCIPAL_CACHE_TTL)
+
+def get_seller_principal(seller_no, Session):
+    # 캐시에 없는 경우에만 DB 에서 셀러 정보를 조회한다.
+    seller = seller_principal_cache.get(seller_no)
+    if seller:
+        return seller
+
+    # 요청 단위 session 이므로 endpoint 와 같은 connection 을 사용하고, 요청이 끝나면 teardown 에서 반납된다.
+    session = Session()
+    get_seller_info_stmt = ("""
+        SELECT 
+            s.is_admin,
+            s.is_deleted,
+            si.manager_id
+        FROM 
+            sellers as s
+        INNER JOIN seller_info_current as si ON si.seller_id = s.id
+        WHERE s.id = :seller_no
+    """)
+    row = session.execute(get_seller_info_stmt, {'seller_no' : seller_no}).fetchone()
+
+    # 존재하지 않는 셀러는 캐시하지 않는다.
+    if row is None:
+        return None
+
+    seller = dict(row)
+    seller_principal_cache.set(seller_no, seller)
+    return seller
+
+def invalidate_seller_principal(seller_no, session):
+    # commit 전에 지우면 다른 요청이 commit 전의 셀러 정보를 다시 캐시하므로 session 이 commit 된 뒤에 지운다.
+    event.listen(session, 'after_commit', lambda committed_session: seller_principal_cache.invalidate(seller_no), once = True)
+
 def login_required(Session):
     def inner_function(func):
         def wrapper(*args, **kwargs):
             access_token = request.headers.get('Authorization', None)
-            session = Session()
-            
+
             if access_token:
                 try:
                     payload = jwt.decode(access_token, SECRET['SECRET_KEY'], SECRET['ALGORITHMS'])
                     seller_no = payload['seller_no']
-
-                    if session:
-                        get_seller_info_stmt = ("""
-                            SELECT 
-                                s.id,
-                                s.is_admin,
-                                s.is_deleted,
-                                si.manager_id
-                            FROM 
-                                sellers as s
-                            INNER JOIN seller_info as si ON si.seller_id = s.id
-                            WHERE s.id = :seller_no
-                        """)
-                        seller = dict(session.execute(get_seller_info_stmt, {'seller_no' : seller_no}).fetchone())
-                        if seller:
-                            if seller['is_deleted'] == 0:
-                                g.seller_info = {
-                                    'seller_no': seller_no,
-                                    'is_admin': seller['is_admin'],
-                                    'manager_id' : seller['manager_id']
-                                }
-                                session.close()
-                                return func(*args, **kwargs)
-                            return jsonify({'message': 'DELETED_ACCOUNT'}), 400
-                        return jsonify({'message': 'ACCOUNT_DOES_NOT_EXIST'}), 404
-
-                except jwt.InvalidTokenError:
+                except (jwt.InvalidTokenError, KeyError):
                     return jsonify({'message': 'INVALID_TOKEN'}), 401
 
-                return jsonify({'message': 'NO_DATABASE_CONNECTION'}), 400
+                seller = get_seller_principal(seller_no, Session)
+                if seller:
+                    if seller['is_deleted'] == 0:
+                        g.seller_info = {
+                            'seller_no': seller_no,
+                            'is_admin': seller['is_admin'],
+                            'manager_id' : seller['manager_id']
+                        }
+                        return func(*args, **kwargs)
+                    return jsonify({'message': 'DELETED_ACCOUNT'}), 400
+                return jsonify({'message': 'ACCOUNT_DOES_NOT_EXIST'}), 404
             return jsonify({'message': 'INVALID_TOKEN'}), 401
         return wrapper
     return inner_function
@@ -53,6 +127,13 @@ def allowed_file(filename):
     if '.' in filename and filename.rsplit('.', 1)[1] not in ALLOWED_EXTENSIONS:
         return jsonify({'message': 'INVALID_EXTENSION'}), 400
 
+# s3 이미지 url 에서 파일 이름(key)을 가져오기 위한 정규표현식
+S3_IMAGE_URL_PATTERN = re.compile(r'https:\/\/brandi-images\.s3\.ap-northeast-2\.amazonaws\.com\/(.*)')
+
+# 이미지 url 에서 s3 key 를 가져오는 메소드
+def get_image_key(image_url):
+    return S3_IMAGE_URL_PATTERN.match(image_url).group(1)
+
 # 에러 발생 시 S3 서버에 업로드된 이미지를 삭제하는 메소드
 def delete_image_in_s3(images, new_images):
     s3_resource = get_s3_resource()
@@ -60,11 +141,170 @@ def delete_image_in_s3(images, new_images):
     if new_images:
         for new_image in new_images:
             if new_image not in images:
-                # 이미지 url 에서 파일 이름을 가져온다.
-                file_name = re.findall('https:\/\/brandi-images\.s3\.ap-northeast-2\.amazonaws\.com\/(.*)', new_image)
-                s3_resource.delete_object(Bucket='brandi-images', Key=f'{file_name[0]}')
+                s3_resource.delete_object(Bucket='brandi-images', Key=get_image_key(new_image))
     else:
         for image in images:
-            # 이미지 url 에서 파일 이름을 가져온다.
-            file_name = re.findall('https:\/\/brandi-images\.s3\.ap-northeast-2\.amazonaws\.com\/(.*)', image)
-            s3_resource.delete_object(Bucket='brandi-images', Key=f'{file_name[0]}')
\ No newline at end of file
+            s3_resource.delete_object(Bucket='brandi-images', Key=get_image_key(image))
+
+# 커서 기반 페이지네이션에서 사용하는 커서 생성 메소드
+# 정렬 기준값들을 JSON 으로 직렬화한 뒤 base64 로 인코딩하여 클라이언트에게는 불투명한 문자열로 전달한다.
+def encode_cursor(*values):
+    payload = json.dumps(values, default=str)
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('utf-8')
+
+# 클라이언트가 전달한 커서를 [정렬값, id] 리스트로 복원하는 메소드
+# 정렬값은 문자열, 숫자 또는 null, id 는 정수여야 하며 형식이 다르면 ValueError 가 발생한다.
+def decode_cursor(cursor):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('utf-8')).decode('utf-8'))
+    except (ValueError, binascii.Error):
+        raise ValueError('INVALID_CURSOR')
+
+    if (
+        not isinstance(values, list)
+        or len(values) != 2
+        or isinstance(values[0], (bool, list, dict))
+        or isinstance(values[1], bool)
+        or not isinstance(values[1], int)
+    ):
+        raise ValueError('INVALID_CURSOR')
+
+    return values
+
+# 파일 다운로드 시 날짜 컬럼 출력 형식
+EXPORT_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 다운로드 파일에 쓸 값으로 변환하는 메소드. 날짜는 문자열로, NULL 은 빈 값으로 변환한다.
+def format_export_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.strftime(EXPORT_DATETIME_FORMAT)
+    return value
+
+# CSV 파일을 한 줄씩 만들어 전달하는 generator
+# 전체 파일을 메모리에 올리지 않고 일정 크기가 모일 때마다 응답으로 흘려보낸다.
+# columns : [(헤더명, row key), ...]
+EXPORT_STREAM_CHUNK_SIZE = 64 * 1024
+
+def generate_csv(columns, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 을 먼저 보낸다.
+    buffer.write('\ufeff')
+    writer.writerow([header for header, _ in columns])
+
+    for row in rows:
+        writer.writerow([format_export_value(row[key]) for _, key in columns])
+
+        if buffer.tell() >= EXPORT_STREAM_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    yield buffer.getvalue()
+
+# NDJSON 변환 시 json 모듈이 처리하지 못하는 값(날짜, Decimal 등)을 문자열로 변환한다.
+def export_json_default(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.strftime(EXPORT_DATETIME_FORMAT)
+    return str(value)
+
+# NDJSON(한 줄에 JSON 하나) 파일을 한 줄씩 만들어 전달하는 generator
+# columns : [(헤더명, row key), ...] 중 row key 를 JSON key 로 사용한다.
+def generate_ndjson(columns, rows):
+    chunk = []
+    chunk_size = 0
+
+    for row in rows:
+        line = json.dumps({key: row[key] for _, key in columns}, ensure_ascii=False, default=export_json_default) + '\n'
+        chunk.append(line)
+        chunk_size += len(line)
+
+        if chunk_size >= EXPORT_STREAM_CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+            chunk_size = 0
+
+    yield ''.join(chunk)
+
+# 리소스 version 으로 strong ETag 값을 만드는 메소드 (따옴표 제외)
+def make_etag(*version):
+    return hashlib.sha1(json.dumps(version, default=str).encode('utf-8')).hexdigest()
+
+# 요청의 If-None-Match 가 etag 와 일치하면 body 없이 보낼 304 응답, 일치하지 않으면 None
+def not_modified_response(etag):
+    if not request.if_none_match.contains(etag):
+        return None
+
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+# 상품 등록 제한 사항
+PRODUCT_NAME_FORBIDDEN_PATTERN = re.compile('[\"\']')
+PRODUCT_MAX_UNIT = 20
+PRODUCT_MIN_PRICE = 10
+PRODUCT_DISCOUNT_RATE_RANGE = range(0, 100)
+
+# 상품 정보가 등록 제한 사항을 지키는지 확인하는 메소드. 상품 등록 API 와 상품 일괄 등록에서 함께 사용한다.
+# 문제가 없으면 None, 있으면 에러 메세지를 반환한다. 필수 값이 없으면 KeyError, 숫자가 아니면 ValueError 가 발생한다.
+def validate_product_info(product_info):
+    # 상품명에 ' 또는 " 포함 되었는지 체크
+    if PRODUCT_NAME_FORBIDDEN_PATTERN.search(product_info['name']):
+        return 'NAME_CANNOT_CONTAIN_QUOTATION_MARK'
+
+    # 할인 시작일이 할인 종료일보다 빠를 경우. 할인 기간이 없으면 확인하지 않는다.
+    discount_start_date, discount_end_date = product_info['discount_start_date'], product_info['discount_end_date']
+    if discount_start_date and discount_end_date and discount_start_date > discount_end_date:
+        return 'START_DATE_CANNOT_BE_EARLIER_THAN_END_DATE'
+
+    # 최소 수량 또는 최대 수량이 20을 초과할 경우
+    if int(product_info['min_unit']) > PRODUCT_MAX_UNIT or int(product_info['max_unit']) > PRODUCT_MAX_UNIT:
+        return 'CANNOT_SET_MORE_THAN_20'
+
+    # 판매가가 10원 미만일 경우
+    if int(product_info['price']) < PRODUCT_MIN_PRICE:
+        return 'CANNOT_SET_LESS_THAN_10'
+
+    # 할인률이 0 ~ 99% 가 아닐 경우
+    if int(product_info['discount_rate']) not in PRODUCT_DISCOUNT_RATE_RANGE:
+        return 'DISCOUNT_RANGE_CAN_BE_SET_FROM_0_TO_99'
+
+    return None
+
+# 업로드 된 CSV / XLSX 파일을 한 줄씩 읽어 (파일의 줄 번호, {헤더명: 값} dict) 로 전달하는 generator
+# 전체 파일을 메모리에 올리지 않고 읽는다. stream 은 binary 파일 객체이다.
+# 비어있는 줄은 건너뛰므로 에러 위치를 알려줄 수 있도록 실제 줄 번호를 함께 전달한다.
+def read_import_rows(stream, file_format):
+    if file_format == 'csv':
+        # 엑셀에서 저장한 UTF-8 BOM 은 제거한다.
+        reader = csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8-sig'))
+        for row in reader:
+            # line_num 은 지금까지 읽은 줄 수이므로 row 가 끝나는 줄 번호이다.
+            yield reader.line_num, row
+        return
+
+    if file_format == 'xlsx':
+        try:
+            import openpyxl
+        except ImportError:
+            raise ValueError('XLSX_NOT_SUPPORTED')
+
+        workbook = openpyxl.load_workbook(stream, read_only=True, data_only=True)
+        try:
+            # 1 번째 줄부터 비어있는 줄도 빠짐없이 읽으므로 순서가 곧 시트의 줄 번호이다.
+            rows = workbook.active.iter_rows(values_only=True)
+            headers = [str(header).strip() if header is not None else '' for header in next(rows, ())]
+
+            for line, row in enumerate(rows, start=2):
+                # 비어있는 줄은 건너뛴다.
+                if all(value is None for value in row):
+                    continue
+                yield line, {header: ('' if value is None else value) for header, value in zip(headers, row)}
+        finally:
+            workbook.close()
+        return
+
+    raise ValueError('INVALID_FILE_FORMAT')